@@ -6,15 +6,48 @@ Classes package initialization
 __version__ = "3.0.0"
 __author__ = "IEEE Reference Extractor Team"
 
-from .config import ConfigManager, AppConfig
-from .database import DatabaseManager, Reference
-from .logger import LoggerManager, PerformanceLogger
-from .pdf_processor import PDFProcessor, TextBlock, PDFMetadata
-from .reference_parser import ReferenceParser, ParsedReference
-from .api_client import CrossRefClient, DOIClient, MetadataEnricher
-from .exporter import ExportManager, BibTeXExporter, RISExporter, JSONExporter, CSVExporter
-from .worker import WorkerManager, ExtractionWorker
-from .gui import MainWindow
+import importlib
+
+# Public names are resolved on first access (PEP 562) so that importing one
+# component does not pull in Qt, PyMuPDF and requests for all the others.
+_LAZY_IMPORTS = {
+    'ConfigManager': '.config',
+    'AppConfig': '.config',
+    'DatabaseManager': '.database',
+    'Reference': '.database',
+    'LoggerManager': '.logger',
+    'PerformanceLogger': '.logger',
+    'PDFProcessor': '.pdf_processor',
+    'TextBlock': '.pdf_processor',
+    'PDFMetadata': '.pdf_processor',
+    'ReferenceParser': '.reference_parser',
+    'ParsedReference': '.reference_parser',
+    'CrossRefClient': '.api_client',
+    'DOIClient': '.api_client',
+    'MetadataEnricher': '.api_client',
+    'ExportManager': '.exporter',
+    'BibTeXExporter': '.exporter',
+    'RISExporter': '.exporter',
+    'JSONExporter': '.exporter',
+    'CSVExporter': '.exporter',
+    'WorkerManager': '.worker',
+    'ExtractionWorker': '.worker',
+    'MainWindow': '.gui',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     # Config
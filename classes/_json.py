@@ -0,0 +1,35 @@
+"""
+JSON helpers
+Uses orjson when installed, falling back to the standard library
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Deserialize JSON from bytes or str"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        JSON bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
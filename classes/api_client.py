@@ -4,11 +4,110 @@ Enterprise-level API clients for CrossRef, DOI, and metadata enrichment
 """
 
 import logging
+import re
+import threading
 import time
+import itertools
 import requests
-from typing import Optional, Dict, Any, List
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, Dict, Any, List, Callable, Iterator
 from dataclasses import dataclass
 import urllib.parse
+from collections import OrderedDict, deque
+from datetime import timedelta
+from pathlib import Path
+from . import _json
+
+try:
+    import requests_cache
+except ImportError:  # optional dependency
+    requests_cache = None
+
+try:
+    import ijson
+except ImportError:  # optional dependency
+    ijson = None
+
+logger = logging.getLogger(__name__)
+
+# Fields that make a reference complete enough to skip enrichment
+_REQUIRED_FIELDS = ('title', 'authors', 'year', 'journal', 'doi')
+
+# Resolver/URI prefixes stripped from DOIs (checked after lowercasing)
+_DOI_PREFIXES = ('https://doi.org/', 'http://doi.org/', 'https://dx.doi.org/', 'http://dx.doi.org/', 'doi:')
+
+# Precompiled patterns used by the normalizers below
+_DOI_RE = re.compile(r'10\.\d{4,9}/[^\s"<>]+')
+_ISSN_SPLIT = re.compile(r'[,\s;]+')
+
+
+def _normalize_doi(doi: str) -> str:
+    """
+    Normalize a DOI so that lookups and cache keys collapse variants
+
+    DOIs are case-insensitive, so the canonical form is lowercase with
+    any resolver prefix removed.
+    """
+    doi = doi.strip().lower()
+    for prefix in _DOI_PREFIXES:
+        if doi.startswith(prefix):
+            return doi[len(prefix):].strip()
+
+    # Any other URL form (publisher landing pages, www.doi.org, ...)
+    if not doi.startswith('10.'):
+        match = _DOI_RE.search(doi)
+        if match:
+            return match.group(0)
+    return doi
+
+
+def _is_complete(ref_data: Dict[str, Any]) -> bool:
+    """True if every _REQUIRED_FIELDS value is filled in"""
+    return all(ref_data.get(f) for f in _REQUIRED_FIELDS)
+
+
+def _create_session(cache_dir: Optional[str] = None) -> requests.Session:
+    """
+    Create an HTTP session with pooled keep-alive connections
+
+    Transient failures (429 and 5xx) are retried with exponential backoff,
+    honouring any Retry-After header sent by the server. When requests-cache
+    is installed and a cache directory is given, successful responses are
+    cached on disk for 30 days so repeat runs do not re-hit the APIs.
+    """
+    if cache_dir and requests_cache is not None:
+        Path(cache_dir).mkdir(parents=True, exist_ok=True)
+        session = requests_cache.CachedSession(
+            cache_name=str(Path(cache_dir) / 'http_cache'),
+            backend='sqlite',
+            expire_after=timedelta(days=30),
+            allowable_codes=(200,),
+            cache_control=True,
+            match_headers=['Accept', 'User-Agent']
+        )
+    else:
+        session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=['GET'],
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def _format_issn(value: Any) -> str:
+    """Normalize ISSN metadata (list or string) to a comma-separated string"""
+    if isinstance(value, str):
+        value = _ISSN_SPLIT.split(value)
+    return ', '.join(dict.fromkeys(v.strip() for v in value if v and v.strip()))
 
 
 @dataclass
@@ -28,21 +127,31 @@ class RateLimiter:
     def __init__(self, max_calls: int = 5, period: float = 1.0):
         self.max_calls = max_calls
         self.period = period
-        self.calls = []
+        self.calls: deque = deque()  # monotonic timestamps, oldest first
+        self._lock = threading.Lock()
 
     def wait_if_needed(self):
-        """Wait if rate limit would be exceeded"""
-        now = time.time()
+        """Wait if rate limit would be exceeded (thread-safe)"""
+        with self._lock:
+            now = time.monotonic()
+
+            # Drop calls that have aged out of the window
+            while self.calls and now - self.calls[0] >= self.period:
+                self.calls.popleft()
 
-        # Remove old calls outside the period
-        self.calls = [c for c in self.calls if now - c < self.period]
+            if len(self.calls) >= self.max_calls:
+                sleep_time = self.period - (now - self.calls[0])
+                if sleep_time > 0:
+                    time.sleep(sleep_time)
+                self.calls.popleft()
 
-        if len(self.calls) >= self.max_calls:
-            sleep_time = self.period - (now - self.calls[0])
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+            self.calls.append(time.monotonic())
 
-        self.calls.append(time.time())
+    def configure(self, max_calls: int, period: float):
+        """Atomically change the allowed call rate"""
+        with self._lock:
+            self.max_calls = max_calls
+            self.period = period
 
 
 class CrossRefClient:
@@ -52,16 +161,66 @@ class CrossRefClient:
     """
 
     BASE_URL = "https://api.crossref.org/works"
-
-    def __init__(self, rate_limit: int = 5, timeout: int = 10):
-        self.logger = logging.getLogger(__name__)
+    MAILTO = "research@example.com"  # default contact for CrossRef's polite pool
+    BATCH_SIZE = 20  # DOIs per filter query (keeps URLs well under length limits)
+    STREAM_THRESHOLD = 50  # searches with more rows than this are stream-parsed
+    # Projection for list queries: only the fields _item_to_dict reads
+    SELECT_FIELDS = ('DOI,title,author,issued,published-print,published-online,'
+                     'container-title,volume,issue,page,URL,publisher,ISSN,type')
+
+    def __init__(self, rate_limit: int = 5, timeout: int = 10, cache_dir: Optional[str] = None,
+                 mailto: str = ""):
+        self.logger = logger
         self.timeout = timeout
+        self.mailto = mailto or self.MAILTO
         self.rate_limiter = RateLimiter(max_calls=rate_limit, period=1.0)
-        self.session = requests.Session()
+        self.session = _create_session(cache_dir)
         self.session.headers.update({
-            'User-Agent': 'IEEE-Reference-Extractor/3.0 (mailto:research@example.com)'
+            'User-Agent': f'IEEE-Reference-Extractor/3.0 (mailto:{self.mailto})'
         })
 
+    def _get(self, url: str, params: Optional[Dict[str, Any]] = None,
+             stream: bool = False) -> requests.Response:
+        """
+        Rate-limited GET shared by all CrossRef calls
+
+        Adds the polite-pool mailto and retunes the rate limiter from
+        CrossRef's X-Rate-Limit-* headers. A 429 is retried by the session's
+        adapter, which honours Retry-After.
+
+        Args:
+            url: Request URL
+            params: Query parameters
+            stream: Leave the body unread for incremental parsing
+
+        Returns:
+            Response object
+        """
+        params = {**(params or {}), 'mailto': self.mailto}
+
+        self.rate_limiter.wait_if_needed()
+        response = self.session.get(url, params=params, timeout=self.timeout, stream=stream)
+        self._update_rate_limit(response)
+        return response
+
+    def _update_rate_limit(self, response: requests.Response):
+        """Apply X-Rate-Limit-Limit / X-Rate-Limit-Interval (e.g. "50", "1s")"""
+        limit = response.headers.get('X-Rate-Limit-Limit')
+        interval = response.headers.get('X-Rate-Limit-Interval')
+        if not limit or not interval:
+            return
+
+        try:
+            max_calls = int(limit)
+            period = float(interval.strip().rstrip('s'))
+        except ValueError:
+            return
+
+        if max_calls > 0 and period > 0 and (max_calls, period) != (
+                self.rate_limiter.max_calls, self.rate_limiter.period):
+            self.rate_limiter.configure(max_calls, period)
+            logger.debug("CrossRef rate limit set to %s per %ss", max_calls, period)
+
     def lookup_by_doi(self, doi: str) -> APIResult:
         """
         Look up reference by DOI
@@ -72,39 +231,25 @@ class CrossRefClient:
         Returns:
             APIResult object
         """
+        doi = _normalize_doi(doi)
         try:
-            self.rate_limiter.wait_if_needed()
-
-            url = f"{self.BASE_URL}/{doi}"
-            response = self.session.get(url, timeout=self.timeout)
+            response = self._get(f"{self.BASE_URL}/{doi}")
 
             if response.status_code == 200:
-                data = response.json()
+                data = _json.loads(response.content)
                 message = data.get('message', {})
 
-                result = {
-                    'title': self._extract_title(message),
-                    'authors': self._extract_authors(message),
-                    'year': self._extract_year(message),
-                    'journal': message.get('container-title', [''])[0],
-                    'volume': message.get('volume', ''),
-                    'issue': message.get('issue', ''),
-                    'pages': message.get('page', ''),
-                    'doi': doi,
-                    'url': message.get('URL', ''),
-                    'publisher': message.get('publisher', ''),
-                    'issn': ', '.join(message.get('ISSN', [])),
-                    'type': message.get('type', 'article')
-                }
+                result = self._item_to_dict(message)
+                result['doi'] = doi
 
-                self.logger.info(f"CrossRef lookup successful for DOI: {doi}")
+                logger.info("CrossRef lookup successful for DOI: %s", doi)
                 return APIResult(success=True, data=result, source='crossref')
             else:
-                self.logger.warning(f"CrossRef lookup failed: {response.status_code}")
+                logger.warning("CrossRef lookup failed: %s", response.status_code)
                 return APIResult(success=False, data={}, error=f"Status {response.status_code}", source='crossref')
 
         except Exception as e:
-            self.logger.error(f"CrossRef lookup error: {e}")
+            logger.error("CrossRef lookup error: %s", e)
             return APIResult(success=False, data={}, error=str(e), source='crossref')
 
     def search_by_title(self, title: str, limit: int = 5) -> List[APIResult]:
@@ -118,47 +263,117 @@ class CrossRefClient:
         Returns:
             List of APIResult objects
         """
-        try:
-            self.rate_limiter.wait_if_needed()
+        results = list(self.iter_search_by_title(title, limit))
+        logger.info("CrossRef search found %s results for: %s", len(results), title)
+        return results
 
-            params = {
-                'query.title': title,
-                'rows': limit
-            }
+    def iter_search_by_title(self, title: str, limit: int = 5) -> Iterator[APIResult]:
+        """
+        Search for references by title, yielding results lazily
 
-            response = self.session.get(self.BASE_URL, params=params, timeout=self.timeout)
+        APIResult objects are only built for the items the caller consumes,
+        so ``next(...)`` on the iterator does the minimum work for a best match.
 
-            if response.status_code == 200:
-                data = response.json()
-                items = data.get('message', {}).get('items', [])
+        Args:
+            title: Title to search
+            limit: Maximum results
 
-                results = []
-                for item in items:
-                    result = {
-                        'title': self._extract_title(item),
-                        'authors': self._extract_authors(item),
-                        'year': self._extract_year(item),
-                        'journal': item.get('container-title', [''])[0],
-                        'volume': item.get('volume', ''),
-                        'issue': item.get('issue', ''),
-                        'pages': item.get('page', ''),
-                        'doi': item.get('DOI', ''),
-                        'url': item.get('URL', ''),
-                        'publisher': item.get('publisher', ''),
-                        'issn': ', '.join(item.get('ISSN', [])),
-                        'type': item.get('type', 'article')
-                    }
-                    results.append(APIResult(success=True, data=result, source='crossref'))
-
-                self.logger.info(f"CrossRef search found {len(results)} results for: {title}")
-                return results
+        Yields:
+            APIResult objects, best match first
+        """
+        params = {
+            'query.title': title,
+            'rows': limit,
+            'select': self.SELECT_FIELDS
+        }
+        streaming = limit > self.STREAM_THRESHOLD and ijson is not None
+
+        try:
+            response = self._get(self.BASE_URL, params, stream=streaming)
+        except Exception as e:
+            logger.error("CrossRef search error: %s", e)
+            return
+
+        try:
+            if response.status_code != 200:
+                logger.warning("CrossRef search failed: %s", response.status_code)
+                return
+
+            if streaming:
+                # Parse items incrementally from the socket
+                response.raw.decode_content = True  # transparently gunzip
+                items = ijson.items(response.raw, 'message.items.item')
             else:
-                self.logger.warning(f"CrossRef search failed: {response.status_code}")
-                return []
+                items = _json.loads(response.content).get('message', {}).get('items', [])
+
+            for item in itertools.islice(items, limit):
+                yield APIResult(success=True, data=self._item_to_dict(item), source='crossref')
 
         except Exception as e:
-            self.logger.error(f"CrossRef search error: {e}")
-            return []
+            logger.error("CrossRef search error: %s", e)
+        finally:
+            response.close()
+
+    def lookup_dois_batch(self, dois: List[str]) -> Dict[str, APIResult]:
+        """
+        Look up many DOIs with as few requests as possible
+
+        Uses the CrossRef ``filter=doi:...`` query so that up to
+        BATCH_SIZE DOIs are resolved per round-trip.
+
+        Args:
+            dois: DOI strings (any common prefix/casing)
+
+        Returns:
+            Dict mapping normalized DOI to APIResult (misses are omitted)
+        """
+        normalized = list(dict.fromkeys(_normalize_doi(d) for d in dois if d))
+        results: Dict[str, APIResult] = {}
+
+        for start in range(0, len(normalized), self.BATCH_SIZE):
+            chunk = normalized[start:start + self.BATCH_SIZE]
+            try:
+                params = {
+                    'filter': ','.join(f'doi:{d}' for d in chunk),
+                    'rows': len(chunk),
+                    'select': self.SELECT_FIELDS
+                }
+                response = self._get(self.BASE_URL, params)
+
+                if response.status_code != 200:
+                    logger.warning("CrossRef batch lookup failed: %s", response.status_code)
+                    continue
+
+                items = _json.loads(response.content).get('message', {}).get('items', [])
+                for item in items:
+                    doi = _normalize_doi(item.get('DOI', ''))
+                    if doi in chunk:
+                        result = self._item_to_dict(item)
+                        result['doi'] = doi
+                        results[doi] = APIResult(success=True, data=result, source='crossref')
+
+            except Exception as e:
+                logger.error("CrossRef batch lookup error: %s", e)
+
+        logger.info("CrossRef batch lookup resolved %s/%s DOIs", len(results), len(normalized))
+        return results
+
+    def _item_to_dict(self, item: Dict) -> Dict[str, Any]:
+        """Convert a CrossRef work item to reference metadata"""
+        return {
+            'title': self._extract_title(item),
+            'authors': self._extract_authors(item),
+            'year': self._extract_year(item),
+            'journal': item.get('container-title', [''])[0],
+            'volume': item.get('volume', ''),
+            'issue': item.get('issue', ''),
+            'pages': item.get('page', ''),
+            'doi': item.get('DOI', ''),
+            'url': item.get('URL', ''),
+            'publisher': item.get('publisher', ''),
+            'issn': _format_issn(item.get('ISSN', [])),
+            'type': item.get('type', 'article')
+        }
 
     def _extract_title(self, item: Dict) -> str:
         """Extract title from CrossRef item"""
@@ -194,10 +409,10 @@ class DOIClient:
 
     BASE_URL = "https://doi.org"
 
-    def __init__(self, timeout: int = 10):
-        self.logger = logging.getLogger(__name__)
+    def __init__(self, timeout: int = 10, cache_dir: Optional[str] = None):
+        self.logger = logger
         self.timeout = timeout
-        self.session = requests.Session()
+        self.session = _create_session(cache_dir)
 
     def resolve_doi(self, doi: str) -> APIResult:
         """
@@ -209,6 +424,7 @@ class DOIClient:
         Returns:
             APIResult object
         """
+        doi = _normalize_doi(doi)
         try:
             url = f"{self.BASE_URL}/{doi}"
             headers = {'Accept': 'application/vnd.citationstyles.csl+json'}
@@ -216,7 +432,7 @@ class DOIClient:
             response = self.session.get(url, headers=headers, timeout=self.timeout)
 
             if response.status_code == 200:
-                data = response.json()
+                data = _json.loads(response.content)
 
                 result = {
                     'title': data.get('title', ''),
@@ -229,18 +445,18 @@ class DOIClient:
                     'doi': doi,
                     'url': data.get('URL', ''),
                     'publisher': data.get('publisher', ''),
-                    'issn': data.get('ISSN', ''),
+                    'issn': _format_issn(data.get('ISSN', [])),
                     'type': data.get('type', 'article')
                 }
 
-                self.logger.info(f"DOI resolution successful: {doi}")
+                logger.info("DOI resolution successful: %s", doi)
                 return APIResult(success=True, data=result, source='doi.org')
             else:
-                self.logger.warning(f"DOI resolution failed: {response.status_code}")
+                logger.warning("DOI resolution failed: %s", response.status_code)
                 return APIResult(success=False, data={}, error=f"Status {response.status_code}", source='doi.org')
 
         except Exception as e:
-            self.logger.error(f"DOI resolution error: {e}")
+            logger.error("DOI resolution error: %s", e)
             return APIResult(success=False, data={}, error=str(e), source='doi.org')
 
     def _extract_authors(self, data: Dict) -> List[str]:
@@ -269,10 +485,52 @@ class MetadataEnricher:
     Enriches reference metadata using multiple API sources
     """
 
-    def __init__(self, enable_crossref: bool = True, enable_doi: bool = True):
-        self.logger = logging.getLogger(__name__)
-        self.crossref = CrossRefClient() if enable_crossref else None
-        self.doi_client = DOIClient() if enable_doi else None
+    LOOKUP_CACHE_SIZE = 1024
+    LOOKUP_CACHE_TTL = 3600.0  # seconds
+
+    def __init__(self, enable_crossref: bool = True, enable_doi: bool = True, max_workers: int = 4,
+                 cache_dir: Optional[str] = None, crossref_mailto: str = ""):
+        self.logger = logger
+        self.max_workers = max(1, max_workers)
+        self.crossref = (CrossRefClient(cache_dir=cache_dir, mailto=crossref_mailto)
+                         if enable_crossref else None)
+        self.doi_client = DOIClient(cache_dir=cache_dir) if enable_doi else None
+
+        # In-memory LRU of successful DOI lookups: (source, doi) -> (timestamp, result)
+        self._lookup_cache: "OrderedDict[tuple[str, str], tuple[float, APIResult]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def _cached_lookup(self, source: str, doi: str, lookup: Callable[[str], APIResult]) -> APIResult:
+        """
+        Run a DOI lookup through the in-memory TTL/LRU cache
+
+        Args:
+            source: Cache namespace (one per API)
+            doi: DOI string
+            lookup: Function performing the actual lookup
+
+        Returns:
+            APIResult object
+        """
+        key = (source, _normalize_doi(doi))
+        now = time.monotonic()
+
+        with self._cache_lock:
+            entry = self._lookup_cache.get(key)
+            if entry and now - entry[0] < self.LOOKUP_CACHE_TTL:
+                self._lookup_cache.move_to_end(key)
+                return entry[1]
+
+        result = lookup(doi)
+
+        if result.success:
+            with self._cache_lock:
+                self._lookup_cache[key] = (now, result)
+                self._lookup_cache.move_to_end(key)
+                while len(self._lookup_cache) > self.LOOKUP_CACHE_SIZE:
+                    self._lookup_cache.popitem(last=False)
+
+        return result
 
     def enrich_reference(self, ref_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -286,10 +544,14 @@ class MetadataEnricher:
         """
         enriched = ref_data.copy()
 
+        # Already complete - nothing to gain from a network round-trip
+        if _is_complete(ref_data):
+            return enriched
+
         # Try DOI lookup first if DOI is available
         if ref_data.get('doi') and self.doi_client:
-            self.logger.info(f"Enriching via DOI: {ref_data['doi']}")
-            result = self.doi_client.resolve_doi(ref_data['doi'])
+            logger.info("Enriching via DOI: %s", ref_data['doi'])
+            result = self._cached_lookup('doi.org', ref_data['doi'], self.doi_client.resolve_doi)
             if result.success:
                 enriched = self._merge_metadata(enriched, result.data)
                 enriched['enriched_by'] = 'doi.org'
@@ -297,7 +559,7 @@ class MetadataEnricher:
 
         # Try CrossRef DOI lookup
         if ref_data.get('doi') and self.crossref:
-            result = self.crossref.lookup_by_doi(ref_data['doi'])
+            result = self._cached_lookup('crossref', ref_data['doi'], self.crossref.lookup_by_doi)
             if result.success:
                 enriched = self._merge_metadata(enriched, result.data)
                 enriched['enriched_by'] = 'crossref'
@@ -305,18 +567,19 @@ class MetadataEnricher:
 
         # Try CrossRef title search
         if ref_data.get('title') and self.crossref:
-            self.logger.info(f"Enriching via title search: {ref_data['title'][:50]}")
-            results = self.crossref.search_by_title(ref_data['title'], limit=3)
-            if results:
+            logger.info("Enriching via title search: %s", ref_data['title'][:50])
+            first = next(self.crossref.iter_search_by_title(ref_data['title'], limit=3), None)
+            if first:
                 # Use the best match (first result)
-                enriched = self._merge_metadata(enriched, results[0].data)
+                enriched = self._merge_metadata(enriched, first.data)
                 enriched['enriched_by'] = 'crossref_search'
                 return enriched
 
-        self.logger.info("No enrichment sources available")
+        logger.info("No enrichment sources available")
         return enriched
 
-    def _merge_metadata(self, original: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    @staticmethod
+    def _merge_metadata(original: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
         """
         Merge metadata, preferring non-empty values from new data
 
@@ -334,8 +597,8 @@ class MetadataEnricher:
                 if key not in merged or not merged[key]:
                     merged[key] = value
                 elif isinstance(value, list) and isinstance(merged[key], list):
-                    # Merge lists
-                    merged[key] = list(set(merged[key] + value))
+                    # Merge lists, keeping first-seen order (first author stays first)
+                    merged[key] = list(dict.fromkeys(merged[key] + value))
 
         return merged
 
@@ -343,18 +606,57 @@ class MetadataEnricher:
         """
         Enrich multiple references
 
+        Unlike enrich_reference, DOIs are resolved against CrossRef first,
+        with batched queries; doi.org is only asked about DOIs CrossRef
+        doesn't return. References that are already complete are copied
+        without any lookup.
+
         Args:
             references: List of reference data
 
         Returns:
             List of enriched references
         """
-        enriched = []
         total = len(references)
+        enriched: List[Optional[Dict[str, Any]]] = [None] * total
 
-        for i, ref in enumerate(references, 1):
-            self.logger.info(f"Enriching reference {i}/{total}")
-            enriched_ref = self.enrich_reference(ref)
-            enriched.append(enriched_ref)
+        pending = []
+        for i, ref in enumerate(references):
+            if _is_complete(ref):
+                enriched[i] = ref.copy()
+            else:
+                pending.append(i)
+
+        # Resolve all known DOIs up front with batched CrossRef queries
+        prefetched: Dict[str, APIResult] = {}
+        if self.crossref:
+            dois = [references[i]['doi'] for i in pending if references[i].get('doi')]
+            if dois:
+                prefetched = self.crossref.lookup_dois_batch(dois)
+
+        # Remaining lookups are I/O-bound; run them concurrently and keep input order
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {
+                pool.submit(self._enrich_with_prefetch, references[i], prefetched): i
+                for i in pending
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                i = futures[future]
+                try:
+                    enriched[i] = future.result()
+                except Exception as e:
+                    logger.warning("Failed to enrich reference %s: %s", i + 1, e)
+                    enriched[i] = references[i].copy()
+                logger.info("Enriched reference %s/%s", done, len(futures))
 
         return enriched
+
+    def _enrich_with_prefetch(self, ref: Dict[str, Any],
+                              prefetched: Dict[str, APIResult]) -> Dict[str, Any]:
+        """Enrich a reference, using a prefetched CrossRef result when available"""
+        result = prefetched.get(_normalize_doi(ref['doi'])) if ref.get('doi') else None
+        if result:
+            enriched = self._merge_metadata(ref.copy(), result.data)
+            enriched['enriched_by'] = 'crossref'
+            return enriched
+        return self.enrich_reference(ref)
@@ -0,0 +1,210 @@
+"""
+Asynchronous API Integration Layer
+High-fanout CrossRef enrichment on a single event loop (requires aiohttp)
+"""
+
+import asyncio
+import logging
+import time
+from typing import Optional, Dict, Any, List
+
+try:
+    import aiohttp
+except ImportError:  # optional dependency
+    aiohttp = None
+
+from .api_client import APIResult, CrossRefClient, MetadataEnricher, _normalize_doi
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncRateLimiter:
+    """
+    Token-bucket rate limiter for coroutines
+    """
+
+    def __init__(self, max_calls: int = 5, period: float = 1.0):
+        self.max_calls = max_calls
+        self.period = period
+        self.tokens = float(max_calls)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available, then consume it"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                rate = self.max_calls / self.period
+                self.tokens = min(self.max_calls, self.tokens + (now - self.updated) * rate)
+                self.updated = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self.tokens) / rate)
+
+
+class AsyncCrossRefClient:
+    """
+    Asynchronous client for CrossRef API
+    Runs many lookups concurrently over one pooled aiohttp session
+    """
+
+    BASE_URL = CrossRefClient.BASE_URL
+
+    # Response parsing is shared with the synchronous client
+    _item_to_dict = CrossRefClient._item_to_dict
+    _extract_title = CrossRefClient._extract_title
+    _extract_authors = CrossRefClient._extract_authors
+    _extract_year = CrossRefClient._extract_year
+
+    def __init__(self, rate_limit: int = 5, timeout: int = 10, max_concurrent: int = 16,
+                 mailto: str = ""):
+        if aiohttp is None:
+            raise ImportError("aiohttp is required for AsyncCrossRefClient (pip install aiohttp)")
+
+        self.logger = logger
+        self.mailto = mailto or CrossRefClient.MAILTO
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.max_concurrent = max_concurrent
+        self.session: Optional["aiohttp.ClientSession"] = None
+        self._rate_limiter: Optional[AsyncRateLimiter] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._rate_limit = rate_limit
+
+    async def __aenter__(self):
+        # Loop-bound primitives are created inside the running loop
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32),
+            headers={'User-Agent': f'IEEE-Reference-Extractor/3.0 (mailto:{self.mailto})'}
+        )
+        self._rate_limiter = AsyncRateLimiter(max_calls=self._rate_limit, period=1.0)
+        self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.session.close()
+        self.session = None
+
+    async def _get_json(self, url: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict]:
+        """GET a URL under the concurrency and rate limits"""
+        params = {**(params or {}), 'mailto': self.mailto}
+        async with self._semaphore:
+            await self._rate_limiter.acquire()
+            async with self.session.get(url, params=params, timeout=self.timeout) as response:
+                if response.status != 200:
+                    logger.warning("CrossRef request failed: %s", response.status)
+                    return None
+                return await response.json(content_type=None)
+
+    async def lookup_by_doi(self, doi: str) -> APIResult:
+        """
+        Look up reference by DOI
+
+        Args:
+            doi: DOI string
+
+        Returns:
+            APIResult object
+        """
+        try:
+            data = await self._get_json(f"{self.BASE_URL}/{doi}")
+            if data is None:
+                return APIResult(success=False, data={}, error="Lookup failed", source='crossref')
+
+            result = self._item_to_dict(data.get('message', {}))
+            result['doi'] = doi
+            return APIResult(success=True, data=result, source='crossref')
+
+        except Exception as e:
+            logger.error("CrossRef lookup error: %s", e)
+            return APIResult(success=False, data={}, error=str(e), source='crossref')
+
+    async def search_by_title(self, title: str, limit: int = 5) -> List[APIResult]:
+        """
+        Search for references by title
+
+        Args:
+            title: Title to search
+            limit: Maximum results
+
+        Returns:
+            List of APIResult objects
+        """
+        try:
+            params = {'query.title': title, 'rows': limit, 'select': CrossRefClient.SELECT_FIELDS}
+            data = await self._get_json(self.BASE_URL, params)
+            if data is None:
+                return []
+
+            items = data.get('message', {}).get('items', [])
+            return [APIResult(success=True, data=self._item_to_dict(item), source='crossref')
+                    for item in items]
+
+        except Exception as e:
+            logger.error("CrossRef search error: %s", e)
+            return []
+
+    async def enrich(self, ref_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Enrich a single reference (DOI lookup, then title search)
+
+        Args:
+            ref_data: Partial reference data
+
+        Returns:
+            Enriched reference data
+        """
+        enriched = ref_data.copy()
+
+        if ref_data.get('doi'):
+            result = await self.lookup_by_doi(_normalize_doi(ref_data['doi']))
+            if result.success:
+                enriched = MetadataEnricher._merge_metadata(enriched, result.data)
+                enriched['enriched_by'] = 'crossref'
+                return enriched
+
+        if ref_data.get('title'):
+            results = await self.search_by_title(ref_data['title'], limit=3)
+            if results:
+                enriched = MetadataEnricher._merge_metadata(enriched, results[0].data)
+                enriched['enriched_by'] = 'crossref_search'
+
+        return enriched
+
+    async def enrich_many(self, references: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Enrich multiple references concurrently
+
+        Args:
+            references: List of reference data
+
+        Returns:
+            List of enriched references (input order preserved)
+        """
+        return list(await asyncio.gather(*(self.enrich(ref) for ref in references)))
+
+
+def batch_enrich_sync(references: List[Dict[str, Any]], rate_limit: int = 5,
+                      timeout: int = 10, max_concurrent: int = 16,
+                      mailto: str = "") -> List[Dict[str, Any]]:
+    """
+    Synchronous facade over AsyncCrossRefClient.enrich_many
+
+    Args:
+        references: List of reference data
+        rate_limit: Requests per second
+        timeout: Per-request timeout in seconds
+        max_concurrent: Maximum in-flight requests
+        mailto: Contact address for CrossRef's polite pool
+
+    Returns:
+        List of enriched references
+    """
+    async def _run():
+        async with AsyncCrossRefClient(rate_limit, timeout, max_concurrent, mailto) as client:
+            return await client.enrich_many(references)
+
+    return asyncio.run(_run())
@@ -3,15 +3,22 @@ Configuration Management System
 Enterprise-level configuration with validation and persistence
 """
 
-import json
 import logging
+import os
+import sys
 from pathlib import Path
 from typing import Any, Dict, Optional
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
+from . import _json
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# __slots__ dataclasses need Python 3.10+
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class AppConfig:
     """Main application configuration"""
     # Directories
@@ -38,6 +45,7 @@ class AppConfig:
     enable_google_scholar: bool = False
     api_rate_limit: int = 5  # requests per second
     api_timeout: int = 10
+    crossref_mailto: str = ""  # contact address for CrossRef's polite pool
 
     # Export settings
     default_export_format: str = "bibtex"
@@ -68,6 +76,13 @@ class AppConfig:
     version: str = "3.0.0"
     last_updated: str = field(default_factory=lambda: datetime.now().isoformat())
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow dict of all fields (every field is a flat primitive)"""
+        return {name: getattr(self, name) for name in _APPCONFIG_FIELDS}
+
+
+_APPCONFIG_FIELDS = tuple(f.name for f in fields(AppConfig))
+
 
 class ConfigManager:
     """
@@ -77,7 +92,7 @@ class ConfigManager:
     def __init__(self, config_path: Optional[Path] = None):
         self.config_path = config_path or Path("config/settings.json")
         self.config: AppConfig = AppConfig()
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
         self._ensure_config_dir()
 
     def _ensure_config_dir(self):
@@ -93,15 +108,15 @@ class ConfigManager:
         """
         try:
             if self.config_path.exists():
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                with open(self.config_path, 'rb') as f:
+                    data = _json.loads(f.read())
                     self.config = AppConfig(**data)
-                    self.logger.info(f"Configuration loaded from {self.config_path}")
+                    logger.info("Configuration loaded from %s", self.config_path)
             else:
-                self.logger.info("No config file found, using defaults")
+                logger.info("No config file found, using defaults")
                 self.save()  # Create default config
         except Exception as e:
-            self.logger.error(f"Failed to load config: {e}")
+            logger.error("Failed to load config: %s", e)
             self.config = AppConfig()  # Fall back to defaults
 
         return self.config
@@ -115,12 +130,22 @@ class ConfigManager:
         """
         try:
             self.config.last_updated = datetime.now().isoformat()
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(asdict(self.config), f, indent=2)
-            self.logger.info(f"Configuration saved to {self.config_path}")
+
+            # Write to a sibling file and swap it in, so a crash mid-write
+            # never leaves a truncated settings file behind
+            tmp_path = self.config_path.with_name(self.config_path.name + '.tmp')
+            try:
+                with open(tmp_path, 'wb') as f:
+                    f.write(_json.dumps(self.config.to_dict()))
+                os.replace(tmp_path, self.config_path)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
+
+            logger.info("Configuration saved to %s", self.config_path)
             return True
         except Exception as e:
-            self.logger.error(f"Failed to save config: {e}")
+            logger.error("Failed to save config: %s", e)
             return False
 
     def update(self, **kwargs) -> bool:
@@ -138,10 +163,10 @@ class ConfigManager:
                 if hasattr(self.config, key):
                     setattr(self.config, key, value)
                 else:
-                    self.logger.warning(f"Unknown config key: {key}")
+                    logger.warning("Unknown config key: %s", key)
             return self.save()
         except Exception as e:
-            self.logger.error(f"Failed to update config: {e}")
+            logger.error("Failed to update config: %s", e)
             return False
 
     def get(self, key: str, default: Any = None) -> Any:
@@ -216,12 +241,12 @@ class ConfigManager:
             bool: True if successful
         """
         try:
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(asdict(self.config), f, indent=2)
-            self.logger.info(f"Configuration exported to {path}")
+            with open(path, 'wb') as f:
+                f.write(_json.dumps(self.config.to_dict(), indent=True))
+            logger.info("Configuration exported to %s", path)
             return True
         except Exception as e:
-            self.logger.error(f"Failed to export config: {e}")
+            logger.error("Failed to export config: %s", e)
             return False
 
     def import_config(self, path: Path) -> bool:
@@ -235,11 +260,11 @@ class ConfigManager:
             bool: True if successful
         """
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(path, 'rb') as f:
+                data = _json.loads(f.read())
                 self.config = AppConfig(**data)
-            self.logger.info(f"Configuration imported from {path}")
+            logger.info("Configuration imported from %s", path)
             return self.save()
         except Exception as e:
-            self.logger.error(f"Failed to import config: {e}")
+            logger.error("Failed to import config: %s", e)
             return False
@@ -6,14 +6,102 @@ Enterprise-level data persistence with indexing and caching
 import sqlite3
 import json
 import logging
+import re
+import sys
+import copy
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Optional, Dict, Any
-from datetime import datetime
-from dataclasses import dataclass, asdict
+from typing import List, Optional, Dict, Any, Iterator, Tuple
+from dataclasses import dataclass, fields
 from contextlib import contextmanager
 
+from . import _json
 
-@dataclass
+try:
+    import ijson
+except ImportError:  # optional dependency
+    ijson = None
+
+# Slotted dataclasses need Python 3.10+
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Columns mirrored into the refs_fts full-text index
+FTS_COLUMNS = ('title', 'authors', 'journal', 'abstract', 'keywords')
+
+# External-content FTS5 index over "references", kept in sync by triggers.
+# The update trigger only fires when an indexed column changes.
+FTS_SCHEMA = f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS refs_fts USING fts5(
+    {", ".join(FTS_COLUMNS)},
+    content='references', content_rowid='id', tokenize='porter unicode61'
+);
+
+CREATE TRIGGER IF NOT EXISTS refs_fts_ai AFTER INSERT ON "references" BEGIN
+    INSERT INTO refs_fts(rowid, {", ".join(FTS_COLUMNS)})
+    VALUES (new.id, {", ".join(f"new.{c}" for c in FTS_COLUMNS)});
+END;
+
+CREATE TRIGGER IF NOT EXISTS refs_fts_ad AFTER DELETE ON "references" BEGIN
+    INSERT INTO refs_fts(refs_fts, rowid, {", ".join(FTS_COLUMNS)})
+    VALUES ('delete', old.id, {", ".join(f"old.{c}" for c in FTS_COLUMNS)});
+END;
+
+CREATE TRIGGER IF NOT EXISTS refs_fts_au AFTER UPDATE OF {", ".join(FTS_COLUMNS)}
+ON "references" BEGIN
+    INSERT INTO refs_fts(refs_fts, rowid, {", ".join(FTS_COLUMNS)})
+    VALUES ('delete', old.id, {", ".join(f"old.{c}" for c in FTS_COLUMNS)});
+    INSERT INTO refs_fts(rowid, {", ".join(FTS_COLUMNS)})
+    VALUES (new.id, {", ".join(f"new.{c}" for c in FTS_COLUMNS)});
+END;
+"""
+
+# Valid-JSON guard, since json_each() raises on malformed text
+_TAGS_JSON = "CASE WHEN json_valid({0}.tags) THEN {0}.tags ELSE '[]' END"
+
+# Normalized copy of the JSON tags column, kept in sync by triggers
+TAGS_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS reference_tags (
+    ref_id INTEGER NOT NULL,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (ref_id, tag)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_tag ON reference_tags(tag);
+
+CREATE TRIGGER IF NOT EXISTS reference_tags_ai AFTER INSERT ON "references" BEGIN
+    INSERT OR IGNORE INTO reference_tags (ref_id, tag)
+    SELECT new.id, value FROM json_each({_TAGS_JSON.format('new')});
+END;
+
+CREATE TRIGGER IF NOT EXISTS reference_tags_ad AFTER DELETE ON "references" BEGIN
+    DELETE FROM reference_tags WHERE ref_id = old.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS reference_tags_au AFTER UPDATE OF tags ON "references" BEGIN
+    DELETE FROM reference_tags WHERE ref_id = old.id;
+    INSERT OR IGNORE INTO reference_tags (ref_id, tag)
+    SELECT new.id, value FROM json_each({_TAGS_JSON.format('new')});
+END;
+"""
+
+_WORD_RE = re.compile(r'\w')
+
+
+def _fts_match_expression(query: str, fields: List[str]) -> str:
+    """
+    Translate free text into an FTS5 MATCH expression
+
+    Each whitespace-separated term is quoted (so FTS syntax characters are
+    literal) and used as a prefix query; terms are AND-joined and limited
+    to the requested columns.
+    """
+    terms = ['"{}"*'.format(term.replace('"', '""')) for term in query.split()]
+    return "{%s} : (%s)" % (" ".join(fields), " AND ".join(terms))
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Reference:
     """Reference data model"""
     id: Optional[int] = None
@@ -40,46 +128,364 @@ class Reference:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
-        return asdict(self)
+        return {name: getattr(self, name) for name in REFERENCE_COLUMNS}
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Reference':
         """Create from dictionary"""
         return cls(**data)
 
+    @classmethod
+    def from_row(cls, row) -> 'Reference':
+        """Create from a row selected in REFERENCE_COLUMNS order"""
+        return cls(*row)
+
+    def to_insert_row(self) -> tuple:
+        """Values in INSERT_COLUMNS order (timestamps are set by SQLite)"""
+        return (
+            self.pdf_source, self.ref_number, self.authors, self.title, self.year,
+            self.journal, self.volume, self.issue, self.pages, self.doi, self.url,
+            self.abstract, self.keywords, self.citation_type, self.confidence_score,
+            self.verified, self.notes, self.tags
+        )
+
+
+# Column order of the references table, matching Reference's fields
+REFERENCE_COLUMNS = tuple(field.name for field in fields(Reference))
+
+# Whitelist for caller-supplied column names in UPDATE and search SQL
+_COLUMNS = frozenset(REFERENCE_COLUMNS)
+
+# Local-time ISO 8601 timestamp computed inside SQLite
+NOW_SQL = "strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime')"
+
+_TIMESTAMP_COLUMNS = ('created_at', 'updated_at')
+
+# Columns bound on insert (everything except the id and the timestamps)
+INSERT_COLUMNS = tuple(c for c in REFERENCE_COLUMNS[1:] if c not in _TIMESTAMP_COLUMNS)
+
+INSERT_REF_SQL = (
+    f'INSERT INTO "references" ({", ".join(INSERT_COLUMNS + _TIMESTAMP_COLUMNS)}) '
+    f'VALUES ({", ".join("?" * len(INSERT_COLUMNS))}, {NOW_SQL}, {NOW_SQL})'
+)
+
+# Columns an upsert fills in when the stored reference left them empty
+_UPSERT_FILL_COLUMNS = (
+    'authors', 'title', 'year', 'journal', 'volume', 'issue', 'pages', 'url',
+    'abstract', 'keywords', 'notes', 'tags'
+)
+
+# Re-adding a DOI from the same PDF (re-processing it) merges into the
+# existing row instead of duplicating; other PDFs citing it keep their own rows
+UPSERT_REF_SQL = INSERT_REF_SQL + (
+    " ON CONFLICT(pdf_source, doi) WHERE doi != '' DO UPDATE SET "
+    + ", ".join(f"{c} = COALESCE(NULLIF({c}, ''), excluded.{c})" for c in _UPSERT_FILL_COLUMNS)
+    + ", confidence_score = MAX(confidence_score, excluded.confidence_score)"
+    + ", verified = MAX(verified, excluded.verified)"
+    + ", updated_at = excluded.updated_at"
+)
+
+# (column, default) pairs for rows imported from JSON; timestamps are
+# stamped at import time
+_IMPORT_FIELDS = tuple(
+    (field.name, field.default) for field in fields(Reference)
+    if field.name in INSERT_COLUMNS
+)
+
+SELECT_ID_BY_PDF_DOI_SQL = 'SELECT id FROM "references" WHERE pdf_source = ? AND doi = ?'
+
+# Explicit column list so rows unpack positionally into Reference
+SELECT_REF_SQL = f'SELECT {", ".join(REFERENCE_COLUMNS)} FROM "references"'
+
+_NEWEST_FIRST = " ORDER BY created_at DESC, id DESC"
+
+# Static statements, built once so each call reuses the cached prepare.
+# LIMIT -1 means "no limit" in SQLite, so paging always binds a limit.
+SELECT_REF_BY_ID_SQL = SELECT_REF_SQL + " WHERE id = ?"
+SELECT_REFS_PAGE_SQL = SELECT_REF_SQL + _NEWEST_FIRST + " LIMIT ? OFFSET ?"
+SELECT_REFS_PAGE_BEFORE_SQL = (
+    SELECT_REF_SQL + " WHERE (created_at, id) < (?, ?)" + _NEWEST_FIRST + " LIMIT ? OFFSET ?"
+)
+SELECT_ALL_REFS_SQL = SELECT_REF_SQL + _NEWEST_FIRST
+SELECT_REFS_BY_PDF_SQL = SELECT_REF_SQL + " WHERE pdf_source = ? ORDER BY ref_number"
+SELECT_REFS_BY_TAG_SQL = (
+    SELECT_REF_SQL + " WHERE id IN (SELECT ref_id FROM reference_tags WHERE tag = ?)"
+    + _NEWEST_FIRST
+)
+SELECT_REFS_BY_TAG_LIKE_SQL = SELECT_REF_SQL + " WHERE tags LIKE ?" + _NEWEST_FIRST
+SEARCH_FTS_SQL = (
+    SELECT_REF_SQL + " WHERE id IN (SELECT rowid FROM refs_fts WHERE refs_fts MATCH ?)"
+    " ORDER BY confidence_score DESC LIMIT ?"
+)
+DELETE_REF_SQL = 'DELETE FROM "references" WHERE id = ?'
+CLEAR_REFS_SQL = 'DELETE FROM "references"'
+INSERT_HISTORY_SQL = f"""
+    INSERT INTO processing_history
+    (pdf_file, references_found, processing_time, status, error_message, created_at)
+    VALUES (?, ?, ?, ?, ?, {NOW_SQL})
+"""
+
+
+COUNT_REFS_SQL = 'SELECT COUNT(*) FROM "references"'
+STATS_TOTALS_SQL = """
+    SELECT COUNT(*), AVG(confidence_score), COUNT(DISTINCT pdf_source)
+    FROM "references"
+"""
+
+STATS_GROUPS_SQL = """
+    SELECT 'by_year', year, count FROM (
+        SELECT year, COUNT(*) AS count
+        FROM "references"
+        WHERE year != ''
+        GROUP BY year
+        ORDER BY year DESC
+        LIMIT 10
+    )
+    UNION ALL
+    SELECT 'by_type', citation_type, COUNT(*)
+    FROM "references"
+    GROUP BY citation_type
+"""
+
 
 class DatabaseManager:
     """
     Enterprise database manager with connection pooling and transactions
     """
 
-    def __init__(self, db_path: str = "data/references.db"):
+    # Backoff for BEGIN IMMEDIATE while another process holds the write lock
+    WRITE_RETRIES = 6
+    WRITE_RETRY_DELAY = 0.05  # seconds, doubled per attempt
+
+    # Prepared statements kept per connection (sqlite3 default is 128)
+    CACHED_STATEMENTS = 512
+
+    # Recently read references kept by get_reference
+    REF_CACHE_SIZE = 512
+
+    def __init__(self, db_path: str = "data/references.db", optimize_on_close: bool = True):
         self.db_path = Path(db_path)
+        self.in_memory = str(db_path) == ":memory:"
         self.logger = logging.getLogger(__name__)
-        self._ensure_db_dir()
+
+        # Refresh planner statistics on close; throwaway databases can skip it
+        self.optimize_on_close = optimize_on_close
+
+        # One persistent connection per thread keeps SQLite's page cache warm
+        self._local = threading.local()
+        self._conn: Optional[sqlite3.Connection] = None  # shared, in-memory only
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+        # All writes go through one connection, serialized in-process
+        self._writer: Optional[sqlite3.Connection] = None
+        self._write_lock = threading.RLock()
+        self.doi_unique = False
+        self._insert_sql = INSERT_REF_SQL
+        self.fts_enabled = False
+        self.tags_enabled = False
+
+        # Generated SQL keyed by sorted column tuple, so repeated calls
+        # reuse the same text and hit sqlite3's statement cache
+        self._update_stmts: Dict[tuple, str] = {}
+        self._search_stmts: Dict[tuple, str] = {}
+
+        # LRU of get_reference results, dropped on any write to the row
+        self._ref_cache: "OrderedDict[int, Reference]" = OrderedDict()
+        self._ref_cache_lock = threading.Lock()
+
+        if not self.in_memory:
+            self._ensure_db_dir()
         self._init_db()
 
     def _ensure_db_dir(self):
         """Create database directory if it doesn't exist"""
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
+    def _connect(self, read_only: bool = False) -> sqlite3.Connection:
+        """Open a new connection with explicit transaction control"""
+        options = dict(check_same_thread=False, isolation_level=None,
+                       cached_statements=self.CACHED_STATEMENTS)
+        if read_only and not self.in_memory:
+            uri = self.db_path.resolve().as_uri() + "?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, **options)
+        else:
+            conn = sqlite3.connect(str(self.db_path), **options)
+        if read_only:
+            # Writers never consume rows, so they keep the plain tuple factory
+            conn.row_factory = sqlite3.Row
+        # Per-connection settings (journal_mode=WAL persists in the file itself)
+        conn.execute("PRAGMA busy_timeout=30000")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-64000")  # ~64MB
+        if not self.in_memory:
+            conn.execute("PRAGMA mmap_size=268435456")  # 256MB
+        return conn
+
+    def _thread_connection(self) -> sqlite3.Connection:
+        """
+        Get the calling thread's persistent connection, opening it on first use
+
+        An in-memory database only exists inside one connection, so all
+        threads share a single connection in that case.
+        """
+        owner = self if self.in_memory else self._local
+        conn = getattr(owner, '_conn', None)
+        if conn is None:
+            conn = self._connect(read_only=True)
+            owner._conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def _writer_connection(self) -> sqlite3.Connection:
+        """Get the shared writer connection (call with _write_lock held)"""
+        if self.in_memory:
+            return self._thread_connection()
+        if self._writer is None:
+            self._writer = self._connect()
+            with self._connections_lock:
+                self._connections.append(self._writer)
+        return self._writer
+
+    def _begin_immediate(self, conn: sqlite3.Connection):
+        """BEGIN IMMEDIATE, retrying with exponential backoff while busy"""
+        delay = self.WRITE_RETRY_DELAY
+        for attempt in range(self.WRITE_RETRIES):
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                return
+            except sqlite3.OperationalError as e:
+                if 'locked' not in str(e) and 'busy' not in str(e):
+                    raise
+                if attempt == self.WRITE_RETRIES - 1:
+                    raise
+                self.logger.warning(f"Database busy, retrying write in {delay:.2f}s")
+                time.sleep(delay)
+                delay *= 2
+
     @contextmanager
-    def get_connection(self):
+    def write_connection(self):
+        """
+        Write transaction on the shared writer connection
+
+        BEGIN IMMEDIATE takes the write lock up front, so a conflicting
+        writer fails (and is retried) at BEGIN instead of at COMMIT after
+        doing its work. Nested use joins the outer transaction.
+        """
+        with self._write_lock:
+            conn = self._writer_connection()
+            if conn.in_transaction:
+                yield conn
+                return
+
+            self._begin_immediate(conn)
+            try:
+                yield conn
+                if conn.in_transaction:
+                    conn.execute("COMMIT")
+            except Exception as e:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                self.logger.error(f"Database error: {e}")
+                raise
+
+    @contextmanager
+    def read_connection(self):
         """
-        Context manager for database connections
-        Ensures proper connection handling and cleanup
+        Context manager for read connections
+        Wraps the block in a transaction on the thread's pooled read-only
+        connection; nested use joins the outer transaction.
         """
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
+        conn = self._thread_connection()
+        if conn.in_transaction:
+            yield conn
+            return
+
+        conn.execute("BEGIN")
         try:
             yield conn
-            conn.commit()
+            if conn.in_transaction:
+                conn.execute("COMMIT")
         except Exception as e:
-            conn.rollback()
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
             self.logger.error(f"Database error: {e}")
             raise
-        finally:
-            conn.close()
+
+    @contextmanager
+    def get_connection(self):
+        """
+        Read-write transaction with sqlite3.Row rows (the original API)
+
+        Kept for existing callers; runs on the writer connection, so it
+        is serialized with every other write.
+        """
+        with self.write_connection() as conn:
+            row_factory = conn.row_factory
+            conn.row_factory = sqlite3.Row
+            try:
+                yield conn
+            finally:
+                conn.row_factory = row_factory
+
+    def close(self):
+        """Close every pooled connection (call on shutdown)"""
+        if self.optimize_on_close:
+            self._optimize()
+
+        with self._connections_lock:
+            for conn in self._connections:
+                try:
+                    conn.close()
+                except sqlite3.Error as e:
+                    self.logger.warning(f"Failed to close connection: {e}")
+            self._connections.clear()
+        self._local = threading.local()
+        self._conn = None
+        self._writer = None
+
+    def _optimize(self):
+        """Re-analyze tables whose planner statistics have gone stale"""
+        with self._write_lock:
+            conn = self._writer if not self.in_memory else self._conn
+            if conn is None:
+                return
+            try:
+                conn.execute("PRAGMA optimize")
+            except sqlite3.Error as e:
+                self.logger.warning(f"PRAGMA optimize failed: {e}")
+
+    def snapshot(self, path: Path) -> bool:
+        """
+        Copy the database to a file with SQLite's online backup API
+
+        Useful with db_path=":memory:" or a tmpfs path (e.g. /dev/shm) for
+        throwaway bulk runs, which avoid fsync cost entirely; the copy is
+        page-level and much faster than replaying a SQL dump. Normal use
+        keeps the on-disk WAL database.
+
+        Args:
+            path: Destination database file (overwritten)
+
+        Returns:
+            True if successful
+        """
+        try:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            dest = sqlite3.connect(str(path))
+            try:
+                # Holding the write lock keeps the copy transactionally consistent
+                with self._write_lock:
+                    self._writer_connection().backup(dest)
+            finally:
+                dest.close()
+            self.logger.info(f"Database snapshot written to {path}")
+            return True
+        except Exception as e:
+            self.logger.error(f"Failed to snapshot database: {e}")
+            return False
 
     def _init_db(self):
         """Initialize database schema"""
@@ -104,16 +510,19 @@ class DatabaseManager:
             verified BOOLEAN DEFAULT 0,
             notes TEXT,
             tags TEXT,
-            created_at TEXT NOT NULL,
-            updated_at TEXT NOT NULL
+            created_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime')),
+            updated_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime'))
         );
 
-        CREATE INDEX IF NOT EXISTS idx_title ON "references"(title);
-        CREATE INDEX IF NOT EXISTS idx_authors ON "references"(authors);
-        CREATE INDEX IF NOT EXISTS idx_year ON "references"(year);
-        CREATE INDEX IF NOT EXISTS idx_doi ON "references"(doi);
-        CREATE INDEX IF NOT EXISTS idx_pdf_source ON "references"(pdf_source);
-        CREATE INDEX IF NOT EXISTS idx_confidence ON "references"(confidence_score);
+        -- title/authors are served by refs_fts; year and confidence are
+        -- too unselective to pay for their upkeep on every insert
+        DROP INDEX IF EXISTS idx_title;
+        DROP INDEX IF EXISTS idx_authors;
+        DROP INDEX IF EXISTS idx_year;
+        DROP INDEX IF EXISTS idx_confidence;
+        DROP INDEX IF EXISTS idx_pdf_source;
+        CREATE INDEX IF NOT EXISTS idx_pdf_source_refnum ON "references"(pdf_source, ref_number);
+        CREATE INDEX IF NOT EXISTS idx_created_at ON "references"(created_at DESC, id DESC);
 
         CREATE TABLE IF NOT EXISTS processing_history (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -122,7 +531,7 @@ class DatabaseManager:
             processing_time REAL DEFAULT 0.0,
             status TEXT DEFAULT 'pending',
             error_message TEXT,
-            created_at TEXT NOT NULL
+            created_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime'))
         );
 
         CREATE INDEX IF NOT EXISTS idx_pdf_file ON processing_history(pdf_file);
@@ -132,14 +541,14 @@ class DatabaseManager:
             export_format TEXT NOT NULL,
             output_file TEXT NOT NULL,
             reference_count INTEGER DEFAULT 0,
-            created_at TEXT NOT NULL
+            created_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime'))
         );
 
         CREATE TABLE IF NOT EXISTS tags (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             name TEXT UNIQUE NOT NULL,
             color TEXT DEFAULT '#3498db',
-            created_at TEXT NOT NULL
+            created_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime'))
         );
 
         CREATE TABLE IF NOT EXISTS statistics (
@@ -153,17 +562,117 @@ class DatabaseManager:
         """
 
         try:
-            with self.get_connection() as conn:
-                conn.executescript(schema)
+            # executescript manages its own transaction
+            conn = self._writer_connection()
+            conn.executescript(schema)
+            self.doi_unique = self._init_doi_index(conn)
+            # ON CONFLICT(pdf_source, doi) needs the unique index to target
+            self._insert_sql = UPSERT_REF_SQL if self.doi_unique else INSERT_REF_SQL
+            self.fts_enabled = self._init_fts(conn)
+            self.tags_enabled = self._init_tags(conn)
+            self._apply_pragmas(conn)
+            # Give the planner index statistics; analysis_limit bounds the cost
+            conn.execute("PRAGMA analysis_limit=1000")
+            conn.execute("ANALYZE")
             self.logger.info("Database initialized successfully")
         except Exception as e:
             self.logger.error(f"Failed to initialize database: {e}")
             raise
 
+    def _init_doi_index(self, conn: sqlite3.Connection) -> bool:
+        """
+        Index DOIs uniquely within each PDF, ignoring references without one
+
+        The same paper cited by two PDFs stays two rows; only a repeat from
+        the same PDF collides. Databases that already hold such repeats keep
+        a plain index until the duplicates are removed.
+
+        Returns:
+            True if the unique index is in place
+        """
+        conn.execute("DROP INDEX IF EXISTS idx_doi")
+        # Table-wide DOI uniqueness merged references across PDFs
+        conn.execute("DROP INDEX IF EXISTS idx_doi_unique")
+        try:
+            conn.execute(
+                "CREATE UNIQUE INDEX IF NOT EXISTS idx_pdf_doi_unique "
+                "ON \"references\"(pdf_source, doi) WHERE doi != ''"
+            )
+            conn.execute("DROP INDEX IF EXISTS idx_doi_lookup")
+            return True
+        except sqlite3.IntegrityError:
+            self.logger.warning("Duplicate DOIs within a PDF found; DOI index is not unique")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_doi_lookup "
+                "ON \"references\"(doi) WHERE doi != ''"
+            )
+            return False
+
+    def _init_fts(self, conn: sqlite3.Connection) -> bool:
+        """
+        Create the full-text index and its sync triggers
+
+        Rows that predate the index are loaded with a one-off rebuild.
+
+        Returns:
+            False if this SQLite build lacks FTS5 (search falls back to LIKE)
+        """
+        try:
+            existed = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'refs_fts'"
+            ).fetchone() is not None
+            conn.executescript(FTS_SCHEMA)
+            if not existed:
+                conn.execute("INSERT INTO refs_fts(refs_fts) VALUES ('rebuild')")
+            return True
+        except sqlite3.OperationalError as e:
+            self.logger.warning(f"Full-text search unavailable, using LIKE: {e}")
+            return False
+
+    def _init_tags(self, conn: sqlite3.Connection) -> bool:
+        """
+        Create the reference_tags lookup table and its sync triggers
+
+        Rows that predate the table are backfilled once.
+
+        Returns:
+            False if this SQLite build lacks the JSON functions
+        """
+        try:
+            existed = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'reference_tags'"
+            ).fetchone() is not None
+            conn.executescript(TAGS_SCHEMA)
+            if not existed:
+                conn.execute(f"""
+                    INSERT OR IGNORE INTO reference_tags (ref_id, tag)
+                    SELECT r.id, j.value
+                    FROM "references" AS r, json_each({_TAGS_JSON.format('r')}) AS j
+                """)
+            return True
+        except sqlite3.OperationalError as e:
+            self.logger.warning(f"Tag index unavailable, using LIKE: {e}")
+            return False
+
+    def _apply_pragmas(self, conn: sqlite3.Connection):
+        """
+        Switch the database file to WAL for concurrent reads and fewer fsyncs
+
+        WAL lets readers proceed while a write is in progress and, with
+        synchronous=NORMAL, only syncs at checkpoints instead of per commit.
+        The mode is stored in the file; the per-connection settings are
+        applied in _connect. WAL is not applicable to in-memory databases.
+        """
+        if not self.in_memory:
+            conn.execute("PRAGMA journal_mode=WAL")
+
     def add_reference(self, ref: Reference) -> Optional[int]:
         """
         Add a new reference to the database
 
+        A reference whose DOI is already stored for the same PDF is merged
+        into that row.
+
         Args:
             ref: Reference object
 
@@ -171,25 +680,14 @@ class DatabaseManager:
             Reference ID if successful, None otherwise
         """
         try:
-            now = datetime.now().isoformat()
-            ref.created_at = now
-            ref.updated_at = now
-
-            with self.get_connection() as conn:
-                cursor = conn.execute("""
-                    INSERT INTO "references" (
-                        pdf_source, ref_number, authors, title, year, journal,
-                        volume, issue, pages, doi, url, abstract, keywords,
-                        citation_type, confidence_score, verified, notes, tags,
-                        created_at, updated_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    ref.pdf_source, ref.ref_number, ref.authors, ref.title, ref.year,
-                    ref.journal, ref.volume, ref.issue, ref.pages, ref.doi, ref.url,
-                    ref.abstract, ref.keywords, ref.citation_type, ref.confidence_score,
-                    ref.verified, ref.notes, ref.tags, ref.created_at, ref.updated_at
-                ))
-                return cursor.lastrowid
+            with self.write_connection() as conn:
+                cursor = conn.execute(self._insert_sql, ref.to_insert_row())
+                ref_id = cursor.lastrowid
+                if ref.doi and self.doi_unique:
+                    # lastrowid is stale when the upsert took the update path
+                    ref_id = conn.execute(SELECT_ID_BY_PDF_DOI_SQL, (ref.pdf_source, ref.doi)).fetchone()[0]
+            self._invalidate_cache(ref_id)
+            return ref_id
         except Exception as e:
             self.logger.error(f"Failed to add reference: {e}")
             return None
@@ -198,98 +696,207 @@ class DatabaseManager:
         """
         Add multiple references in a single transaction
 
+        References whose DOI is already stored for the same PDF are merged
+        into that row, so re-processing a PDF is idempotent.
+
         Args:
             refs: List of Reference objects
 
         Returns:
-            Number of successfully added references
+            Number of references added or merged
         """
         count = 0
         try:
-            now = datetime.now().isoformat()
-            with self.get_connection() as conn:
-                for ref in refs:
-                    ref.created_at = now
-                    ref.updated_at = now
-                    conn.execute("""
-                        INSERT INTO "references" (
-                            pdf_source, ref_number, authors, title, year, journal,
-                            volume, issue, pages, doi, url, abstract, keywords,
-                            citation_type, confidence_score, verified, notes, tags,
-                            created_at, updated_at
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        ref.pdf_source, ref.ref_number, ref.authors, ref.title, ref.year,
-                        ref.journal, ref.volume, ref.issue, ref.pages, ref.doi, ref.url,
-                        ref.abstract, ref.keywords, ref.citation_type, ref.confidence_score,
-                        ref.verified, ref.notes, ref.tags, ref.created_at, ref.updated_at
-                    ))
-                    count += 1
+            # One prepared statement, bound in SQLite's C loop, one transaction
+            with self.write_connection() as conn:
+                rows = (ref.to_insert_row() for ref in refs)
+                cursor = conn.executemany(self._insert_sql, rows)
+                count = cursor.rowcount
+            # Upserts may have merged into cached rows
+            self._invalidate_cache()
             self.logger.info(f"Bulk added {count} references")
         except Exception as e:
             self.logger.error(f"Failed to bulk add references: {e}")
         return count
 
+    def _invalidate_cache(self, ref_id: Optional[int] = None):
+        """Drop one cached reference, or all of them when ref_id is None"""
+        with self._ref_cache_lock:
+            if ref_id is None:
+                self._ref_cache.clear()
+            else:
+                self._ref_cache.pop(ref_id, None)
+
     def get_reference(self, ref_id: int) -> Optional[Reference]:
-        """Get reference by ID"""
+        """Get reference by ID (served from an LRU cache when possible)"""
+        with self._ref_cache_lock:
+            ref = self._ref_cache.get(ref_id)
+            if ref is not None:
+                self._ref_cache.move_to_end(ref_id)
+                # Copies keep callers from mutating the cached instance
+                return copy.copy(ref)
+
         try:
-            with self.get_connection() as conn:
-                cursor = conn.execute("SELECT * FROM \"references\" WHERE id = ?", (ref_id,))
+            with self.read_connection() as conn:
+                cursor = conn.execute(SELECT_REF_BY_ID_SQL, (ref_id,))
                 row = cursor.fetchone()
                 if row:
-                    return Reference(**dict(row))
+                    ref = Reference.from_row(row)
+                    with self._ref_cache_lock:
+                        self._ref_cache[ref_id] = ref
+                        if len(self._ref_cache) > self.REF_CACHE_SIZE:
+                            self._ref_cache.popitem(last=False)
+                    return copy.copy(ref)
         except Exception as e:
             self.logger.error(f"Failed to get reference: {e}")
         return None
 
-    def get_all_references(self, limit: Optional[int] = None, offset: int = 0) -> List[Reference]:
+    def get_all_references(self, limit: Optional[int] = None, *,
+                           before: Optional[Tuple[str, int]] = None,
+                           offset: int = 0) -> List[Reference]:
         """
-        Get all references with pagination
+        Get all references, newest first, with keyset pagination
+
+        Pages are seeked through idx_created_at rather than skipped with
+        OFFSET, so every page costs the same regardless of depth. offset
+        is for random access (e.g. a view jumping to an arbitrary row)
+        when no cursor is at hand.
 
         Args:
             limit: Maximum number of results
-            offset: Starting position
+            before: (created_at, id) of the last reference on the previous
+                page; see page_cursor()
+            offset: Rows to skip after the cursor (or from the start)
 
         Returns:
             List of Reference objects
         """
         try:
-            query = "SELECT * FROM \"references\" ORDER BY created_at DESC"
-            if limit:
-                query += f" LIMIT {limit} OFFSET {offset}"
+            limit = limit or -1
+            if before is None:
+                query, params = SELECT_REFS_PAGE_SQL, (limit, offset)
+            else:
+                query, params = SELECT_REFS_PAGE_BEFORE_SQL, (*before, limit, offset)
 
-            with self.get_connection() as conn:
-                cursor = conn.execute(query)
-                return [Reference(**dict(row)) for row in cursor.fetchall()]
+            with self.read_connection() as conn:
+                cursor = conn.execute(query, params)
+                return [Reference.from_row(row) for row in cursor.fetchall()]
         except Exception as e:
             self.logger.error(f"Failed to get all references: {e}")
             return []
 
-    def search_references(self, query: str, fields: List[str] = None) -> List[Reference]:
+    def count_references(self) -> int:
+        """Get the total number of references"""
+        try:
+            with self.read_connection() as conn:
+                return conn.execute(COUNT_REFS_SQL).fetchone()[0]
+        except Exception as e:
+            self.logger.error(f"Failed to count references: {e}")
+            return 0
+
+    @staticmethod
+    def page_cursor(refs: List[Reference]) -> Optional[Tuple[str, int]]:
+        """Cursor for the page after refs (None when refs is empty)"""
+        if not refs:
+            return None
+        return refs[-1].created_at, refs[-1].id
+
+    def iter_references(self, batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """
+        Stream all references as plain dicts, newest first
+
+        Rows are fetched batch_size at a time straight from the cursor,
+        without building Reference objects or a full result list.
+
+        Args:
+            batch_size: Rows fetched per round trip
+
+        Yields:
+            One dict per reference row
+        """
+        # Runs outside read_connection: a plain SELECT holds its own read
+        # snapshot, so an abandoned generator leaves no transaction open
+        cursor = self._thread_connection().cursor()
+        cursor.arraysize = batch_size
+        cursor.execute(SELECT_ALL_REFS_SQL)
+        try:
+            while True:
+                rows = cursor.fetchmany()
+                if not rows:
+                    break
+                for row in rows:
+                    yield dict(row)
+        finally:
+            cursor.close()
+
+    def _iter_rows(self, sql: str, params: tuple) -> Iterator[Reference]:
+        """
+        Yield References straight from a cursor, one row at a time
+
+        Runs outside read_connection: a plain SELECT holds its own read
+        snapshot, so an abandoned generator leaves no transaction open.
+        """
+        cursor = self._thread_connection().execute(sql, params)
+        try:
+            for row in cursor:
+                yield Reference.from_row(row)
+        finally:
+            cursor.close()
+
+    def search_references(self, query: str, fields: List[str] = None,
+                          limit: Optional[int] = None) -> List[Reference]:
         """
         Search references across multiple fields
 
         Args:
             query: Search query
             fields: Fields to search in (default: title, authors, journal)
+            limit: Maximum results (best confidence first)
 
         Returns:
             List of matching Reference objects
         """
+        return list(self.iter_search_references(query, fields, limit))
+
+    def iter_search_references(self, query: str, fields: List[str] = None,
+                               limit: Optional[int] = None) -> Iterator[Reference]:
+        """
+        Lazily search references across multiple fields
+
+        Args:
+            query: Search query
+            fields: Fields to search in (default: title, authors, journal)
+            limit: Maximum results (best confidence first)
+
+        Yields:
+            Matching Reference objects
+        """
         if not fields:
             fields = ['title', 'authors', 'journal']
 
+        unknown = set(fields) - _COLUMNS
+        if unknown:
+            self.logger.error(f"Cannot search unknown fields: {sorted(unknown)}")
+            return
+
         try:
-            conditions = " OR ".join([f"{field} LIKE ?" for field in fields])
-            sql = f"SELECT * FROM \"references\" WHERE {conditions} ORDER BY confidence_score DESC"
-            params = [f"%{query}%" for _ in fields]
+            if (self.fts_enabled and _WORD_RE.search(query)
+                    and all(field in FTS_COLUMNS for field in fields)):
+                sql = SEARCH_FTS_SQL
+                params = (_fts_match_expression(query, fields), limit or -1)
+            else:
+                key = tuple(sorted(fields))
+                sql = self._search_stmts.get(key)
+                if sql is None:
+                    conditions = " OR ".join([f"{field} LIKE ?" for field in key])
+                    sql = (f"{SELECT_REF_SQL} WHERE {conditions} "
+                           "ORDER BY confidence_score DESC LIMIT ?")
+                    self._search_stmts[key] = sql
+                params = (*[f"%{query}%" for _ in key], limit or -1)
 
-            with self.get_connection() as conn:
-                cursor = conn.execute(sql, params)
-                return [Reference(**dict(row)) for row in cursor.fetchall()]
+            yield from self._iter_rows(sql, params)
         except Exception as e:
             self.logger.error(f"Failed to search references: {e}")
-            return []
 
     def update_reference(self, ref_id: int, **kwargs) -> bool:
         """
@@ -302,13 +909,25 @@ class DatabaseManager:
         Returns:
             True if successful
         """
+        invalid = set(kwargs) - _COLUMNS | set(kwargs) & {'id'}
+        if invalid:
+            self.logger.error(f"Cannot update fields: {sorted(invalid)}")
+            return False
+
         try:
-            kwargs['updated_at'] = datetime.now().isoformat()
-            set_clause = ", ".join([f"{key} = ?" for key in kwargs.keys()])
-            values = list(kwargs.values()) + [ref_id]
+            key = tuple(sorted(kwargs))
+            sql = self._update_stmts.get(key)
+            if sql is None:
+                assignments = [f"{column} = ?" for column in key]
+                if 'updated_at' not in kwargs:
+                    assignments.append(f"updated_at = {NOW_SQL}")
+                sql = f"UPDATE \"references\" SET {', '.join(assignments)} WHERE id = ?"
+                self._update_stmts[key] = sql
+            values = [kwargs[column] for column in key] + [ref_id]
 
-            with self.get_connection() as conn:
-                conn.execute(f"UPDATE \"references\" SET {set_clause} WHERE id = ?", values)
+            with self.write_connection() as conn:
+                conn.execute(sql, values)
+            self._invalidate_cache(ref_id)
             return True
         except Exception as e:
             self.logger.error(f"Failed to update reference: {e}")
@@ -317,8 +936,9 @@ class DatabaseManager:
     def delete_reference(self, ref_id: int) -> bool:
         """Delete reference by ID"""
         try:
-            with self.get_connection() as conn:
-                conn.execute("DELETE FROM \"references\" WHERE id = ?", (ref_id,))
+            with self.write_connection() as conn:
+                conn.execute(DELETE_REF_SQL, (ref_id,))
+            self._invalidate_cache(ref_id)
             return True
         except Exception as e:
             self.logger.error(f"Failed to delete reference: {e}")
@@ -326,15 +946,27 @@ class DatabaseManager:
 
     def get_references_by_pdf(self, pdf_source: str) -> List[Reference]:
         """Get all references from a specific PDF"""
+        return list(self.iter_references_by_pdf(pdf_source))
+
+    def iter_references_by_pdf(self, pdf_source: str) -> Iterator[Reference]:
+        """Lazily yield the references from a specific PDF, in reference order"""
         try:
-            with self.get_connection() as conn:
-                cursor = conn.execute(
-                    "SELECT * FROM \"references\" WHERE pdf_source = ? ORDER BY ref_number",
-                    (pdf_source,)
-                )
-                return [Reference(**dict(row)) for row in cursor.fetchall()]
+            yield from self._iter_rows(SELECT_REFS_BY_PDF_SQL, (pdf_source,))
         except Exception as e:
             self.logger.error(f"Failed to get references by PDF: {e}")
+
+    def get_references_by_tag(self, tag: str) -> List[Reference]:
+        """Get all references carrying a tag"""
+        try:
+            with self.read_connection() as conn:
+                if self.tags_enabled:
+                    cursor = conn.execute(SELECT_REFS_BY_TAG_SQL, (tag,))
+                else:
+                    cursor = conn.execute(SELECT_REFS_BY_TAG_LIKE_SQL,
+                                          (f'%{json.dumps(tag)}%',))
+                return [Reference.from_row(row) for row in cursor.fetchall()]
+        except Exception as e:
+            self.logger.error(f"Failed to get references by tag: {e}")
             return []
 
     def add_processing_history(self, pdf_file: str, refs_found: int,
@@ -342,13 +974,10 @@ class DatabaseManager:
                                error_msg: str = "") -> Optional[int]:
         """Record processing history"""
         try:
-            with self.get_connection() as conn:
-                cursor = conn.execute("""
-                    INSERT INTO processing_history
-                    (pdf_file, references_found, processing_time, status, error_message, created_at)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """, (pdf_file, refs_found, processing_time, status, error_msg,
-                      datetime.now().isoformat()))
+            with self.write_connection() as conn:
+                cursor = conn.execute(INSERT_HISTORY_SQL, (
+                    pdf_file, refs_found, processing_time, status, error_msg
+                ))
                 return cursor.lastrowid
         except Exception as e:
             self.logger.error(f"Failed to add processing history: {e}")
@@ -357,39 +986,20 @@ class DatabaseManager:
     def get_statistics(self) -> Dict[str, Any]:
         """Get database statistics"""
         try:
-            with self.get_connection() as conn:
+            with self.read_connection() as conn:
                 stats = {}
 
-                # Total references
-                cursor = conn.execute("SELECT COUNT(*) FROM \"references\"")
-                stats['total_references'] = cursor.fetchone()[0]
-
-                # By year
-                cursor = conn.execute("""
-                    SELECT year, COUNT(*) as count
-                    FROM "references"
-                    WHERE year != ''
-                    GROUP BY year
-                    ORDER BY year DESC
-                    LIMIT 10
-                """)
-                stats['by_year'] = dict(cursor.fetchall())
+                # Totals, average confidence and PDF count in one scan
+                total, avg_confidence, total_pdfs = conn.execute(STATS_TOTALS_SQL).fetchone()
+                stats['total_references'] = total
+                stats['avg_confidence'] = avg_confidence or 0.0
+                stats['total_pdfs'] = total_pdfs
 
-                # By citation type
-                cursor = conn.execute("""
-                    SELECT citation_type, COUNT(*) as count
-                    FROM "references"
-                    GROUP BY citation_type
-                """)
-                stats['by_type'] = dict(cursor.fetchall())
-
-                # Average confidence score
-                cursor = conn.execute("SELECT AVG(confidence_score) FROM \"references\"")
-                stats['avg_confidence'] = cursor.fetchone()[0] or 0.0
-
-                # Total PDFs processed
-                cursor = conn.execute("SELECT COUNT(DISTINCT pdf_source) FROM \"references\"")
-                stats['total_pdfs'] = cursor.fetchone()[0]
+                # Top years and citation types in one round trip
+                stats['by_year'] = {}
+                stats['by_type'] = {}
+                for group, key, count in conn.execute(STATS_GROUPS_SQL):
+                    stats[group][key] = count
 
                 return stats
         except Exception as e:
@@ -399,8 +1009,9 @@ class DatabaseManager:
     def clear_all_references(self) -> bool:
         """Clear all references (use with caution)"""
         try:
-            with self.get_connection() as conn:
-                conn.execute("DELETE FROM \"references\"")
+            with self.write_connection() as conn:
+                conn.execute(CLEAR_REFS_SQL)
+            self._invalidate_cache()
             self.logger.warning("All references cleared from database")
             return True
         except Exception as e:
@@ -410,23 +1021,41 @@ class DatabaseManager:
     def export_to_json(self, output_path: Path) -> bool:
         """Export all references to JSON"""
         try:
-            refs = self.get_all_references()
-            data = [ref.to_dict() for ref in refs]
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            self.logger.info(f"Exported {len(refs)} references to {output_path}")
+            count = 0
+            with open(output_path, 'wb') as f:
+                f.write(b"[")
+                for row in self.iter_references():
+                    f.write(b",\n  " if count else b"\n  ")
+                    f.write(_json.dumps(row))
+                    count += 1
+                f.write(b"\n]" if count else b"]")
+            self.logger.info(f"Exported {count} references to {output_path}")
             return True
         except Exception as e:
             self.logger.error(f"Failed to export to JSON: {e}")
             return False
 
     def import_from_json(self, input_path: Path) -> int:
-        """Import references from JSON"""
+        """Import references from JSON, returning how many new rows were added"""
         try:
-            with open(input_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            refs = [Reference.from_dict(item) for item in data]
-            count = self.bulk_add_references(refs)
+            with open(input_path, 'rb') as f:
+                if ijson is not None:
+                    # Parse one array element at a time instead of the whole file
+                    items = ijson.items(f, 'item', use_float=True)
+                else:
+                    items = _json.loads(f.read())
+
+                # Items go straight to INSERT tuples, without Reference objects
+                rows = (
+                    tuple(item.get(name, default) for name, default in _IMPORT_FIELDS)
+                    for item in items
+                )
+                with self.write_connection() as conn:
+                    # rowcount would include rows merged by the upsert
+                    before = conn.execute(COUNT_REFS_SQL).fetchone()[0]
+                    conn.executemany(self._insert_sql, rows)
+                    count = conn.execute(COUNT_REFS_SQL).fetchone()[0] - before
+            self._invalidate_cache()
             self.logger.info(f"Imported {count} references from {input_path}")
             return count
         except Exception as e:
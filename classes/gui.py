@@ -3,16 +3,227 @@ Enterprise-Level GUI - Professional Modern Interface
 Ultra-modern, professional design with advanced features
 """
 
+import functools
 import logging
+import os
+import re
+import string
+import subprocess
+import sys
+import webbrowser
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, NamedTuple
 from datetime import datetime
 from PySide6 import QtWidgets, QtCore, QtGui
 from .config import ConfigManager
 from .database import DatabaseManager
+from .exporter import BibTeXExporter
+from .reference_parser import ParsedReference
 from .worker import WorkerManager
 from .logger import LoggerManager
 
+STYLES_DIR = Path(__file__).parent / "styles"
+STYLESHEET_PATH = STYLES_DIR / "professional.qss"
+_QSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_QSS_SPACE_RE = re.compile(r"\s+")
+
+# Object names for the ModernButton variants styled in professional.qss
+_BTN_OBJ_NAMES = {t: f"modernButton_{t}" for t in ("default", "primary", "success", "danger")}
+
+# Color-coded log lines; only the timestamp and message vary per line
+_LOG_PREFIXES = {
+    level: f'<span style="color: {color};">'
+    for level, color in (
+        ("DEBUG", "#718096"),
+        ("INFO", "#2D3748"),
+        ("WARNING", "#ED8936"),
+        ("ERROR", "#E53E3E"),
+        ("CRITICAL", "#C53030"),
+        ("SUCCESS", "#48BB78"),
+    )
+}
+
+# Confidence score thresholds, highest first
+_CONFIDENCE_COLORS = ((0.8, "#48BB78"), (0.6, "#ECC94B"), (0.0, "#F56565"))
+
+# Rich-text templates for the reference details dialog and statistics tab;
+# parsed once at import instead of rebuilt as f-strings on every call
+_SECTION_STYLE = ("background-color: #F7FAFC; padding: 15px; border-radius: 8px; "
+                  "border-left: 4px solid #667eea; margin: 10px 0;")
+_REFERENCE_SECTION_HTML = string.Template(f"""
+        <div style='{_SECTION_STYLE}'>
+            <p><b style='color: #4A5568;'>$label:</b><br>$body</p>
+        </div>
+""")
+_REFERENCE_HTML = string.Template(f"""
+        <div style='{_SECTION_STYLE}'>
+            <p><b style='color: #4A5568;'>Authors:</b><br>$authors</p>
+        </div>
+
+        <div style='{_SECTION_STYLE}'>
+            <p><b style='color: #4A5568;'>Publication Details:</b><br>
+            <b>Year:</b> $year<br>
+            <b>Journal/Conference:</b> $journal<br>
+            <b>Volume:</b> $volume<br>
+            <b>Issue:</b> $issue<br>
+            <b>Pages:</b> $pages</p>
+        </div>
+
+        <div style='{_SECTION_STYLE}'>
+            <p><b style='color: #4A5568;'>Identifiers:</b><br>
+            <b>DOI:</b> $doi<br>
+            <b>Reference Number:</b> $ref_number</p>
+        </div>
+
+        <div style='{_SECTION_STYLE}'>
+            <p><b style='color: #4A5568;'>Source:</b><br>
+            <b>PDF File:</b> $pdf_source<br>
+            <b>Citation Type:</b> $citation_type<br>
+            <b>Confidence Score:</b> <span style='color: $confidence_color; font-weight: bold;'>$confidence</span></p>
+        </div>
+""")
+_STATS_ITEM_HTML = string.Template("<li><b>$key:</b> $count references</li>")
+_STATS_HTML = string.Template("""
+        <html>
+        <head>
+            <style>
+                body { font-family: 'Segoe UI', Arial, sans-serif; padding: 20px; }
+                h2 { color: #667eea; border-bottom: 3px solid #667eea; padding-bottom: 10px; }
+                h3 { color: #4A5568; margin-top: 25px; }
+                .stat-box {
+                    background-color: #F7FAFC;
+                    border-left: 4px solid #667eea;
+                    padding: 15px;
+                    margin: 10px 0;
+                    border-radius: 5px;
+                }
+                .stat-label { color: #718096; font-size: 12px; text-transform: uppercase; }
+                .stat-value { color: #2D3748; font-size: 24px; font-weight: bold; }
+                ul { list-style-type: none; padding: 0; }
+                li {
+                    background-color: #F7FAFC;
+                    padding: 10px 15px;
+                    margin: 5px 0;
+                    border-radius: 5px;
+                    border-left: 3px solid #667eea;
+                }
+            </style>
+        </head>
+        <body>
+            <h2>📊 Database Statistics</h2>
+
+            <div class="stat-box">
+                <div class="stat-label">Total References</div>
+                <div class="stat-value">$total_references</div>
+            </div>
+
+            <div class="stat-box">
+                <div class="stat-label">Total PDFs Processed</div>
+                <div class="stat-value">$total_pdfs</div>
+            </div>
+
+            <div class="stat-box">
+                <div class="stat-label">Average Confidence Score</div>
+                <div class="stat-value">$avg_confidence</div>
+            </div>
+
+            <h3>📅 References by Year</h3>
+            <ul>$by_year</ul>
+
+            <h3>📚 References by Type</h3>
+            <ul>$by_type</ul>
+        </body>
+        </html>
+""")
+
+
+def confidence_color(score: float) -> str:
+    """Hex color for a confidence score (green / yellow / red)"""
+    for threshold, color in _CONFIDENCE_COLORS:
+        if score >= threshold:
+            return color
+    return _CONFIDENCE_COLORS[-1][1]
+
+
+def _open_folder(path: str):
+    """Open a folder in the platform file manager (blocking; run off the UI thread)"""
+    try:
+        if os.name == 'nt':  # Windows
+            os.startfile(path)
+        elif sys.platform == 'darwin':
+            subprocess.Popen(['open', path])
+        else:  # Linux and other POSIX
+            subprocess.Popen(['xdg-open', path])
+    except Exception as e:
+        logging.getLogger(__name__).error(f"Failed to open folder {path}: {e}")
+
+
+def load_stylesheet(path: Path) -> str:
+    """
+    Read a .qss file, resolve %STYLES_DIR% and minify it
+
+    Args:
+        path: Stylesheet file
+
+    Returns:
+        Stylesheet text with comments and redundant whitespace removed
+    """
+    qss = path.read_text(encoding='utf-8').replace("%STYLES_DIR%", STYLES_DIR.as_posix())
+    qss = _QSS_COMMENT_RE.sub("", qss)
+    return _QSS_SPACE_RE.sub(" ", qss).strip()
+
+
+def list_pdfs(directory: Path) -> List[Path]:
+    """
+    List the PDF files directly inside a directory
+
+    Uses os.scandir, whose entries answer is_file() from the directory
+    listing itself, instead of glob's pattern matching and per-entry Paths.
+
+    Args:
+        directory: Directory to scan
+
+    Returns:
+        Paths of the *.pdf files (any case) in the directory
+    """
+    with os.scandir(directory) as entries:
+        return [Path(entry.path) for entry in entries
+                if entry.name.lower().endswith('.pdf') and entry.is_file()]
+
+
+@functools.lru_cache(maxsize=None)
+def emoji_icon(ch: str, px: int = 24) -> QtGui.QIcon:
+    """
+    Rasterise an emoji once so widgets draw a pixmap instead of shaping
+    the glyph on every paint
+
+    Args:
+        ch: Emoji character(s)
+        px: Icon edge length in pixels
+
+    Returns:
+        QIcon holding the pre-rendered emoji
+    """
+    pixmap = QtGui.QPixmap(px, px)
+    pixmap.fill(QtCore.Qt.transparent)
+
+    font = QtGui.QFont()
+    font.setPixelSize(int(px * 0.8))
+
+    painter = QtGui.QPainter(pixmap)
+    painter.setFont(font)
+    painter.drawText(pixmap.rect(), QtCore.Qt.AlignCenter, ch)
+    painter.end()
+
+    return QtGui.QIcon(pixmap)
+
+
+@functools.lru_cache(maxsize=None)
+def cached_font(family: str, point_size: int) -> QtGui.QFont:
+    """Build a QFont once per (family, size); setFont() copies it anyway"""
+    return QtGui.QFont(family, point_size)
+
 
 class StatsCard(QtWidgets.QFrame):
     """Modern statistics card widget"""
@@ -27,9 +238,9 @@ class StatsCard(QtWidgets.QFrame):
 
         # Icon and title
         header = QtWidgets.QHBoxLayout()
-        icon_lbl = QtWidgets.QLabel(icon)
+        icon_lbl = QtWidgets.QLabel()
         icon_lbl.setObjectName("statsIcon")
-        icon_lbl.setStyleSheet("font-size: 24px;")
+        icon_lbl.setPixmap(emoji_icon(icon, 24).pixmap(24, 24))
 
         title_lbl = QtWidgets.QLabel(title)
         title_lbl.setObjectName("statsTitle")
@@ -39,6 +250,7 @@ class StatsCard(QtWidgets.QFrame):
         header.addStretch()
 
         # Value
+        self._last = value
         self.value_lbl = QtWidgets.QLabel(value)
         self.value_lbl.setObjectName("statsValue")
         self.value_lbl.setAlignment(QtCore.Qt.AlignCenter)
@@ -47,7 +259,10 @@ class StatsCard(QtWidgets.QFrame):
         layout.addWidget(self.value_lbl)
 
     def update_value(self, value: str):
-        """Update card value"""
+        """Update card value (no-op when unchanged, avoiding a relayout)"""
+        if value == self._last:
+            return
+        self._last = value
         self.value_lbl.setText(value)
 
 
@@ -57,13 +272,432 @@ class ModernButton(QtWidgets.QPushButton):
     def __init__(self, text: str, icon: str = "", button_type: str = "default"):
         super().__init__(text)
         self.button_type = button_type
-        self.setObjectName(f"modernButton_{button_type}")
+        self.setObjectName(_BTN_OBJ_NAMES.get(button_type) or f"modernButton_{button_type}")
         self.setCursor(QtCore.Qt.PointingHandCursor)
         self.setMinimumHeight(45)
 
         if icon:
-            # For emoji icons
-            self.setText(f"{icon}  {text}")
+            self.setIcon(emoji_icon(icon))
+            self.setIconSize(QtCore.QSize(18, 18))
+
+
+class DatabaseOpener(QtCore.QObject, QtCore.QRunnable):
+    """
+    Opens the DatabaseManager on a pool thread
+    Schema checks, migrations and ANALYZE then happen off the UI thread
+    """
+
+    opened = QtCore.Signal(object)  # DatabaseManager
+    failed = QtCore.Signal(str)  # error message
+
+    def __init__(self, db_path: str):
+        QtCore.QObject.__init__(self)
+        QtCore.QRunnable.__init__(self)
+        self.setAutoDelete(False)
+        self.db_path = db_path
+        self.db: Optional[DatabaseManager] = None
+
+    def run(self):
+        try:
+            self.db = DatabaseManager(self.db_path)
+        except Exception as e:
+            logging.getLogger(__name__).error(f"Failed to open database: {e}")
+            self.failed.emit(str(e))
+            return
+        self.opened.emit(self.db)
+
+
+class BackgroundCall(QtCore.QObject, QtCore.QRunnable):
+    """Runs a callable on a pool thread and emits its result on the caller's thread"""
+
+    done = QtCore.Signal(object)  # return value of fn
+
+    def __init__(self, fn):
+        QtCore.QObject.__init__(self)
+        QtCore.QRunnable.__init__(self)
+        self.setAutoDelete(False)
+        self.fn = fn
+
+    def run(self):
+        try:
+            result = self.fn()
+        except Exception as e:
+            logging.getLogger(__name__).error(f"Background task failed: {e}")
+            result = None
+        self.done.emit(result)
+
+
+class ReferenceStreamer(QtCore.QObject, QtCore.QRunnable):
+    """
+    Runs a reference search on a pool thread and emits the hits in chunks
+    The first rows reach the view as soon as they are read, not after the
+    whole result set has been materialised
+    """
+
+    chunkReady = QtCore.Signal(object)  # list of hits (after make_row)
+    done = QtCore.Signal()
+
+    def __init__(self, db: DatabaseManager, query: str, limit: int, chunk_size: int = 64,
+                 make_row=None):
+        QtCore.QObject.__init__(self)
+        QtCore.QRunnable.__init__(self)
+        self.setAutoDelete(False)
+        self.db = db
+        self.query = query
+        self.limit = limit
+        self.chunk_size = chunk_size
+        self.make_row = make_row  # applied to each hit before it is emitted
+        self._cancelled = False
+
+    def cancel(self):
+        """Stop after the chunk currently being read"""
+        self._cancelled = True
+
+    def run(self):
+        try:
+            chunk = []
+            for ref in self.db.iter_search_references(self.query, limit=self.limit):
+                if self._cancelled:
+                    break
+                chunk.append(self.make_row(ref) if self.make_row else ref)
+                if len(chunk) >= self.chunk_size:
+                    self.chunkReady.emit(chunk)
+                    chunk = []
+            if chunk and not self._cancelled:
+                self.chunkReady.emit(chunk)
+        except Exception as e:
+            logging.getLogger(__name__).error(f"Reference search failed: {e}")
+        self.done.emit()
+
+
+class AnimationDriver(QtCore.QObject):
+    """
+    Single timeline shared by every UI animation
+    Targets connect to pulse (0.0 -> 1.0) instead of each owning a
+    QPropertyAnimation and timer; the driver stops when the timeline ends
+    """
+
+    pulse = QtCore.Signal(float)
+    finished = QtCore.Signal()
+
+    def __init__(self, duration: int = 500, parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+        self._animation = QtCore.QVariantAnimation(self)
+        self._animation.setDuration(duration)
+        self._animation.setStartValue(0.0)
+        self._animation.setEndValue(1.0)
+        self._animation.setEasingCurve(QtCore.QEasingCurve.InOutQuad)
+        self._animation.valueChanged.connect(self._on_value_changed)
+        self._animation.finished.connect(self.finished.emit)
+
+    def start(self):
+        """Run the timeline from the beginning"""
+        self._animation.start()
+
+    def _on_value_changed(self, value):
+        self.pulse.emit(float(value))
+
+
+class UpdateCoalescer(QtCore.QObject):
+    """
+    Caps a top-level window's repaints at one per frame
+
+    Qt merges update() calls into a single pending UpdateRequest, but when
+    queued worker signals arrive faster than the display refreshes, each
+    event loop pass still flushes a repaint. While active, the filter holds
+    the window's UpdateRequest and replays it once the frame interval has
+    elapsed; dirty regions keep accumulating in the meantime.
+    """
+
+    def __init__(self, window: QtWidgets.QWidget, interval: int = 16):
+        super().__init__(window)
+        self._window = window
+        self._releasing = False
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval)
+        self._timer.timeout.connect(self._release)
+
+    def start(self):
+        """Begin coalescing repaints"""
+        self._window.installEventFilter(self)
+
+    def stop(self):
+        """Stop coalescing and flush any held repaint"""
+        self._window.removeEventFilter(self)
+        if self._timer.isActive():
+            self._timer.stop()
+            self._release()
+
+    def eventFilter(self, obj, event):
+        if (obj is self._window and not self._releasing
+                and event.type() == QtCore.QEvent.UpdateRequest):
+            if not self._timer.isActive():
+                self._timer.start()
+            return True
+        return False
+
+    def _release(self):
+        self._releasing = True
+        try:
+            QtCore.QCoreApplication.sendEvent(
+                self._window, QtCore.QEvent(QtCore.QEvent.UpdateRequest)
+            )
+        finally:
+            self._releasing = False
+
+
+class FastProgressBar(QtWidgets.QProgressBar):
+    """Progress bar painted without antialiasing (its shapes are axis-aligned)"""
+
+    def paintEvent(self, event):
+        painter = QtWidgets.QStylePainter(self)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing, False)
+        painter.setRenderHint(QtGui.QPainter.SmoothPixmapTransform, False)
+
+        option = QtWidgets.QStyleOptionProgressBar()
+        self.initStyleOption(option)
+        painter.drawControl(QtWidgets.QStyle.CE_ProgressBar, option)
+
+
+_DISPLAY_ROLE = QtCore.Qt.DisplayRole
+_USER_ROLE = QtCore.Qt.UserRole
+_BACKGROUND_ROLE = QtCore.Qt.BackgroundRole
+_FOREGROUND_ROLE = QtCore.Qt.ForegroundRole
+
+
+class DisplayRow(NamedTuple):
+    """A Reference with its table cells formatted once, when it is loaded"""
+    ref: Any
+    cells: tuple  # DisplayRole text per column
+    confidence_brush: QtGui.QBrush
+
+
+class ReferenceTableModel(QtCore.QAbstractTableModel):
+    """
+    Virtualised table model over the references database
+    Rows are fetched on demand in fixed-size blocks, so only the blocks a
+    view actually paints are ever loaded
+    """
+
+    HEADERS = ["Title", "Authors", "Year", "Journal", "DOI", "Confidence", "Actions"]
+    # Representative cell text used to size each column once
+    COLUMN_SAMPLES = [
+        "M" * 18, "Author, Author, Author", "2024", "Journal Name Abbrev.",
+        "10.1000/xyz12345", "0.99", "👁️ View",
+    ]
+    ACTIONS_COLUMN = 6
+    BLOCK_SIZE = 200
+    MAX_BLOCKS = 50
+    SEARCH_LIMIT = 1000
+
+    # Brushes are built once; returning them from data() skips the
+    # QVariant -> QColor -> QBrush conversion on every paint
+    _CONFIDENCE_BRUSHES = tuple(
+        (threshold, QtGui.QBrush(QtGui.QColor(color))) for threshold, color in _CONFIDENCE_COLORS
+    )
+    _WHITE_FG = QtGui.QBrush(QtGui.QColor("white"))
+
+    def __init__(self, db: DatabaseManager, parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+        self.db = db
+        self._total = 0
+        self._blocks = OrderedDict()  # block index -> List[DisplayRow]
+        self._query = ""
+        self._results = None  # DisplayRows of the search hits while a query is set
+        self._generation = 0
+        self._tasks = set()  # in-flight pool tasks, kept alive until done
+        self._pending_reset = False  # search running, first chunk not in yet
+        self.refresh()
+
+    def refresh(self):
+        """
+        Re-count the table (or re-run the search) on a pool thread, then
+        reset the model and drop every cached block; search hits after the
+        first chunk are appended with rowsInserted
+        """
+        self._generation += 1
+        generation = self._generation
+        self.cancel_searches()
+
+        if self.db is None:
+            self._apply(generation, (0, None))
+            return
+
+        if self._query:
+            task = ReferenceStreamer(self.db, self._query, self.SEARCH_LIMIT,
+                                     make_row=self.display_row)
+            task.chunkReady.connect(lambda refs: self._on_chunk(generation, refs))
+            task.done.connect(lambda task=task: self._on_streamed(task, generation))
+            self._pending_reset = True
+        else:
+            task = BackgroundCall(self.db.count_references)
+            task.done.connect(lambda count, task=task: self._on_loaded(task, generation, count))
+        self._tasks.add(task)
+        QtCore.QThreadPool.globalInstance().start(task)
+
+    def cancel_searches(self):
+        """Ask running searches to stop after their current chunk"""
+        for task in self._tasks:
+            if isinstance(task, ReferenceStreamer):
+                task.cancel()
+
+    def _on_loaded(self, task: BackgroundCall, generation: int, count):
+        self._tasks.discard(task)
+        self._apply(generation, (count or 0, None))
+
+    def _on_chunk(self, generation: int, rows: list):
+        if generation != self._generation:
+            return  # superseded by a later refresh
+        if self._pending_reset:
+            # Old rows stay up until the first hits arrive
+            self._pending_reset = False
+            self._apply(generation, (len(rows), rows))
+            return
+        first = len(self._results)
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + len(rows) - 1)
+        self._results.extend(rows)
+        self._total = len(self._results)
+        self.endInsertRows()
+
+    def _on_streamed(self, task: ReferenceStreamer, generation: int):
+        self._tasks.discard(task)
+        if generation == self._generation and self._pending_reset:
+            self._pending_reset = False
+            self._apply(generation, (0, []))  # no hits
+
+    def _apply(self, generation: int, result: tuple):
+        if generation != self._generation:
+            return  # superseded by a later refresh
+        self.beginResetModel()
+        self._blocks.clear()
+        self._total, self._results = result
+        self.endResetModel()
+
+    def set_query(self, query: str):
+        """Show only references matching query (all of them when empty)"""
+        self._query = query.strip()
+        self.refresh()
+
+    def rowCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._total
+
+    def columnCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if orientation == QtCore.Qt.Horizontal and role == QtCore.Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    @classmethod
+    def display_row(cls, ref) -> DisplayRow:
+        """Format a Reference for display; safe to call off the UI thread"""
+        for threshold, brush in cls._CONFIDENCE_BRUSHES:
+            if ref.confidence_score >= threshold:
+                break
+        cells = (ref.title[:100], ref.authors[:50], ref.year, ref.journal[:50],
+                 ref.doi, f"{ref.confidence_score:.2f}", None)
+        return DisplayRow(ref, cells, brush)
+
+    def _row(self, row: int) -> Optional[DisplayRow]:
+        if self._results is not None:
+            return self._results[row] if row < len(self._results) else None
+
+        block, offset = divmod(row, self.BLOCK_SIZE)
+        rows = self._block(block)
+        return rows[offset] if offset < len(rows) else None
+
+    def reference(self, row: int):
+        """Get the Reference shown on a row (None when out of range)"""
+        display = self._row(row)
+        return display.ref if display is not None else None
+
+    def _block(self, block: int) -> list:
+        """Load one block of rows, seeking from the previous block when cached"""
+        rows = self._blocks.get(block)
+        if rows is not None:
+            self._blocks.move_to_end(block)
+            return rows
+
+        previous = self._blocks.get(block - 1)
+        if previous:
+            refs = self.db.get_all_references(self.BLOCK_SIZE,
+                                              before=self.db.page_cursor([previous[-1].ref]))
+        else:
+            refs = self.db.get_all_references(self.BLOCK_SIZE,
+                                              offset=block * self.BLOCK_SIZE)
+
+        rows = list(map(self.display_row, refs))
+        self._blocks[block] = rows
+        if len(self._blocks) > self.MAX_BLOCKS:
+            self._blocks.popitem(last=False)
+        return rows
+
+    def data(self, index, role=_DISPLAY_ROLE):
+        # Called for every role of every visible cell on each paint, so the
+        # Qt enums are read from module-level aliases
+        if not index.isValid():
+            return None
+
+        row = self._row(index.row())
+        if row is None:
+            return None
+
+        if role == _DISPLAY_ROLE:
+            return row.cells[index.column()]  # Actions column is painted by ViewButtonDelegate
+
+        column = index.column()
+        if column == 5:
+            if role == _BACKGROUND_ROLE:
+                return row.confidence_brush
+            if role == _FOREGROUND_ROLE:
+                return self._WHITE_FG
+        elif column == 0 and role == _USER_ROLE:
+            return row.ref.id
+
+        return None
+
+
+class ViewButtonDelegate(QtWidgets.QStyledItemDelegate):
+    """
+    Paints a push-button look-alike in the Actions column and reports clicks
+    One delegate serves every row, so no per-row button widgets are created
+    """
+
+    viewRequested = QtCore.Signal(int)
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+        # Reused for every paint; only the rect and state change per cell
+        self._button = QtWidgets.QStyleOptionButton()
+        self._button.text = "View"
+        self._button.icon = emoji_icon("👁️")
+        self._button.iconSize = QtCore.QSize(16, 16)
+
+    def paint(self, painter, option, index):
+        widget = option.widget
+        style = widget.style() if widget else QtWidgets.QApplication.style()
+        style.drawPrimitive(QtWidgets.QStyle.PE_PanelItemViewItem, option, painter, widget)
+
+        self._button.rect = option.rect.adjusted(4, 3, -4, -3)
+        self._button.state = option.state | QtWidgets.QStyle.State_Enabled
+        style.drawControl(QtWidgets.QStyle.CE_PushButton, self._button, painter, widget)
+
+    def sizeHint(self, option, index) -> QtCore.QSize:
+        metrics = option.fontMetrics
+        return QtCore.QSize(metrics.horizontalAdvance(self._button.text) + 48,
+                            metrics.height() + 12)
+
+    def editorEvent(self, event, model, option, index) -> bool:
+        if (event.type() == QtCore.QEvent.MouseButtonRelease
+                and event.button() == QtCore.Qt.LeftButton
+                and option.rect.contains(event.position().toPoint())):
+            ref_id = model.index(index.row(), 0).data(QtCore.Qt.UserRole)
+            if ref_id is not None:
+                self.viewRequested.emit(ref_id)
+            return True
+        return super().editorEvent(event, model, option, index)
 
 
 class MainWindow(QtWidgets.QMainWindow):
@@ -71,6 +705,12 @@ class MainWindow(QtWidgets.QMainWindow):
     Professional Modern Main Window
     """
 
+    # Stylesheet text, read once and shared by every window
+    _qss: Optional[str] = None
+
+    # Longest closeEvent waits for pool tasks before closing the database
+    CLOSE_WAIT_MS = 3000
+
     def __init__(self, config_manager: ConfigManager, logger_manager: LoggerManager):
         super().__init__()
         self.config_manager = config_manager
@@ -78,57 +718,91 @@ class MainWindow(QtWidgets.QMainWindow):
         self.logger = logging.getLogger(__name__)
 
         self.config = config_manager.config
-        self.db = DatabaseManager(self.config.db_path)
+        self.db: Optional[DatabaseManager] = None  # set by _on_database_opened
         self.worker_manager = WorkerManager()
+        self._bibtex_exporter = BibTeXExporter()  # reused by _copy_reference_bibtex
+
+        # PDF listing for the input directory (see _input_pdfs)
+        self._pdf_files: List[Path] = []
+        self._pdf_cache_key = None
+
+        # Readiness is re-validated once selection changes settle
+        self._check_timer = QtCore.QTimer(self)
+        self._check_timer.setSingleShot(True)
+        self._check_timer.setInterval(150)
+        self._check_timer.timeout.connect(self._do_check_ready)
+
+        # Shared animation timeline (see _apply_animations)
+        self.animation_driver = AnimationDriver(500, self)
 
-        # Animation objects
-        self.animations = []
+        # Frame cap for repaints while a worker is streaming signals
+        self.update_coalescer = UpdateCoalescer(self)
 
         self._setup_ui()
+
+        # Open the database off the UI thread so it doesn't delay first paint
+        self._db_opener = DatabaseOpener(self.config.db_path)
+        self._db_opener.opened.connect(self._on_database_opened)
+        self._db_opener.failed.connect(self._on_database_failed)
+        QtCore.QThreadPool.globalInstance().start(self._db_opener)
+
         self._setup_connections()
         self._load_state()
         self._apply_animations()
 
     def _setup_ui(self):
         """Setup professional user interface"""
-        self.setWindowTitle("IEEE Reference Extractor - Enterprise Edition v3.0")
-        self.resize(self.config.window_width, self.config.window_height)
-        self.setMinimumSize(1200, 800)
-
-        # Central widget with modern layout
-        central = QtWidgets.QWidget()
-        self.setCentralWidget(central)
-        main_layout = QtWidgets.QVBoxLayout(central)
-        main_layout.setContentsMargins(0, 0, 0, 0)
-        main_layout.setSpacing(0)
-
-        # Top navigation bar
-        nav_bar = self._create_navigation_bar()
-        main_layout.addWidget(nav_bar)
-
-        # Content area with sidebar
-        content_splitter = QtWidgets.QSplitter(QtCore.Qt.Horizontal)
-
-        # Left sidebar
-        sidebar = self._create_sidebar()
-        content_splitter.addWidget(sidebar)
-
-        # Main content area
-        content = self._create_content_area()
-        content_splitter.addWidget(content)
-
-        # Set splitter proportions
-        content_splitter.setStretchFactor(0, 1)
-        content_splitter.setStretchFactor(1, 3)
-        content_splitter.setSizes([300, 900])
-
-        main_layout.addWidget(content_splitter, 1)
-
-        # Bottom status bar
-        self._create_modern_status_bar()
-
-        # Apply professional styles
-        self._apply_professional_styles()
+        # Build with painting and signals off so the ~40 adds below don't
+        # each trigger an update; the stylesheet goes on first so children
+        # are polished once against it instead of re-polished afterwards
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
+        try:
+            self.setWindowTitle("IEEE Reference Extractor - Enterprise Edition v3.0")
+            self.resize(self.config.window_width, self.config.window_height)
+            self.setMinimumSize(1200, 800)
+
+            # Apply professional styles
+            self._apply_professional_styles()
+
+            # Central widget with modern layout
+            central = QtWidgets.QWidget()
+            central.setUpdatesEnabled(False)
+            self.setCentralWidget(central)
+            main_layout = QtWidgets.QVBoxLayout(central)
+            main_layout.setContentsMargins(0, 0, 0, 0)
+            main_layout.setSpacing(0)
+
+            # Top navigation bar
+            nav_bar = self._create_navigation_bar()
+            main_layout.addWidget(nav_bar)
+
+            # Content area with sidebar
+            content_splitter = QtWidgets.QSplitter(QtCore.Qt.Horizontal)
+
+            # Left sidebar
+            sidebar = self._create_sidebar()
+            content_splitter.addWidget(sidebar)
+
+            # Main content area
+            content = self._create_content_area()
+            content_splitter.addWidget(content)
+
+            # Set splitter proportions
+            content_splitter.setStretchFactor(0, 1)
+            content_splitter.setStretchFactor(1, 3)
+            content_splitter.setSizes([300, 900])
+
+            main_layout.addWidget(content_splitter, 1)
+            central.setUpdatesEnabled(True)
+
+            # Bottom status bar
+            self._create_modern_status_bar()
+        finally:
+            self.blockSignals(False)
+            self.setUpdatesEnabled(True)
+
+        self.ensurePolished()
 
     def _create_navigation_bar(self) -> QtWidgets.QWidget:
         """Create modern navigation bar"""
@@ -142,8 +816,9 @@ class MainWindow(QtWidgets.QMainWindow):
         # Logo and title
         logo_title = QtWidgets.QHBoxLayout()
 
-        logo = QtWidgets.QLabel("📚")
-        logo.setStyleSheet("font-size: 32px;")
+        logo = QtWidgets.QLabel()
+        logo.setObjectName("navLogo")
+        logo.setPixmap(emoji_icon("📚", 32).pixmap(32, 32))
 
         title_layout = QtWidgets.QVBoxLayout()
         title = QtWidgets.QLabel("IEEE Reference Extractor")
@@ -161,19 +836,19 @@ class MainWindow(QtWidgets.QMainWindow):
         logo_title.addSpacing(20)
 
         # Action buttons
-        self.theme_btn = QtWidgets.QPushButton("🌙")
+        self.theme_btn = QtWidgets.QPushButton(emoji_icon("🌙"), "")
         self.theme_btn.setObjectName("iconButton")
         self.theme_btn.setFixedSize(40, 40)
         self.theme_btn.setCursor(QtCore.Qt.PointingHandCursor)
         self.theme_btn.setToolTip("Toggle Theme")
 
-        self.settings_btn = QtWidgets.QPushButton("⚙️")
+        self.settings_btn = QtWidgets.QPushButton(emoji_icon("⚙️"), "")
         self.settings_btn.setObjectName("iconButton")
         self.settings_btn.setFixedSize(40, 40)
         self.settings_btn.setCursor(QtCore.Qt.PointingHandCursor)
         self.settings_btn.setToolTip("Settings")
 
-        self.help_btn = QtWidgets.QPushButton("❓")
+        self.help_btn = QtWidgets.QPushButton(emoji_icon("❓"), "")
         self.help_btn.setObjectName("iconButton")
         self.help_btn.setFixedSize(40, 40)
         self.help_btn.setCursor(QtCore.Qt.PointingHandCursor)
@@ -387,8 +1062,9 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # Status label with icon
         status_layout = QtWidgets.QHBoxLayout()
-        self.status_icon = QtWidgets.QLabel("⏳")
-        self.status_icon.setStyleSheet("font-size: 20px;")
+        self.status_icon = QtWidgets.QLabel()
+        self.status_icon.setObjectName("statusIcon")
+        self._set_status_icon("⏳")
 
         self.status_lbl = QtWidgets.QLabel("Ready to process")
         self.status_lbl.setObjectName("statusLabel")
@@ -398,12 +1074,19 @@ class MainWindow(QtWidgets.QMainWindow):
         status_layout.addStretch()
 
         # Progress bar
-        self.progress_bar = QtWidgets.QProgressBar()
+        self.progress_bar = FastProgressBar()
         self.progress_bar.setObjectName("modernProgress")
         self.progress_bar.setMinimumHeight(35)
         self.progress_bar.setTextVisible(True)
         self.progress_bar.setFormat("%v / %m PDFs (%p%)")
 
+        # Worker progress is applied at most once per frame (~30 Hz)
+        self._pending_progress = None
+        self._progress_timer = QtCore.QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(33)
+        self._progress_timer.timeout.connect(self._flush_progress)
+
         # Current file label
         self.current_file_lbl = QtWidgets.QLabel("")
         self.current_file_lbl.setObjectName("currentFileLabel")
@@ -415,10 +1098,15 @@ class MainWindow(QtWidgets.QMainWindow):
 
         return frame
 
+    def _set_status_icon(self, ch: str):
+        """Show a cached emoji pixmap in the status label"""
+        self.status_icon.setPixmap(emoji_icon(ch, 20).pixmap(20, 20))
+
     def _create_modern_tabs(self) -> QtWidgets.QTabWidget:
         """Create modern tabbed interface"""
         tabs = QtWidgets.QTabWidget()
         tabs.setObjectName("modernTabs")
+        tabs.tabBar().setObjectName("modernTabBar")
         tabs.setDocumentMode(True)
 
         # Processing Log
@@ -427,9 +1115,9 @@ class MainWindow(QtWidgets.QMainWindow):
         log_layout.setContentsMargins(10, 10, 10, 10)
 
         log_toolbar = QtWidgets.QHBoxLayout()
-        clear_log_btn = QtWidgets.QPushButton("🗑️ Clear")
+        clear_log_btn = QtWidgets.QPushButton(emoji_icon("🗑️"), "Clear")
         clear_log_btn.setObjectName("toolbarButton")
-        export_log_btn = QtWidgets.QPushButton("💾 Export")
+        export_log_btn = QtWidgets.QPushButton(emoji_icon("💾"), "Export")
         export_log_btn.setObjectName("toolbarButton")
 
         log_toolbar.addWidget(QtWidgets.QLabel("Processing Log"))
@@ -440,22 +1128,80 @@ class MainWindow(QtWidgets.QMainWindow):
         self.log_text = QtWidgets.QPlainTextEdit()
         self.log_text.setReadOnly(True)
         self.log_text.setObjectName("logText")
-        self.log_text.setFont(QtGui.QFont("Consolas", 9))
+        self.log_text.setFont(cached_font("Consolas", 9))
+        self._tune_plain_text(self.log_text)
+        self.log_text.setMaximumBlockCount(5000)
+        self.log_text.setCenterOnScroll(False)
+
+        # Log lines are buffered and appended in one batch per 50 ms
+        self._log_buf = []
+        self._log_status = None
+        self._log_flush_timer = QtCore.QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(50)
+        self._log_flush_timer.timeout.connect(self._flush_log)
 
         log_layout.addLayout(log_toolbar)
         log_layout.addWidget(self.log_text)
 
-        clear_log_btn.clicked.connect(self.log_text.clear)
+        clear_log_btn.clicked.connect(self._clear_log)
+
+        tabs.addTab(log_widget, emoji_icon("📋"), "Processing Log")
 
-        tabs.addTab(log_widget, "📋 Processing Log")
+        # The remaining tabs are built the first time they are opened, so
+        # startup does not pay for their widgets or database queries
+        self.preview_text = None
+        self.db_table = None
+        self.stats_text = None
+        self._tab_builders = {}
+        for builder, icon, label in (
+            (self._create_preview_tab, "👁️", "Output Preview"),
+            (self._create_database_tab, "💾", "Database"),
+            (self._create_statistics_tab, "📊", "Statistics"),
+        ):
+            index = tabs.addTab(QtWidgets.QWidget(), emoji_icon(icon), label)
+            self._tab_builders[index] = builder
 
-        # Output Preview
+        tabs.currentChanged.connect(self._on_tab_changed)
+        self.tabs = tabs
+
+        return tabs
+
+    @staticmethod
+    def _tune_plain_text(editor: QtWidgets.QPlainTextEdit):
+        """Configure a read-only monospace view for cheap appends and resizes"""
+        editor.setLineWrapMode(QtWidgets.QPlainTextEdit.NoWrap)
+        editor.setWordWrapMode(QtGui.QTextOption.NoWrap)
+        editor.setUndoRedoEnabled(False)
+        editor.setTabStopDistance(4 * QtGui.QFontMetricsF(editor.font()).horizontalAdvance(' '))
+
+    @QtCore.Slot(int)
+    def _on_tab_changed(self, index: int):
+        """Replace a placeholder tab with its real content on first activation"""
+        builder = self._tab_builders.pop(index, None)
+        if builder is None:
+            return
+
+        icon = self.tabs.tabIcon(index)
+        label = self.tabs.tabText(index)
+        placeholder = self.tabs.widget(index)
+
+        self.tabs.blockSignals(True)
+        self.tabs.removeTab(index)
+        self.tabs.insertTab(index, builder(), icon, label)
+        self.tabs.setCurrentIndex(index)
+        self.tabs.blockSignals(False)
+
+        placeholder.deleteLater()
+
+    def _create_preview_tab(self) -> QtWidgets.QWidget:
+        """Create output preview tab"""
         preview_widget = QtWidgets.QWidget()
         preview_layout = QtWidgets.QVBoxLayout(preview_widget)
         preview_layout.setContentsMargins(10, 10, 10, 10)
 
         preview_toolbar = QtWidgets.QHBoxLayout()
-        copy_preview_btn = QtWidgets.QPushButton("📋 Copy")
+        copy_preview_btn = QtWidgets.QPushButton(emoji_icon("📋"), "Copy")
         copy_preview_btn.setObjectName("toolbarButton")
 
         preview_toolbar.addWidget(QtWidgets.QLabel("Output Preview"))
@@ -465,22 +1211,13 @@ class MainWindow(QtWidgets.QMainWindow):
         self.preview_text = QtWidgets.QPlainTextEdit()
         self.preview_text.setReadOnly(True)
         self.preview_text.setObjectName("previewText")
-        self.preview_text.setFont(QtGui.QFont("Courier New", 9))
+        self.preview_text.setFont(cached_font("Courier New", 9))
+        self._tune_plain_text(self.preview_text)
 
         preview_layout.addLayout(preview_toolbar)
         preview_layout.addWidget(self.preview_text)
 
-        tabs.addTab(preview_widget, "👁️ Output Preview")
-
-        # Database View
-        db_widget = self._create_database_tab()
-        tabs.addTab(db_widget, "💾 Database")
-
-        # Statistics
-        stats_widget = self._create_statistics_tab()
-        tabs.addTab(stats_widget, "📊 Statistics")
-
-        return tabs
+        return preview_widget
 
     def _create_database_tab(self) -> QtWidgets.QWidget:
         """Create database view tab"""
@@ -491,42 +1228,79 @@ class MainWindow(QtWidgets.QMainWindow):
         # Toolbar
         toolbar = QtWidgets.QHBoxLayout()
 
-        refresh_btn = QtWidgets.QPushButton("🔄 Refresh")
+        refresh_btn = QtWidgets.QPushButton(emoji_icon("🔄"), "Refresh")
         refresh_btn.setObjectName("toolbarButton")
         refresh_btn.clicked.connect(self._refresh_database_view)
 
-        export_db_btn = QtWidgets.QPushButton("💾 Export")
+        export_db_btn = QtWidgets.QPushButton(emoji_icon("💾"), "Export")
         export_db_btn.setObjectName("toolbarButton")
         export_db_btn.clicked.connect(self._export_database)
 
-        import_db_btn = QtWidgets.QPushButton("📂 Import")
+        import_db_btn = QtWidgets.QPushButton(emoji_icon("📂"), "Import")
         import_db_btn.setObjectName("toolbarButton")
         import_db_btn.clicked.connect(self._import_database)
 
-        search_input = QtWidgets.QLineEdit()
-        search_input.setPlaceholderText("🔍 Search references...")
-        search_input.setObjectName("searchInput")
-        search_input.setMinimumWidth(300)
+        fit_columns_btn = QtWidgets.QPushButton(emoji_icon("↔️"), "Fit Columns")
+        fit_columns_btn.setObjectName("toolbarButton")
+
+        self.search_input = QtWidgets.QLineEdit()
+        self.search_input.setPlaceholderText("🔍 Search references...")
+        self.search_input.setObjectName("searchInput")
+        self.search_input.setMinimumWidth(300)
+
+        # Query only once typing pauses, not on every keystroke
+        self._pending_query = ""
+        self._search_timer = QtCore.QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(250)
+        self._search_timer.timeout.connect(self._do_search)
+        self.search_input.textChanged.connect(self._on_search_text_changed)
 
         toolbar.addWidget(QtWidgets.QLabel("Database"))
         toolbar.addStretch()
-        toolbar.addWidget(search_input)
+        toolbar.addWidget(self.search_input)
         toolbar.addWidget(refresh_btn)
         toolbar.addWidget(export_db_btn)
         toolbar.addWidget(import_db_btn)
+        toolbar.addWidget(fit_columns_btn)
 
         # Table
-        self.db_table = QtWidgets.QTableWidget()
+        self.db_table = QtWidgets.QTableView()
         self.db_table.setObjectName("modernTable")
-        self.db_table.setColumnCount(7)
-        self.db_table.setHorizontalHeaderLabels([
-            "Title", "Authors", "Year", "Journal", "DOI", "Confidence", "Actions"
-        ])
-        self.db_table.horizontalHeader().setStretchLastSection(False)
-        self.db_table.horizontalHeader().setSectionResizeMode(0, QtWidgets.QHeaderView.Stretch)
+        self.db_table.setModel(ReferenceTableModel(self.db, self.db_table))
+        self.db_table.model().modelReset.connect(self._update_record_count)
+        self.db_table.model().rowsInserted.connect(self._update_record_count)
+
+        # Column widths are measured once from representative text instead of
+        # being re-fitted on every refresh; "Fit Columns" sizes on demand
+        header = self.db_table.horizontalHeader()
+        header.setStretchLastSection(False)
+        # Caps and tracking live on the header font rather than in the QSS
+        header_font = QtGui.QFont(header.font())
+        header_font.setCapitalization(QtGui.QFont.AllUppercase)
+        header_font.setLetterSpacing(QtGui.QFont.AbsoluteSpacing, 0.5)
+        header.setFont(header_font)
+        metrics = QtGui.QFontMetrics(self.db_table.font())
+        header_font.setBold(True)  # as styled
+        header_metrics = QtGui.QFontMetrics(header_font)
+        padding = 24
+        for column, sample in enumerate(ReferenceTableModel.COLUMN_SAMPLES):
+            title = ReferenceTableModel.HEADERS[column].upper()
+            width = max(metrics.horizontalAdvance(sample), header_metrics.horizontalAdvance(title))
+            header.setSectionResizeMode(column, QtWidgets.QHeaderView.Interactive)
+            self.db_table.setColumnWidth(column, width + padding)
+        self.db_table.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
+        # Rows arrive in SQL order; view-side sorting would have to load every block
+        self.db_table.setSortingEnabled(False)
         self.db_table.setAlternatingRowColors(True)
         self.db_table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
         self.db_table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.db_table.setCursor(QtCore.Qt.PointingHandCursor)
+        view_delegate = ViewButtonDelegate(self.db_table)
+        view_delegate.viewRequested.connect(self._on_view_requested)
+        self.db_table.setItemDelegateForColumn(ReferenceTableModel.ACTIONS_COLUMN, view_delegate)
+        self.db_table.doubleClicked.connect(self._on_db_table_double_clicked)
+        fit_columns_btn.clicked.connect(self.db_table.resizeColumnsToContents)
 
         # Record count
         self.record_count_lbl = QtWidgets.QLabel("Total Records: 0")
@@ -536,6 +1310,8 @@ class MainWindow(QtWidgets.QMainWindow):
         layout.addWidget(self.db_table)
         layout.addWidget(self.record_count_lbl)
 
+        self._update_record_count()
+
         return widget
 
     def _create_statistics_tab(self) -> QtWidgets.QWidget:
@@ -547,7 +1323,7 @@ class MainWindow(QtWidgets.QMainWindow):
         # Toolbar
         toolbar = QtWidgets.QHBoxLayout()
 
-        refresh_stats_btn = QtWidgets.QPushButton("🔄 Refresh")
+        refresh_stats_btn = QtWidgets.QPushButton(emoji_icon("🔄"), "Refresh")
         refresh_stats_btn.setObjectName("toolbarButton")
         refresh_stats_btn.clicked.connect(self._show_statistics)
 
@@ -556,12 +1332,22 @@ class MainWindow(QtWidgets.QMainWindow):
         toolbar.addWidget(refresh_stats_btn)
 
         # Stats display
-        self.stats_text = QtWidgets.QTextEdit()
-        self.stats_text.setReadOnly(True)
+        # Read-only rich text needs no editor machinery: a label in a scroll area
+        self.stats_text = QtWidgets.QLabel()
         self.stats_text.setObjectName("statsDisplay")
+        self.stats_text.setTextFormat(QtCore.Qt.RichText)
+        self.stats_text.setTextInteractionFlags(QtCore.Qt.TextBrowserInteraction)
+        self.stats_text.setWordWrap(True)
+        self.stats_text.setAlignment(QtCore.Qt.AlignTop | QtCore.Qt.AlignLeft)
+        self._stats_html = None
+
+        stats_scroll = QtWidgets.QScrollArea()
+        stats_scroll.setWidgetResizable(True)
+        stats_scroll.setFrameShape(QtWidgets.QFrame.NoFrame)
+        stats_scroll.setWidget(self.stats_text)
 
         layout.addLayout(toolbar)
-        layout.addWidget(self.stats_text)
+        layout.addWidget(stats_scroll)
 
         # Load initial stats
         self._show_statistics()
@@ -579,7 +1365,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.status_bar.addWidget(self.status_msg)
 
         # Right side - indicators
-        self.db_indicator = QtWidgets.QLabel("💾 DB: Connected")
+        self.db_indicator = QtWidgets.QLabel("💾 DB: Opening...")
         self.db_indicator.setObjectName("statusIndicator")
 
         self.api_indicator = QtWidgets.QLabel("🌐 API: Ready")
@@ -588,483 +1374,83 @@ class MainWindow(QtWidgets.QMainWindow):
         self.time_indicator = QtWidgets.QLabel(f"🕒 {datetime.now().strftime('%H:%M:%S')}")
         self.time_indicator.setObjectName("statusIndicator")
 
+        # Fixed-width digits in a fixed-width label, so the per-second tick
+        # repaints the label without re-flowing the status bar
+        time_font = QtGui.QFont()
+        time_font.setStyleHint(QtGui.QFont.Monospace)
+        time_font.setFamily("monospace")
+        time_font.setPixelSize(11)  # matches #statusIndicator
+        if hasattr(time_font, "setFeature"):  # Qt >= 6.7
+            time_font.setFeature(QtGui.QFont.Tag("tnum"), 1)
+        self.time_indicator.setFont(time_font)
+        self.time_indicator.setFixedWidth(
+            QtGui.QFontMetrics(time_font).horizontalAdvance("🕒 00:00:00") + 32
+        )
+
         self.status_bar.addPermanentWidget(self.db_indicator)
         self.status_bar.addPermanentWidget(self.api_indicator)
         self.status_bar.addPermanentWidget(self.time_indicator)
 
-        # Update time every second
-        self.time_timer = QtCore.QTimer()
+        # Update time every second (only while the window is on screen)
+        self._last_time_str = ""
+        self.time_timer = QtCore.QTimer(self)
+        self.time_timer.setInterval(1000)
         self.time_timer.timeout.connect(self._update_time)
-        self.time_timer.start(1000)
 
+    @QtCore.Slot()
     def _update_time(self):
         """Update time indicator"""
-        self.time_indicator.setText(f"🕒 {datetime.now().strftime('%H:%M:%S')}")
+        time_str = datetime.now().strftime('%H:%M:%S')
+        if time_str == self._last_time_str:
+            return
+        self._last_time_str = time_str
+        self.time_indicator.setText(f"🕒 {time_str}")
+
+    def _sync_time_timer(self):
+        """Run the clock only while the window is visible and not minimized"""
+        if self.isVisible() and not self.isMinimized():
+            if not self.time_timer.isActive():
+                self._update_time()
+                self.time_timer.start()
+        else:
+            self.time_timer.stop()
+
+    def showEvent(self, event):
+        """Resume the clock when shown"""
+        super().showEvent(event)
+        self._sync_time_timer()
+
+    def hideEvent(self, event):
+        """Stop idle repaints while hidden"""
+        super().hideEvent(event)
+        self._sync_time_timer()
+
+    def changeEvent(self, event):
+        """Stop idle repaints while minimized"""
+        super().changeEvent(event)
+        if event.type() == QtCore.QEvent.WindowStateChange:
+            self._sync_time_timer()
 
     def _apply_professional_styles(self):
         """Apply professional modern stylesheet"""
-        self.setStyleSheet("""
-            /* Main Window */
-            QMainWindow {
-                background-color: #F5F7FA;
-            }
-
-            /* Navigation Bar */
-            #navigationBar {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #667eea, stop:1 #764ba2);
-                border-bottom: 3px solid rgba(255,255,255,0.1);
-            }
-
-            #navTitle {
-                color: white;
-                font-size: 22px;
-                font-weight: bold;
-                letter-spacing: 0.5px;
-            }
-
-            #navSubtitle {
-                color: rgba(255,255,255,0.85);
-                font-size: 11px;
-                letter-spacing: 1px;
-            }
-
-            #iconButton {
-                background-color: rgba(255,255,255,0.15);
-                color: white;
-                border: none;
-                border-radius: 20px;
-                font-size: 18px;
-                font-weight: bold;
-            }
-
-            #iconButton:hover {
-                background-color: rgba(255,255,255,0.25);
-            }
-
-            #iconButton:pressed {
-                background-color: rgba(255,255,255,0.35);
-            }
-
-            /* Sidebar */
-            #sidebar {
-                background-color: #FFFFFF;
-                border-right: 1px solid #E5E9F2;
-            }
-
-            /* Modern Groups */
-            #modernGroup {
-                background-color: #FFFFFF;
-                border: 1px solid #E5E9F2;
-                border-radius: 12px;
-                padding: 15px;
-                margin: 5px;
-                font-weight: 600;
-                font-size: 13px;
-                color: #2D3748;
-            }
-
-            #modernGroup::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                padding: 5px 10px;
-                background-color: #FFFFFF;
-                border-radius: 6px;
-            }
-
-            /* Modern Buttons */
-            #modernButton_default {
-                background-color: #6C757D;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 12px 20px;
-                font-size: 14px;
-                font-weight: 600;
-            }
-
-            #modernButton_default:hover {
-                background-color: #5A6268;
-            }
-
-            #modernButton_primary {
-                background-color: #667eea;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 12px 20px;
-                font-size: 14px;
-                font-weight: 600;
-            }
-
-            #modernButton_primary:hover {
-                background-color: #5568d3;
-            }
-
-            #modernButton_success {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #56ab2f, stop:1 #a8e063);
-                color: white;
-                border: none;
-                border-radius: 10px;
-                padding: 15px 25px;
-                font-size: 16px;
-                font-weight: bold;
-                letter-spacing: 0.5px;
-            }
-
-            #modernButton_success:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #4a9428, stop:1 #91c956);
-            }
-
-            #modernButton_success:disabled {
-                background-color: #CCCCCC;
-            }
-
-            #modernButton_danger {
-                background-color: #E74C3C;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 12px 20px;
-                font-size: 14px;
-                font-weight: 600;
-            }
-
-            #modernButton_danger:hover {
-                background-color: #C0392B;
-            }
-
-            /* Stats Cards */
-            #statsCard {
-                background-color: #FFFFFF;
-                border: 1px solid #E5E9F2;
-                border-radius: 10px;
-                padding: 10px;
-            }
-
-            #statsTitle {
-                color: #718096;
-                font-size: 11px;
-                font-weight: 600;
-                text-transform: uppercase;
-                letter-spacing: 0.5px;
-            }
-
-            #statsValue {
-                color: #2D3748;
-                font-size: 24px;
-                font-weight: bold;
-                margin-top: 5px;
-            }
-
-            /* Labels */
-            #pathLabel {
-                color: #718096;
-                font-size: 11px;
-                font-style: italic;
-                padding: 5px;
-                background-color: #F7FAFC;
-                border-radius: 5px;
-            }
-
-            #sectionLabel {
-                color: #4A5568;
-                font-size: 12px;
-                font-weight: 600;
-                text-transform: uppercase;
-                letter-spacing: 0.5px;
-                margin-bottom: 5px;
-            }
-
-            #infoLabel {
-                color: #4A5568;
-                font-size: 12px;
-                font-weight: 500;
-                padding: 8px;
-                background-color: #EDF2F7;
-                border-radius: 6px;
-            }
-
-            /* Combo Boxes */
-            #modernCombo {
-                background-color: #FFFFFF;
-                border: 2px solid #E5E9F2;
-                border-radius: 8px;
-                padding: 10px;
-                font-size: 13px;
-                color: #2D3748;
-            }
-
-            #modernCombo:hover {
-                border: 2px solid #667eea;
-            }
-
-            #modernCombo::drop-down {
-                border: none;
-                padding-right: 10px;
-            }
-
-            /* Checkboxes */
-            #modernCheckbox {
-                color: #2D3748;
-                font-size: 13px;
-                spacing: 10px;
-                padding: 8px;
-            }
-
-            #modernCheckbox::indicator {
-                width: 20px;
-                height: 20px;
-                border: 2px solid #CBD5E0;
-                border-radius: 5px;
-                background-color: #FFFFFF;
-            }
-
-            #modernCheckbox::indicator:checked {
-                background-color: #667eea;
-                border-color: #667eea;
-                image: url(data:image/svg+xml;utf8,<svg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 24 24' fill='white'><path d='M9 16.17L4.83 12l-1.42 1.41L9 19 21 7l-1.41-1.41z'/></svg>);
-            }
-
-            #modernCheckbox::indicator:hover {
-                border-color: #667eea;
-            }
-
-            /* Progress Section */
-            #progressFrame {
-                background-color: #FFFFFF;
-                border: 1px solid #E5E9F2;
-                border-radius: 12px;
-            }
-
-            #statusLabel {
-                color: #2D3748;
-                font-size: 15px;
-                font-weight: 600;
-            }
-
-            #currentFileLabel {
-                color: #718096;
-                font-size: 12px;
-                font-style: italic;
-            }
-
-            #modernProgress {
-                border: 2px solid #E5E9F2;
-                border-radius: 17px;
-                background-color: #F7FAFC;
-                text-align: center;
-                color: #2D3748;
-                font-weight: bold;
-            }
-
-            #modernProgress::chunk {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #667eea, stop:1 #764ba2);
-                border-radius: 15px;
-            }
-
-            /* Tabs */
-            #modernTabs::pane {
-                border: 1px solid #E5E9F2;
-                border-radius: 8px;
-                background-color: #FFFFFF;
-                top: -1px;
-            }
-
-            #modernTabs::tab-bar {
-                left: 10px;
-            }
-
-            #modernTabs QTabBar::tab {
-                background-color: #F7FAFC;
-                border: 1px solid #E5E9F2;
-                border-bottom: none;
-                border-top-left-radius: 8px;
-                border-top-right-radius: 8px;
-                padding: 12px 20px;
-                margin-right: 2px;
-                color: #718096;
-                font-weight: 600;
-                font-size: 13px;
-            }
-
-            #modernTabs QTabBar::tab:selected {
-                background-color: #FFFFFF;
-                color: #667eea;
-                border-bottom: 3px solid #667eea;
-            }
-
-            #modernTabs QTabBar::tab:hover {
-                background-color: #EDF2F7;
-            }
-
-            /* Toolbar Buttons */
-            #toolbarButton {
-                background-color: #F7FAFC;
-                border: 1px solid #E5E9F2;
-                border-radius: 6px;
-                padding: 8px 15px;
-                font-size: 12px;
-                font-weight: 600;
-                color: #4A5568;
-            }
-
-            #toolbarButton:hover {
-                background-color: #EDF2F7;
-                border-color: #667eea;
-                color: #667eea;
-            }
-
-            /* Text Displays */
-            #logText, #previewText {
-                background-color: #FFFFFF;
-                border: 1px solid #E5E9F2;
-                border-radius: 8px;
-                padding: 10px;
-                color: #2D3748;
-            }
-
-            #statsDisplay {
-                background-color: #FFFFFF;
-                border: 1px solid #E5E9F2;
-                border-radius: 8px;
-                padding: 15px;
-            }
-
-            /* Table */
-            #modernTable {
-                background-color: #FFFFFF;
-                border: 1px solid #E5E9F2;
-                border-radius: 8px;
-                gridline-color: #E5E9F2;
-            }
-
-            #modernTable::item {
-                padding: 8px;
-                color: #2D3748;
-            }
-
-            #modernTable::item:selected {
-                background-color: #EBF4FF;
-                color: #2C5282;
-            }
-
-            #modernTable::item:alternate {
-                background-color: #F7FAFC;
-            }
-
-            QHeaderView::section {
-                background-color: #F7FAFC;
-                color: #4A5568;
-                padding: 10px;
-                border: none;
-                border-bottom: 2px solid #E5E9F2;
-                font-weight: 600;
-                font-size: 12px;
-                text-transform: uppercase;
-                letter-spacing: 0.5px;
-            }
-
-            /* Search Input */
-            #searchInput {
-                background-color: #FFFFFF;
-                border: 2px solid #E5E9F2;
-                border-radius: 8px;
-                padding: 8px 12px;
-                font-size: 13px;
-                color: #2D3748;
-            }
-
-            #searchInput:focus {
-                border-color: #667eea;
-            }
-
-            /* Status Bar */
-            #modernStatusBar {
-                background-color: #FFFFFF;
-                border-top: 1px solid #E5E9F2;
-                padding: 5px;
-            }
-
-            #statusMessage {
-                color: #4A5568;
-                font-size: 12px;
-                padding: 5px;
-            }
-
-            #statusIndicator {
-                color: #718096;
-                font-size: 11px;
-                padding: 5px 10px;
-                margin: 0 2px;
-                background-color: #F7FAFC;
-                border-radius: 5px;
-            }
-
-            /* Scrollbars */
-            QScrollBar:vertical {
-                background-color: #F7FAFC;
-                width: 12px;
-                border-radius: 6px;
-            }
-
-            QScrollBar::handle:vertical {
-                background-color: #CBD5E0;
-                border-radius: 6px;
-                min-height: 30px;
-            }
-
-            QScrollBar::handle:vertical:hover {
-                background-color: #A0AEC0;
-            }
-
-            QScrollBar:horizontal {
-                background-color: #F7FAFC;
-                height: 12px;
-                border-radius: 6px;
-            }
-
-            QScrollBar::handle:horizontal {
-                background-color: #CBD5E0;
-                border-radius: 6px;
-                min-width: 30px;
-            }
-
-            QScrollBar::handle:horizontal:hover {
-                background-color: #A0AEC0;
-            }
-
-            QScrollBar::add-line, QScrollBar::sub-line {
-                border: none;
-                background: none;
-            }
-
-            /* Tooltips */
-            QToolTip {
-                background-color: #2D3748;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 12px;
-                font-size: 12px;
-            }
-        """)
+        if MainWindow._qss is None:
+            MainWindow._qss = load_stylesheet(STYLESHEET_PATH)
+        self.setStyleSheet(MainWindow._qss)
 
     def _apply_animations(self):
         """Apply smooth animations"""
-        # Fade in animation for main window
-        self.opacity_effect = QtWidgets.QGraphicsOpacityEffect()
-        self.centralWidget().setGraphicsEffect(self.opacity_effect)
-
-        self.fade_in = QtCore.QPropertyAnimation(self.opacity_effect, b"opacity")
-        self.fade_in.setDuration(500)
-        self.fade_in.setStartValue(0)
-        self.fade_in.setEndValue(1)
-        self.fade_in.setEasingCurve(QtCore.QEasingCurve.InOutQuad)
-        self.fade_in.start()
+        # Fade the top-level window in; the compositor blends it, so the
+        # widget tree is never rendered through an offscreen opacity effect
+        self.setWindowOpacity(0.0)
+        self.animation_driver.pulse.connect(self.setWindowOpacity)
+        self.animation_driver.finished.connect(self._on_animations_finished)
+        self.animation_driver.start()
+
+    @QtCore.Slot()
+    def _on_animations_finished(self):
+        """Finish the fade fully opaque"""
+        self.animation_driver.pulse.disconnect(self.setWindowOpacity)
+        self.setWindowOpacity(1.0)
 
     def _setup_connections(self):
         """Setup signal connections"""
@@ -1081,8 +1467,9 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # Connect to logger
         qt_handler = self.logger_manager.get_qt_handler()
-        qt_handler.log_signal.connect(self._on_log_message)
+        qt_handler.log_signal.connect(self._on_log_records)
 
+    @QtCore.Slot()
     def _toggle_theme(self):
         """Toggle between light and dark theme"""
         # This would toggle themes - for now just show message
@@ -1091,6 +1478,7 @@ class MainWindow(QtWidgets.QMainWindow):
             "Theme switching feature - Light/Dark mode toggle"
         )
 
+    @QtCore.Slot()
     def _select_input(self):
         """Select input directory"""
         folder = QtWidgets.QFileDialog.getExistingDirectory(
@@ -1101,11 +1489,12 @@ class MainWindow(QtWidgets.QMainWindow):
             self.input_lbl.setText(folder)
 
             # Count PDFs
-            pdf_files = list(self.input_dir.glob("*.pdf"))
+            pdf_files = self._input_pdfs()
             self.pdf_count_lbl.setText(f"PDFs Found: {len(pdf_files)}")
 
             self._check_ready()
 
+    @QtCore.Slot()
     def _select_output(self):
         """Select output directory"""
         folder = QtWidgets.QFileDialog.getExistingDirectory(
@@ -1116,25 +1505,51 @@ class MainWindow(QtWidgets.QMainWindow):
             self.output_lbl.setText(folder)
             self._check_ready()
 
+    def _input_pdfs(self) -> List[Path]:
+        """
+        PDFs in the input directory, listed once and reused until the
+        directory changes (a different folder, or a new mtime)
+        """
+        try:
+            mtime = self.input_dir.stat().st_mtime
+        except OSError:
+            return []
+
+        key = (self.input_dir, mtime)
+        if key != self._pdf_cache_key:
+            try:
+                self._pdf_files = list_pdfs(self.input_dir)
+            except OSError as e:
+                self.logger.error(f"Failed to list PDFs in {self.input_dir}: {e}")
+                return []
+            self._pdf_cache_key = key
+        return self._pdf_files
+
     def _check_ready(self):
+        """Schedule a readiness check (coalesces bursts of changes)"""
+        self._check_timer.start()
+
+    @QtCore.Slot()
+    def _do_check_ready(self):
         """Check if ready to start"""
         ready = hasattr(self, 'input_dir') and hasattr(self, 'output_dir')
         self.start_btn.setEnabled(ready)
 
         if ready:
-            pdf_files = list(self.input_dir.glob("*.pdf"))
+            pdf_files = self._input_pdfs()
             if pdf_files:
-                self.status_icon.setText("✅")
+                self._set_status_icon("✅")
                 self.status_lbl.setText(f"Ready to process {len(pdf_files)} PDF file(s)")
             else:
-                self.status_icon.setText("⚠️")
+                self._set_status_icon("⚠️")
                 self.status_lbl.setText("No PDF files found in input directory")
                 self.start_btn.setEnabled(False)
 
+    @QtCore.Slot()
     def _start_extraction(self):
         """Start extraction process"""
         # Get PDF files
-        pdf_files = list(self.input_dir.glob("*.pdf"))
+        pdf_files = self._input_pdfs()
         if not pdf_files:
             QtWidgets.QMessageBox.warning(
                 self, "No PDFs Found",
@@ -1145,11 +1560,13 @@ class MainWindow(QtWidgets.QMainWindow):
         # Update UI
         self.start_btn.setEnabled(False)
         self.cancel_btn.setEnabled(True)
-        self.log_text.clear()
-        self.preview_text.clear()
+        self._clear_log()
+        if self.preview_text is not None:
+            self.preview_text.clear()
+        self._pending_progress = None
         self.progress_bar.setMaximum(len(pdf_files))
         self.progress_bar.setValue(0)
-        self.status_icon.setText("⏳")
+        self._set_status_icon("⏳")
         self.status_lbl.setText("Processing...")
 
         # Build config
@@ -1164,6 +1581,9 @@ class MainWindow(QtWidgets.QMainWindow):
             'enable_crossref': self.config.enable_crossref,
             'enable_doi_lookup': self.config.enable_doi_lookup,
             'db_path': self.config.db_path,
+            'cache_dir': self.config.cache_dir,
+            'crossref_mailto': self.config.crossref_mailto,
+            'max_workers': self.config.max_workers,
             'save_to_database': True
         }
 
@@ -1172,13 +1592,15 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # Connect worker signals
         worker.progress.connect(self._on_progress)
-        worker.log_message.connect(self._on_log_message)
+        worker.log_messages.connect(self._on_log_records)
         worker.pdf_completed.connect(self._on_pdf_completed)
         worker.finished.connect(self._on_finished)
         worker.error.connect(self._on_error)
+        self.update_coalescer.start()
 
         self.logger.info(f"Started extraction of {len(pdf_files)} PDFs")
 
+    @QtCore.Slot()
     def _cancel_extraction(self):
         """Cancel extraction"""
         reply = QtWidgets.QMessageBox.question(
@@ -1189,44 +1611,85 @@ class MainWindow(QtWidgets.QMainWindow):
 
         if reply == QtWidgets.QMessageBox.Yes:
             self.worker_manager.cancel_extraction()
-            self.status_icon.setText("⏹️")
+            self._set_status_icon("⏹️")
             self.status_lbl.setText("Cancelling...")
 
+    @QtCore.Slot(int, int, str)
     def _on_progress(self, current: int, total: int, status: str):
         """Handle progress update"""
-        self.progress_bar.setValue(current)
+        self._pending_progress = (current, total, status)
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    @QtCore.Slot()
+    def _flush_progress(self):
+        """Apply the latest queued progress update"""
+        if self._pending_progress is None:
+            return
+        current, total, status = self._pending_progress
+        self._pending_progress = None
+
+        if total != self.progress_bar.maximum():
+            self.progress_bar.setMaximum(total)
+        if current != self.progress_bar.value():
+            self.progress_bar.setValue(current)
         self.current_file_lbl.setText(status)
         self.pdfs_card.update_value(f"{current}/{total}")
 
+    @QtCore.Slot(str, str)
     def _on_log_message(self, level: str, message: str):
         """Handle log message"""
-        # Color-coded log messages
-        colors = {
-            "DEBUG": "#718096",
-            "INFO": "#2D3748",
-            "WARNING": "#ED8936",
-            "ERROR": "#E53E3E",
-            "CRITICAL": "#C53030"
-        }
-        color = colors.get(level, "#2D3748")
-
+        prefix = _LOG_PREFIXES.get(level, _LOG_PREFIXES["INFO"])
         timestamp = datetime.now().strftime("%H:%M:%S")
-        formatted = f'<span style="color: {color};">[{timestamp}] [{level}] {message}</span>'
+        self._append_log(f"{prefix}[{timestamp}] [{level}] {message}</span>")
+        self._log_status = message[:100]
 
-        self.log_text.appendHtml(formatted)
-        self.status_msg.setText(message[:100])
+    @QtCore.Slot(list)
+    def _on_log_records(self, records: list):
+        """Handle a batch of (level, message) records from the log handler or worker"""
+        for level, message in records:
+            self._on_log_message(level, message)
 
+    @QtCore.Slot(str, int, float)
     def _on_pdf_completed(self, pdf_name: str, ref_count: int, time: float):
         """Handle PDF completion"""
-        self.log_text.appendHtml(
-            f'<span style="color: #48BB78;">✓ Completed: {pdf_name} - {ref_count} references in {time:.2f}s</span>'
+        self._append_log(
+            f'{_LOG_PREFIXES["SUCCESS"]}✓ Completed: {pdf_name} - {ref_count} references in {time:.2f}s</span>'
         )
 
+    def _append_log(self, html: str):
+        """Queue one log line for the next batched flush"""
+        self._log_buf.append(html)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    @QtCore.Slot()
+    def _flush_log(self):
+        """Append all queued log lines in a single document update"""
+        if self._log_buf:
+            # One paragraph per line keeps one block per line for the block cap
+            self.log_text.appendHtml("".join(f"<p>{line}</p>" for line in self._log_buf))
+            self._log_buf.clear()
+        if self._log_status is not None:
+            self.status_msg.setText(self._log_status)
+            self._log_status = None
+
+    @QtCore.Slot()
+    def _clear_log(self):
+        """Clear the log view and anything still queued for it"""
+        self._log_buf.clear()
+        self.log_text.clear()
+
+    @QtCore.Slot(dict)
     def _on_finished(self, stats: Dict[str, Any]):
         """Handle extraction finished"""
+        self.update_coalescer.stop()
+        self._flush_progress()
+        self.logger_manager.get_qt_handler().flush()
+        self._flush_log()
         self.start_btn.setEnabled(True)
         self.cancel_btn.setEnabled(False)
-        self.status_icon.setText("✅")
+        self._set_status_icon("✅")
         self.status_lbl.setText("Extraction completed successfully!")
         self.current_file_lbl.setText("")
 
@@ -1254,19 +1717,17 @@ class MainWindow(QtWidgets.QMainWindow):
         msg.exec()
 
         if self.auto_open_checkbox.isChecked() and msg.clickedButton() and msg.clickedButton().text() == "📂 Open Output Folder":
-            import os
-            import subprocess
-            if os.name == 'nt':  # Windows
-                os.startfile(self.output_dir)
-            elif os.name == 'posix':  # macOS and Linux
-                subprocess.Popen(['open' if 'darwin' in os.sys.platform else 'xdg-open', self.output_dir])
+            # The OS hand-off can stall for a while; keep it off the UI thread
+            QtCore.QThreadPool.globalInstance().start(functools.partial(_open_folder, str(self.output_dir)))
 
         # Refresh database view
         self._refresh_database_view()
 
+    @QtCore.Slot(str)
     def _on_error(self, error: str):
         """Handle error"""
-        self.status_icon.setText("❌")
+        self.update_coalescer.stop()
+        self._set_status_icon("❌")
         self.status_lbl.setText("Error occurred")
 
         QtWidgets.QMessageBox.critical(
@@ -1303,47 +1764,26 @@ class MainWindow(QtWidgets.QMainWindow):
         content_layout.addWidget(title_label)
 
         # Create info sections
-        info_html = f"""
-        <div style='background-color: #F7FAFC; padding: 15px; border-radius: 8px; border-left: 4px solid #667eea; margin: 10px 0;'>
-            <p><b style='color: #4A5568;'>Authors:</b><br>{ref.authors}</p>
-        </div>
-
-        <div style='background-color: #F7FAFC; padding: 15px; border-radius: 8px; border-left: 4px solid #667eea; margin: 10px 0;'>
-            <p><b style='color: #4A5568;'>Publication Details:</b><br>
-            <b>Year:</b> {ref.year}<br>
-            <b>Journal/Conference:</b> {ref.journal or 'N/A'}<br>
-            <b>Volume:</b> {ref.volume or 'N/A'}<br>
-            <b>Issue:</b> {ref.issue or 'N/A'}<br>
-            <b>Pages:</b> {ref.pages or 'N/A'}</p>
-        </div>
-
-        <div style='background-color: #F7FAFC; padding: 15px; border-radius: 8px; border-left: 4px solid #667eea; margin: 10px 0;'>
-            <p><b style='color: #4A5568;'>Identifiers:</b><br>
-            <b>DOI:</b> {ref.doi or 'N/A'}<br>
-            <b>Reference Number:</b> {ref.ref_number or 'N/A'}</p>
-        </div>
-
-        <div style='background-color: #F7FAFC; padding: 15px; border-radius: 8px; border-left: 4px solid #667eea; margin: 10px 0;'>
-            <p><b style='color: #4A5568;'>Source:</b><br>
-            <b>PDF File:</b> {ref.pdf_source}<br>
-            <b>Citation Type:</b> {ref.citation_type}<br>
-            <b>Confidence Score:</b> <span style='color: {'#48BB78' if ref.confidence_score >= 0.8 else '#ECC94B' if ref.confidence_score >= 0.6 else '#F56565'}; font-weight: bold;'>{ref.confidence_score:.2f}</span></p>
-        </div>
-        """
+        info_html = _REFERENCE_HTML.substitute(
+            authors=ref.authors,
+            year=ref.year,
+            journal=ref.journal or 'N/A',
+            volume=ref.volume or 'N/A',
+            issue=ref.issue or 'N/A',
+            pages=ref.pages or 'N/A',
+            doi=ref.doi or 'N/A',
+            ref_number=ref.ref_number or 'N/A',
+            pdf_source=ref.pdf_source,
+            citation_type=ref.citation_type,
+            confidence_color=confidence_color(ref.confidence_score),
+            confidence=f"{ref.confidence_score:.2f}",
+        )
 
         if ref.abstract:
-            info_html += f"""
-            <div style='background-color: #F7FAFC; padding: 15px; border-radius: 8px; border-left: 4px solid #667eea; margin: 10px 0;'>
-                <p><b style='color: #4A5568;'>Abstract:</b><br>{ref.abstract}</p>
-            </div>
-            """
+            info_html += _REFERENCE_SECTION_HTML.substitute(label="Abstract", body=ref.abstract)
 
         if ref.keywords:
-            info_html += f"""
-            <div style='background-color: #F7FAFC; padding: 15px; border-radius: 8px; border-left: 4px solid #667eea; margin: 10px 0;'>
-                <p><b style='color: #4A5568;'>Keywords:</b><br>{ref.keywords}</p>
-            </div>
-            """
+            info_html += _REFERENCE_SECTION_HTML.substitute(label="Keywords", body=ref.keywords)
 
         info_text = QtWidgets.QTextEdit()
         info_text.setHtml(info_html)
@@ -1359,13 +1799,13 @@ class MainWindow(QtWidgets.QMainWindow):
         button_layout = QtWidgets.QHBoxLayout()
 
         # Copy BibTeX button
-        copy_btn = QtWidgets.QPushButton("📋 Copy BibTeX")
+        copy_btn = QtWidgets.QPushButton(emoji_icon("📋"), "Copy BibTeX")
         copy_btn.setObjectName("toolbarButton")
         copy_btn.clicked.connect(lambda: self._copy_reference_bibtex(ref))
 
         # Open DOI button
         if ref.doi:
-            doi_btn = QtWidgets.QPushButton("🔗 Open DOI")
+            doi_btn = QtWidgets.QPushButton(emoji_icon("🔗"), "Open DOI")
             doi_btn.setObjectName("toolbarButton")
             doi_btn.clicked.connect(lambda: self._open_doi(ref.doi))
             button_layout.addWidget(doi_btn)
@@ -1386,9 +1826,6 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _copy_reference_bibtex(self, ref):
         """Copy reference as BibTeX to clipboard"""
-        from .exporter import BibTeXExporter
-        from .reference_parser import ParsedReference
-
         # Convert database reference to ParsedReference
         parsed_ref = ParsedReference(
             ref_number=ref.ref_number or 0,
@@ -1405,8 +1842,7 @@ class MainWindow(QtWidgets.QMainWindow):
             confidence=ref.confidence_score
         )
 
-        exporter = BibTeXExporter()
-        bibtex = exporter._to_bibtex(parsed_ref)
+        bibtex = self._bibtex_exporter._to_bibtex(parsed_ref)
 
         # Copy to clipboard
         clipboard = QtWidgets.QApplication.clipboard()
@@ -1420,55 +1856,75 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _open_doi(self, doi):
         """Open DOI in web browser"""
-        import webbrowser
         url = f"https://doi.org/{doi}"
-        webbrowser.open(url)
-
-        QtWidgets.QMessageBox.information(
-            self, "Browser Opened",
-            f"Opening DOI in your default browser:\n{url}"
-        )
+        # Launching the browser can block; run it on the pool and report in the status bar
+        QtCore.QThreadPool.globalInstance().start(functools.partial(webbrowser.open, url))
+        self.status_msg.setText(f"Opening {url} in your default browser")
 
+    @QtCore.Slot()
     def _refresh_database_view(self):
         """Refresh database table view"""
-        refs = self.db.get_all_references(limit=100)
-        self.db_table.setRowCount(len(refs))
-
-        for row, ref in enumerate(refs):
-            self.db_table.setItem(row, 0, QtWidgets.QTableWidgetItem(ref.title[:100]))
-            self.db_table.setItem(row, 1, QtWidgets.QTableWidgetItem(ref.authors[:50]))
-            self.db_table.setItem(row, 2, QtWidgets.QTableWidgetItem(ref.year))
-            self.db_table.setItem(row, 3, QtWidgets.QTableWidgetItem(ref.journal[:50]))
-            self.db_table.setItem(row, 4, QtWidgets.QTableWidgetItem(ref.doi))
-
-            # Confidence with color
-            conf_item = QtWidgets.QTableWidgetItem(f"{ref.confidence_score:.2f}")
-            if ref.confidence_score >= 0.8:
-                conf_item.setBackground(QtGui.QColor("#48BB78"))
-            elif ref.confidence_score >= 0.6:
-                conf_item.setBackground(QtGui.QColor("#ECC94B"))
-            else:
-                conf_item.setBackground(QtGui.QColor("#F56565"))
-            conf_item.setForeground(QtGui.QColor("white"))
-            self.db_table.setItem(row, 5, conf_item)
-
-            # Actions button
-            action_btn = QtWidgets.QPushButton("👁️ View")
-            action_btn.setObjectName("toolbarButton")
-            action_btn.setMaximumWidth(80)
-            action_btn.setCursor(QtCore.Qt.PointingHandCursor)
-            # Connect button to view function with reference data
-            action_btn.clicked.connect(lambda checked, r=ref: self._view_reference(r))
-            self.db_table.setCellWidget(row, 6, action_btn)
-
-        self.record_count_lbl.setText(f"Total Records: {len(refs)}")
+        if self.db_table is None:
+            return  # tab not opened yet; it loads when built
+
+        model = self.db_table.model()
+        model.db = self.db
+        model.refresh()  # _update_record_count runs on modelReset
+
+    @QtCore.Slot(object)
+    def _on_database_opened(self, db: DatabaseManager):
+        """Adopt the database opened in the background and load waiting views"""
+        self.db = db
+        self.db_indicator.setText("💾 DB: Connected")
+        self._refresh_database_view()
+        self._show_statistics()
 
+    @QtCore.Slot(str)
+    def _on_database_failed(self, error: str):
+        """Report a database that could not be opened"""
+        self.db_indicator.setText("💾 DB: Error")
+        self.status_msg.setText(f"Database unavailable: {error[:80]}")
+
+    @QtCore.Slot(str)
+    def _on_search_text_changed(self, text: str):
+        """Remember the query and restart the debounce timer"""
+        self._pending_query = text
+        self._search_timer.start()
+
+    @QtCore.Slot()
+    def _do_search(self):
+        """Run the pending search against the database"""
+        self.db_table.model().set_query(self._pending_query)
+
+    @QtCore.Slot()
+    def _update_record_count(self):
+        """Show the model's row count under the table"""
+        if self.db is None:
+            self.record_count_lbl.setText("Opening database...")
+            return
+        self.record_count_lbl.setText(f"Total Records: {self.db_table.model().rowCount()}")
+
+    @QtCore.Slot(int)
+    def _on_view_requested(self, ref_id: int):
+        """Open the reference whose View button was clicked"""
+        ref = self.db.get_reference(ref_id) if self.db else None
+        if ref is not None:
+            self._view_reference(ref)
+
+    @QtCore.Slot(QtCore.QModelIndex)
+    def _on_db_table_double_clicked(self, index: QtCore.QModelIndex):
+        """Open the reference on a double-clicked row"""
+        ref = self.db_table.model().reference(index.row())
+        if ref is not None:
+            self._view_reference(ref)
+
+    @QtCore.Slot()
     def _export_database(self):
         """Export database to JSON"""
         path, _ = QtWidgets.QFileDialog.getSaveFileName(
             self, "Export Database", "", "JSON Files (*.json)"
         )
-        if path:
+        if path and self.db is not None:
             success = self.db.export_to_json(Path(path))
             if success:
                 QtWidgets.QMessageBox.information(
@@ -1476,12 +1932,13 @@ class MainWindow(QtWidgets.QMainWindow):
                     f"✅ Database exported successfully to:\n{path}"
                 )
 
+    @QtCore.Slot()
     def _import_database(self):
         """Import database from JSON"""
         path, _ = QtWidgets.QFileDialog.getOpenFileName(
             self, "Import Database", "", "JSON Files (*.json)"
         )
-        if path:
+        if path and self.db is not None:
             count = self.db.import_from_json(Path(path))
             QtWidgets.QMessageBox.information(
                 self, "Success",
@@ -1489,6 +1946,7 @@ class MainWindow(QtWidgets.QMainWindow):
             )
             self._refresh_database_view()
 
+    @QtCore.Slot()
     def _show_settings(self):
         """Show settings dialog"""
         msg = QtWidgets.QMessageBox(self)
@@ -1504,79 +1962,29 @@ class MainWindow(QtWidgets.QMainWindow):
         )
         msg.exec()
 
+    @QtCore.Slot()
     def _show_statistics(self):
         """Show statistics"""
-        stats = self.db.get_statistics()
-
-        html = f"""
-        <html>
-        <head>
-            <style>
-                body {{ font-family: 'Segoe UI', Arial, sans-serif; padding: 20px; }}
-                h2 {{ color: #667eea; border-bottom: 3px solid #667eea; padding-bottom: 10px; }}
-                h3 {{ color: #4A5568; margin-top: 25px; }}
-                .stat-box {{
-                    background-color: #F7FAFC;
-                    border-left: 4px solid #667eea;
-                    padding: 15px;
-                    margin: 10px 0;
-                    border-radius: 5px;
-                }}
-                .stat-label {{ color: #718096; font-size: 12px; text-transform: uppercase; }}
-                .stat-value {{ color: #2D3748; font-size: 24px; font-weight: bold; }}
-                ul {{ list-style-type: none; padding: 0; }}
-                li {{
-                    background-color: #F7FAFC;
-                    padding: 10px 15px;
-                    margin: 5px 0;
-                    border-radius: 5px;
-                    border-left: 3px solid #667eea;
-                }}
-            </style>
-        </head>
-        <body>
-            <h2>📊 Database Statistics</h2>
-
-            <div class="stat-box">
-                <div class="stat-label">Total References</div>
-                <div class="stat-value">{stats.get('total_references', 0):,}</div>
-            </div>
-
-            <div class="stat-box">
-                <div class="stat-label">Total PDFs Processed</div>
-                <div class="stat-value">{stats.get('total_pdfs', 0):,}</div>
-            </div>
+        if self.stats_text is None or self.db is None:
+            return  # tab not opened or database not open yet; both reload later
 
-            <div class="stat-box">
-                <div class="stat-label">Average Confidence Score</div>
-                <div class="stat-value">{stats.get('avg_confidence', 0):.2f}</div>
-            </div>
-
-            <h3>📅 References by Year</h3>
-            <ul>
-        """
-
-        for year, count in list(stats.get('by_year', {}).items())[:10]:
-            html += f"<li><b>{year}:</b> {count} references</li>"
-
-        html += """
-            </ul>
-
-            <h3>📚 References by Type</h3>
-            <ul>
-        """
-
-        for ref_type, count in stats.get('by_type', {}).items():
-            html += f"<li><b>{ref_type}:</b> {count} references</li>"
+        stats = self.db.get_statistics()
 
-        html += """
-            </ul>
-        </body>
-        </html>
-        """
+        html = _STATS_HTML.substitute(
+            total_references=f"{stats.get('total_references', 0):,}",
+            total_pdfs=f"{stats.get('total_pdfs', 0):,}",
+            avg_confidence=f"{stats.get('avg_confidence', 0):.2f}",
+            by_year="".join(_STATS_ITEM_HTML.substitute(key=year, count=count)
+                            for year, count in list(stats.get('by_year', {}).items())[:10]),
+            by_type="".join(_STATS_ITEM_HTML.substitute(key=ref_type, count=count)
+                            for ref_type, count in stats.get('by_type', {}).items()),
+        )
 
-        self.stats_text.setHtml(html)
+        if html != self._stats_html:
+            self._stats_html = html
+            self.stats_text.setText(html)
 
+    @QtCore.Slot()
     def _show_about(self):
         """Show about dialog"""
         msg = QtWidgets.QMessageBox(self)
@@ -1625,4 +2033,13 @@ class MainWindow(QtWidgets.QMainWindow):
             self.config_manager.update(output_dir=str(self.output_dir))
 
         self.config_manager.save()
+
+        # Stop searches, then give a still-running open a bounded time to
+        # finish so its connection gets closed too
+        if self.db_table is not None:
+            self.db_table.model().cancel_searches()
+        QtCore.QThreadPool.globalInstance().waitForDone(self.CLOSE_WAIT_MS)
+        db = self.db or self._db_opener.db
+        if db is not None:
+            db.close()
         event.accept()
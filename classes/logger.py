@@ -3,12 +3,16 @@ Enterprise Logging System
 Advanced logging with file rotation, filtering, and real-time monitoring
 """
 
+import atexit
+import functools
 import logging
+import os
+import queue
 import sys
 from pathlib import Path
-from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler, TimedRotatingFileHandler
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from PySide6 import QtCore
 
 
@@ -24,30 +28,66 @@ class ColoredFormatter(logging.Formatter):
     }
     RESET = '\033[0m'
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._colored = {level: f"{color}{level}{self.RESET}" for level, color in self.COLORS.items()}
+
     def format(self, record):
-        if record.levelname in self.COLORS:
-            record.levelname = f"{self.COLORS[record.levelname]}{record.levelname}{self.RESET}"
-        return super().format(record)
+        # The record is shared with the other handlers, so color only for
+        # this formatter and put the plain level name back afterwards
+        levelname = record.levelname
+        record.levelname = self._colored.get(levelname, levelname)
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
 
 
 class QtLogHandler(logging.Handler, QtCore.QObject):
     """
     Custom log handler that emits Qt signals
     Allows GUI to receive log messages in real-time
+
+    Records are batched: the first one after a flush schedules the next
+    flush on the handler's (GUI) thread, which emits everything logged in
+    the meantime as one list, so a burst costs one queued signal.
     """
-    log_signal = QtCore.Signal(str, str)  # (level, message)
+    log_signal = QtCore.Signal(list)  # [(level, message), ...]
+    _flush_requested = QtCore.Signal()
 
-    def __init__(self):
+    def __init__(self, interval_ms: int = 50):
         logging.Handler.__init__(self)
         QtCore.QObject.__init__(self)
+        self._log_signal_method = QtCore.QMetaMethod.fromSignal(self.log_signal)
+        self._pending = []  # guarded by the Handler lock
+
+        self._flush_timer = QtCore.QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(interval_ms)
+        self._flush_timer.timeout.connect(self.flush)
+        # Queued, so the timer is only ever started on its own thread
+        self._flush_requested.connect(self._flush_timer.start, QtCore.Qt.QueuedConnection)
 
     def emit(self, record):
+        # Nobody listening (GUI not attached yet, or gone): skip formatting
+        if not self.isSignalConnected(self._log_signal_method):
+            return
         try:
-            msg = self.format(record)
-            self.log_signal.emit(record.levelname, msg)
+            # handle() already holds the Handler lock here
+            self._pending.append((record.levelname, self.format(record)))
+            if len(self._pending) == 1:
+                self._flush_requested.emit()
         except Exception:
             self.handleError(record)
 
+    def flush(self):
+        """Emit the records queued so far as one log_signal"""
+        with self.lock:
+            if not self._pending:
+                return
+            records, self._pending = self._pending, []
+        self.log_signal.emit(records)
+
 
 class LoggerManager:
     """
@@ -61,13 +101,18 @@ class LoggerManager:
 
         self.main_logger = None
         self.qt_handler = None
+        self._file_listener: Optional[QueueListener] = None
         self._setup_logging()
+        # Runs before logging's own atexit shutdown (LIFO), so queued
+        # records reach the files before their handlers are closed
+        atexit.register(self.stop)
 
     def _setup_logging(self):
         """Configure logging system"""
         # Create main logger
         self.main_logger = logging.getLogger(self.app_name)
         self.main_logger.setLevel(logging.DEBUG)
+        self.stop()
         self.main_logger.handlers.clear()
 
         # Console handler with colors
@@ -94,7 +139,6 @@ class LoggerManager:
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         file_handler.setFormatter(file_formatter)
-        self.main_logger.addHandler(file_handler)
 
         # Error log file (only errors and critical)
         error_log_path = self.log_dir / f"{self.app_name}_errors.log"
@@ -106,7 +150,6 @@ class LoggerManager:
         )
         error_handler.setLevel(logging.ERROR)
         error_handler.setFormatter(file_formatter)
-        self.main_logger.addHandler(error_handler)
 
         # Daily rotating handler for archival
         daily_log_path = self.log_dir / f"{self.app_name}_daily.log"
@@ -119,7 +162,16 @@ class LoggerManager:
         )
         daily_handler.setLevel(logging.INFO)
         daily_handler.setFormatter(file_formatter)
-        self.main_logger.addHandler(daily_handler)
+
+        # The file handlers run on a listener thread fed through a queue, so
+        # a log call never blocks its thread on disk writes or rotation
+        log_queue = queue.SimpleQueue()
+        self._file_listener = QueueListener(
+            log_queue, file_handler, error_handler, daily_handler,
+            respect_handler_level=True
+        )
+        self._file_listener.start()
+        self.main_logger.addHandler(QueueHandler(log_queue))
 
         # Qt signal handler for GUI
         self.qt_handler = QtLogHandler()
@@ -166,6 +218,12 @@ class LoggerManager:
         """Get Qt signal handler for GUI integration"""
         return self.qt_handler
 
+    def stop(self):
+        """Write out queued records and stop the file-logging thread"""
+        if self._file_listener is not None:
+            self._file_listener.stop()
+            self._file_listener = None
+
     def cleanup_old_logs(self, days: int = 30):
         """
         Clean up log files older than specified days
@@ -177,33 +235,46 @@ class LoggerManager:
         cutoff = time.time() - (days * 86400)
         count = 0
 
-        for log_file in self.log_dir.glob("*.log*"):
-            if log_file.stat().st_mtime < cutoff:
-                try:
-                    log_file.unlink()
-                    count += 1
-                except Exception as e:
-                    self.main_logger.error(f"Failed to delete old log {log_file}: {e}")
+        # DirEntry.stat() reuses what the scan already fetched where it can
+        stale = [entry.path for entry in self._log_entries() if entry.stat().st_mtime < cutoff]
+        for log_path in stale:
+            try:
+                os.unlink(log_path)
+                count += 1
+            except Exception as e:
+                self.main_logger.error(f"Failed to delete old log {log_path}: {e}")
 
         if count > 0:
             self.main_logger.info(f"Cleaned up {count} old log files")
 
+    def _log_entries(self) -> List[os.DirEntry]:
+        """Entries in the log directory that look like logs (*.log*), from one scan"""
+        with os.scandir(self.log_dir) as entries:
+            return [entry for entry in entries if '.log' in entry.name]
+
+    def _queued_handler_count(self) -> int:
+        """File handlers behind the queue, less the QueueHandler that stands in for them"""
+        if self._file_listener is None:
+            return 0
+        return len(self._file_listener.handlers) - 1
+
     def get_log_stats(self) -> dict:
         """Get logging statistics"""
-        stats = {
+        # Count and size in a single directory pass
+        log_files = 0
+        total_bytes = 0
+        for entry in self._log_entries():
+            log_files += 1
+            total_bytes += entry.stat().st_size
+
+        return {
             'log_directory': str(self.log_dir),
-            'total_log_files': len(list(self.log_dir.glob("*.log*"))),
-            'total_size_mb': 0.0,
-            'handlers': len(self.main_logger.handlers),
+            'total_log_files': log_files,
+            'total_size_mb': round(total_bytes / (1024 * 1024), 2),
+            'handlers': len(self.main_logger.handlers) + self._queued_handler_count(),
             'log_level': logging.getLevelName(self.main_logger.level)
         }
 
-        # Calculate total size
-        total_bytes = sum(f.stat().st_size for f in self.log_dir.glob("*.log*"))
-        stats['total_size_mb'] = round(total_bytes / (1024 * 1024), 2)
-
-        return stats
-
     def export_recent_logs(self, output_file: Path, lines: int = 1000) -> bool:
         """
         Export recent log entries to a file
@@ -220,21 +291,56 @@ class LoggerManager:
             if not main_log.exists():
                 return False
 
-            with open(main_log, 'r', encoding='utf-8') as src:
-                all_lines = src.readlines()
-
-            recent_lines = all_lines[-lines:]
+            recent = _tail(main_log, lines)
 
-            with open(output_file, 'w', encoding='utf-8') as dst:
-                dst.writelines(recent_lines)
+            with open(output_file, 'wb') as dst:
+                dst.write(recent)
 
-            self.main_logger.info(f"Exported {len(recent_lines)} log lines to {output_file}")
+            line_count = recent.count(b'\n') + (not recent.endswith(b'\n') and bool(recent))
+            self.main_logger.info(f"Exported {line_count} log lines to {output_file}")
             return True
         except Exception as e:
             self.main_logger.error(f"Failed to export logs: {e}")
             return False
 
 
+def _tail(path: Path, lines: int, chunk_size: int = 64 * 1024) -> bytes:
+    """
+    Last lines of a file, read backwards in chunks so only the tail is loaded
+
+    Args:
+        path: File to read
+        lines: Number of lines wanted (0 or less: the whole file)
+        chunk_size: Bytes read per step
+
+    Returns:
+        The raw bytes of those lines
+    """
+    with open(path, 'rb') as f:
+        pos = f.seek(0, os.SEEK_END)
+        if lines <= 0:
+            f.seek(0)
+            return f.read()
+
+        chunks = []
+        newlines = 0
+        while pos > 0 and newlines <= lines:  # one extra for a trailing newline
+            step = min(chunk_size, pos)
+            pos -= step
+            f.seek(pos)
+            chunk = f.read(step)
+            chunks.append(chunk)
+            newlines += chunk.count(b'\n')
+
+    data = b''.join(reversed(chunks))
+    cut = len(data) - 1  # a newline ending the last line doesn't start another
+    for _ in range(lines):
+        cut = data.rfind(b'\n', 0, cut)
+        if cut == -1:
+            return data
+    return data[cut + 1:]
+
+
 class PerformanceLogger:
     """
     Context manager for performance logging
@@ -261,8 +367,6 @@ class PerformanceLogger:
 # Convenience functions
 def log_function_call(func):
     """Decorator to log function calls"""
-    import functools
-
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
         logger = logging.getLogger(func.__module__)
@@ -280,8 +384,6 @@ def log_function_call(func):
 
 def log_exception(logger: logging.Logger, message: str = "Exception occurred"):
     """Decorator to log exceptions"""
-    import functools
-
     def decorator(func):
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
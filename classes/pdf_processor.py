@@ -3,15 +3,129 @@ Advanced PDF Processor with ML-Enhanced Extraction
 Enterprise-level PDF processing with layout analysis and confidence scoring
 """
 
+import functools
+import os
 import re
+import sys
 import logging
+import multiprocessing
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Tuple, Dict, Optional, Any
-import fitz  # PyMuPDF
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Tuple, Dict, Optional, Any
 from dataclasses import dataclass
+from operator import itemgetter
+
+if TYPE_CHECKING:
+    import fitz  # PyMuPDF; imported at runtime by _fitz()
+
+# Section markers, in priority order: a "REFERENCES" heading wins over an
+# earlier stray "reference" in body text. Each pairs the lowercase literal
+# (for the str.find prefilter in _search_marker) with its exact pattern.
+_REF_START_MARKERS = [(word.lower(), re.compile(rf'\b{word}\b', re.IGNORECASE)) for word in (
+    'REFERENCES',
+    'REFERENCE',
+    'BIBLIOGRAPHY',
+    'WORKS CITED',
+)]
+_REF_END_MARKERS = [(word.lower(), re.compile(rf'\b{word}\b', re.IGNORECASE)) for word in (
+    'APPENDIX',
+    'ACKNOWLEDGMENT',
+    'ACKNOWLEDGEMENT',
+)]
+_FOLD_UNSAFE = ('\u0130', '\u0131', '\u017f', '\u212a')  # İ ı ſ K (Kelvin)
+# str.translate table deleting control characters and soft hyphens
+_CONTROL_CHARS = dict.fromkeys([*range(0x20), 0x7F, 0xAD])
+
+_BLOCK_Y = itemgetter(1)  # top edge of a "blocks" tuple
+
+# Slotted dataclasses need Python 3.10+
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Process pools start fresh interpreters: forking a process that already
+# runs Qt, logging and HTTP threads can deadlock the child
+_POOL_CONTEXT = multiprocessing.get_context("spawn")
+
+# Threads writing files for extract_images
+_IMAGE_WRITERS = 4
+
+# Confidence scoring
+_GARBLED_RE = re.compile(r'[^\w\s\.,;:\-\(\)\[\]{}]')
+_CAMEL_RE = re.compile(r'[a-z][A-Z]')
+_YEAR_RE = re.compile(r'\b(19|20)\d{2}\b')
+_CITATION_RE = re.compile(r'\[\d+\]')
+
+
+@functools.lru_cache(maxsize=None)
+def _fitz():
+    """PyMuPDF, imported on first use: loading it adds ~80 ms to GUI startup"""
+    import fitz
+    return fitz
+
+
+@functools.lru_cache(maxsize=None)
+def _text_flags() -> Tuple[int, int]:
+    """get_text() flags for text-only "dict" and "blocks" extraction (no embedded image data)"""
+    fitz = _fitz()
+    return (fitz.TEXTFLAGS_DICT & ~fitz.TEXT_PRESERVE_IMAGES,
+            fitz.TEXTFLAGS_BLOCKS & ~fitz.TEXT_PRESERVE_IMAGES)
+
+
+def _fold(text: str) -> Optional[str]:
+    """Lowercased copy for _search_marker, or None when it can't stand in for re.IGNORECASE"""
+    # lower() maps every character 1:1 and keeps non-ASCII non-ASCII, except
+    # for these four, which re.IGNORECASE also matches against i, k and s
+    if not text.isascii() and any(ch in text for ch in _FOLD_UNSAFE):
+        return None
+    return text.lower()
+
+
+def _search_marker(marker: Tuple[str, re.Pattern], text: str, folded: Optional[str],
+                   pos: int = 0) -> Optional[re.Match]:
+    """
+    Equivalent of pattern.search(text, pos) for a section marker
 
-
-@dataclass
+    A case-insensitive pattern with a leading word boundary gets no literal fast scan
+    from re, so candidates are found with str.find on the folded text and
+    each is confirmed with pattern.match on the original.
+    """
+    needle, pattern = marker
+    if folded is None:
+        return pattern.search(text, pos)
+
+    index = folded.find(needle, pos)
+    while index != -1:
+        match = pattern.match(text, index)
+        if match:
+            return match
+        index = folded.find(needle, index + 1)
+    return None
+
+
+def _spans_columns(x_positions: Iterable[float]) -> bool:
+    """True when block left edges fall into more than two 10pt bins"""
+    bins = set()
+    for x in x_positions:
+        bins.add(round(x / 10))
+        if len(bins) > 2:
+            return True
+    return False
+
+
+@contextmanager
+def _open_document(pdf_path: Path, doc: Optional['fitz.Document'] = None) -> Iterator['fitz.Document']:
+    """Yield doc when the caller already has the PDF open, else open (and close) pdf_path"""
+    if doc is not None:
+        yield doc
+        return
+    doc = _fitz().open(str(pdf_path))
+    try:
+        yield doc
+    finally:
+        doc.close()
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class TextBlock:
     """Represents a text block from PDF"""
     text: str
@@ -50,136 +164,150 @@ class PDFProcessor:
         self.enable_ml = enable_ml
         self.enable_ocr = enable_ocr
 
-    def extract_metadata(self, pdf_path: Path) -> PDFMetadata:
+    def extract_metadata(self, pdf_path: Path, doc: Optional['fitz.Document'] = None) -> PDFMetadata:
         """
         Extract PDF metadata
 
         Args:
             pdf_path: Path to PDF file
+            doc: The PDF already opened by the caller (left open)
 
         Returns:
             PDFMetadata object
         """
         try:
-            doc = fitz.open(str(pdf_path))
-            metadata = doc.metadata or {}
-
-            pdf_meta = PDFMetadata(
-                title=metadata.get('title', ''),
-                author=metadata.get('author', ''),
-                subject=metadata.get('subject', ''),
-                keywords=metadata.get('keywords', ''),
-                creator=metadata.get('creator', ''),
-                producer=metadata.get('producer', ''),
-                creation_date=metadata.get('creationDate', ''),
-                mod_date=metadata.get('modDate', ''),
-                page_count=doc.page_count,
-                file_size=pdf_path.stat().st_size
-            )
-
-            doc.close()
+            with _open_document(pdf_path, doc) as doc:
+                metadata = doc.metadata or {}
+
+                pdf_meta = PDFMetadata(
+                    title=metadata.get('title', ''),
+                    author=metadata.get('author', ''),
+                    subject=metadata.get('subject', ''),
+                    keywords=metadata.get('keywords', ''),
+                    creator=metadata.get('creator', ''),
+                    producer=metadata.get('producer', ''),
+                    creation_date=metadata.get('creationDate', ''),
+                    mod_date=metadata.get('modDate', ''),
+                    page_count=doc.page_count,
+                    file_size=pdf_path.stat().st_size
+                )
+
             self.logger.debug(f"Extracted metadata from {pdf_path.name}")
             return pdf_meta
         except Exception as e:
             self.logger.error(f"Failed to extract metadata: {e}")
             return PDFMetadata()
 
-    def extract_text_blocks(self, pdf_path: Path) -> List[TextBlock]:
+    def extract_text_blocks(self, pdf_path: Path, with_fonts: bool = True,
+                            doc: Optional['fitz.Document'] = None) -> List[TextBlock]:
         """
         Extract text blocks with positioning information
 
         Args:
             pdf_path: Path to PDF file
+            with_fonts: One TextBlock per line with its font size and name.
+                When False, one TextBlock per block from PyMuPDF's "blocks"
+                tuples (much cheaper; font_size 0.0 and font_name "")
+            doc: The PDF already opened by the caller (left open)
 
         Returns:
             List of TextBlock objects
         """
         blocks = []
         try:
-            doc = fitz.open(str(pdf_path))
-
-            for page_num, page in enumerate(doc):
-                raw_blocks = page.get_text("dict")["blocks"]
-
-                for block in raw_blocks:
-                    if block.get("type") == 0:  # Text block
-                        for line in block.get("lines", []):
-                            text_parts = []
-                            avg_font_size = 0
-                            font_names = []
-
-                            for span in line.get("spans", []):
-                                text_parts.append(span["text"])
-                                avg_font_size += span["size"]
-                                font_names.append(span["font"])
-
-                            if text_parts:
-                                text = " ".join(text_parts)
-                                avg_font_size /= len(line["spans"])
-
+            dict_flags, block_flags = _text_flags()
+            with _open_document(pdf_path, doc) as doc:
+                for page_num, page in enumerate(doc):
+                    if not with_fonts:
+                        for x0, y0, x1, y1, text, _, block_type in page.get_text("blocks", flags=block_flags):
+                            if block_type == 0 and text.strip():
                                 blocks.append(TextBlock(
-                                    text=text,
-                                    x=block["bbox"][0],
-                                    y=block["bbox"][1],
-                                    width=block["bbox"][2] - block["bbox"][0],
-                                    height=block["bbox"][3] - block["bbox"][1],
-                                    font_size=avg_font_size,
-                                    font_name=font_names[0] if font_names else "",
-                                    page_num=page_num + 1
+                                    text=text.strip(), x=x0, y=y0, width=x1 - x0, height=y1 - y0,
+                                    font_size=0.0, font_name="", page_num=page_num + 1
                                 ))
+                        continue
+
+                    # Image blocks are skipped below, so don't have them decoded
+                    raw_blocks = page.get_text("dict", flags=dict_flags)["blocks"]
+
+                    for block in raw_blocks:
+                        if block.get("type") == 0:  # Text block
+                            for line in block.get("lines", []):
+                                text_parts = []
+                                avg_font_size = 0
+                                font_names = []
+
+                                for span in line.get("spans", []):
+                                    text_parts.append(span["text"])
+                                    avg_font_size += span["size"]
+                                    font_names.append(span["font"])
+
+                                if text_parts:
+                                    text = " ".join(text_parts)
+                                    avg_font_size /= len(line["spans"])
+
+                                    blocks.append(TextBlock(
+                                        text=text,
+                                        x=block["bbox"][0],
+                                        y=block["bbox"][1],
+                                        width=block["bbox"][2] - block["bbox"][0],
+                                        height=block["bbox"][3] - block["bbox"][1],
+                                        font_size=avg_font_size,
+                                        font_name=font_names[0] if font_names else "",
+                                        page_num=page_num + 1
+                                    ))
 
-            doc.close()
             self.logger.info(f"Extracted {len(blocks)} text blocks from {pdf_path.name}")
         except Exception as e:
             self.logger.error(f"Failed to extract text blocks: {e}")
 
         return blocks
 
-    def extract_text_columnar(self, pdf_path: Path) -> str:
+    def extract_text_columnar(self, pdf_path: Path, doc: Optional['fitz.Document'] = None) -> str:
         """
         Extract text with column awareness (for multi-column papers)
 
         Args:
             pdf_path: Path to PDF file
+            doc: The PDF already opened by the caller (left open)
 
         Returns:
             Extracted text
         """
         try:
-            doc = fitz.open(str(pdf_path))
-            full_text = []
-
-            for page_num, page in enumerate(doc):
-                blocks = page.get_text("blocks")
-                if not blocks:
-                    continue
+            with _open_document(pdf_path, doc) as doc:
+                return "\n".join(self._iter_columnar_pages(doc))
+        except Exception as e:
+            self.logger.error(f"Failed to extract columnar text: {e}")
+            return ""
 
-                # Detect columns
-                width = page.rect.width
-                midpoint = width / 2
+    def _iter_columnar_pages(self, doc) -> Iterator[str]:
+        """Yield each non-empty page's text in column reading order"""
+        for page_num, page in enumerate(doc):
+            blocks = page.get_text("blocks")
+            if not blocks:
+                continue
 
-                # Separate left and right column blocks
-                left_blocks = [b for b in blocks if b[0] < midpoint]
-                right_blocks = [b for b in blocks if b[0] >= midpoint]
+            # Detect columns
+            width = page.rect.width
+            midpoint = width / 2
 
-                # Sort by vertical position
-                left_blocks.sort(key=lambda b: b[1])
-                right_blocks.sort(key=lambda b: b[1])
+            # Separate left and right column blocks in one pass
+            left_blocks, right_blocks = [], []
+            for b in blocks:
+                (left_blocks if b[0] < midpoint else right_blocks).append(b)
 
-                # Combine in reading order
-                combined = left_blocks + right_blocks
-                page_text = "\n".join(b[4].strip() for b in combined if b[4].strip())
-                full_text.append(page_text)
+            # Sort by vertical position, then combine in reading order
+            left_blocks.sort(key=_BLOCK_Y)
+            right_blocks.sort(key=_BLOCK_Y)
+            left_blocks += right_blocks
+            page_text = "\n".join(b[4].strip() for b in left_blocks if b[4].strip())
 
-                # Log if REFERENCES section found
-                if 'REFERENCES' in page_text.upper():
-                    self.logger.debug(f"Found REFERENCES on page {page_num + 1}")
+            # Log if REFERENCES section found
+            if 'REFERENCES' in page_text.upper():
+                self.logger.debug(f"Found REFERENCES on page {page_num + 1}")
 
-            doc.close()
-            return "\n".join(full_text)
-        except Exception as e:
-            self.logger.error(f"Failed to extract columnar text: {e}")
-            return ""
+            yield page_text
 
     def detect_references_section(self, text: str) -> Tuple[int, int]:
         """
@@ -191,17 +319,13 @@ class PDFProcessor:
         Returns:
             Tuple of (start_pos, end_pos)
         """
-        # Try multiple patterns
-        patterns = [
-            r'\bREFERENCES\b',
-            r'\bREFERENCE\b',
-            r'\bBIBLIOGRAPHY\b',
-            r'\bWORKS CITED\b'
-        ]
+        return self._locate_references(text, _fold(text))
 
+    def _locate_references(self, text: str, folded: Optional[str]) -> Tuple[int, int]:
+        """detect_references_section with the folded text (see _fold) already made"""
         start_pos = -1
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for marker in _REF_START_MARKERS:
+            match = _search_marker(marker, text, folded)
             if match:
                 start_pos = match.end()
                 self.logger.info(f"Found references section at position {start_pos}")
@@ -212,33 +336,28 @@ class PDFProcessor:
             return (-1, -1)
 
         # Try to find end of references (next section)
-        end_patterns = [
-            r'\bAPPENDIX\b',
-            r'\bACKNOWLEDGMENT\b',
-            r'\bACKNOWLEDGEMENT\b'
-        ]
-
         end_pos = len(text)
-        for pattern in end_patterns:
-            match = re.search(pattern, text[start_pos:], re.IGNORECASE)
+        for marker in _REF_END_MARKERS:
+            match = _search_marker(marker, text, folded, start_pos)
             if match:
-                end_pos = start_pos + match.start()
+                end_pos = match.start()
                 break
 
         return (start_pos, end_pos)
 
-    def extract_references_section(self, pdf_path: Path) -> str:
+    def extract_references_section(self, pdf_path: Path, doc: Optional['fitz.Document'] = None) -> str:
         """
         Extract only the references section from PDF
 
         Args:
             pdf_path: Path to PDF file
+            doc: The PDF already opened by the caller (left open)
 
         Returns:
             References section text
         """
-        text = self.extract_text_columnar(pdf_path)
-        start, end = self.detect_references_section(text)
+        text, folded = self._read_through_references(pdf_path, doc)
+        start, end = self._locate_references(text, folded)
 
         if start == -1:
             return ""
@@ -246,18 +365,60 @@ class PDFProcessor:
         refs_text = text[start:end]
 
         # Clean up
-        refs_text = re.sub(r'[\x00-\x1F\x7F\u00AD]', '', refs_text)
+        refs_text = refs_text.translate(_CONTROL_CHARS)
         refs_text = refs_text.strip()
 
         self.logger.info(f"Extracted {len(refs_text)} characters from references section")
         return refs_text
 
-    def analyze_document_structure(self, pdf_path: Path) -> Dict[str, Any]:
+    def _read_through_references(self, pdf_path: Path,
+                                 doc: Optional['fitz.Document'] = None) -> Tuple[str, Optional[str]]:
+        """
+        Columnar text of the PDF, read page by page only as far as needed
+
+        Reading stops once a REFERENCES heading has been followed by an
+        APPENDIX heading: both are the top-priority markers in
+        detect_references_section, so later pages cannot change the section
+        it finds. Without them, the whole document is read.
+
+        Returns (text, folded): the pages are folded for the marker checks
+        anyway, and lower() works per character, so joining the folded pages
+        gives _fold(text) without a second pass (None if any page can't fold).
+        """
+        try:
+            with _open_document(pdf_path, doc) as doc:
+                pages = []
+                folded_pages = []
+                heading_seen = False
+                for page_text in self._iter_columnar_pages(doc):
+                    pages.append(page_text)
+                    folded = _fold(page_text)
+                    if folded is None:
+                        folded_pages = None
+                    elif folded_pages is not None:
+                        folded_pages.append(folded)
+                    pos = 0
+                    if not heading_seen:
+                        match = _search_marker(_REF_START_MARKERS[0], page_text, folded)
+                        if match is None:
+                            continue
+                        heading_seen, pos = True, match.end()
+                    if _search_marker(_REF_END_MARKERS[0], page_text, folded, pos):
+                        break
+                return ("\n".join(pages),
+                        None if folded_pages is None else "\n".join(folded_pages))
+        except Exception as e:
+            self.logger.error(f"Failed to extract columnar text: {e}")
+            return ("", "")
+
+    def analyze_document_structure(self, pdf_path: Path,
+                                   doc: Optional['fitz.Document'] = None) -> Dict[str, Any]:
         """
         Analyze document structure and layout
 
         Args:
             pdf_path: Path to PDF file
+            doc: The PDF already opened by the caller (left open)
 
         Returns:
             Dictionary with structure analysis
@@ -272,55 +433,54 @@ class PDFProcessor:
         }
 
         try:
-            doc = fitz.open(str(pdf_path))
-            analysis['page_count'] = doc.page_count
-
-            all_font_sizes = []
-            total_blocks = 0
-
-            for page_num, page in enumerate(doc):
-                blocks = page.get_text("dict")["blocks"]
-                total_blocks += len(blocks)
-
-                # Check for references
-                page_text = page.get_text()
-                if 'REFERENCES' in page_text.upper() and analysis['references_page'] == -1:
-                    analysis['references_page'] = page_num + 1
-                    analysis['references_found'] = True
-
-                # Analyze font sizes
-                for block in blocks:
-                    if block.get("type") == 0:
-                        for line in block.get("lines", []):
-                            for span in line.get("spans", []):
-                                all_font_sizes.append(span["size"])
-
-                # Check for multiple columns (simple heuristic)
-                if len(blocks) > 10:
-                    x_positions = [b["bbox"][0] for b in blocks if b.get("type") == 0]
-                    if x_positions:
-                        unique_x = len(set(round(x / 10) * 10 for x in x_positions))
-                        if unique_x > 2:
-                            analysis['has_multiple_columns'] = True
-
-            analysis['total_blocks'] = total_blocks
-            if all_font_sizes:
-                analysis['avg_font_size'] = sum(all_font_sizes) / len(all_font_sizes)
-
-            doc.close()
+            with _open_document(pdf_path, doc) as doc:
+                analysis['page_count'] = doc.page_count
+
+                all_font_sizes = []
+                total_blocks = 0
+
+                for page_num, page in enumerate(doc):
+                    blocks = page.get_text("dict")["blocks"]
+                    total_blocks += len(blocks)
+
+                    # Analyze font sizes; the same span walk checks for the
+                    # references heading, so the page is parsed only once
+                    find_references = analysis['references_page'] == -1
+                    for block in blocks:
+                        if block.get("type") == 0:
+                            for line in block.get("lines", []):
+                                spans = line.get("spans", [])
+                                all_font_sizes.extend(span["size"] for span in spans)
+                                if find_references and 'REFERENCES' in "".join(
+                                        span["text"] for span in spans).upper():
+                                    analysis['references_page'] = page_num + 1
+                                    analysis['references_found'] = True
+                                    find_references = False
+
+                    # Check for multiple columns (simple heuristic); one page is enough
+                    if not analysis['has_multiple_columns'] and len(blocks) > 10:
+                        analysis['has_multiple_columns'] = _spans_columns(
+                            b["bbox"][0] for b in blocks if b.get("type") == 0)
+
+                analysis['total_blocks'] = total_blocks
+                if all_font_sizes:
+                    analysis['avg_font_size'] = sum(all_font_sizes) / len(all_font_sizes)
+
             self.logger.info(f"Document analysis complete: {analysis}")
         except Exception as e:
             self.logger.error(f"Failed to analyze document structure: {e}")
 
         return analysis
 
-    def extract_images(self, pdf_path: Path, output_dir: Path) -> List[Path]:
+    def extract_images(self, pdf_path: Path, output_dir: Path,
+                       doc: Optional['fitz.Document'] = None) -> List[Path]:
         """
         Extract images from PDF
 
         Args:
             pdf_path: Path to PDF file
             output_dir: Directory to save images
+            doc: The PDF already opened by the caller (left open)
 
         Returns:
             List of saved image paths
@@ -328,29 +488,34 @@ class PDFProcessor:
         output_dir.mkdir(parents=True, exist_ok=True)
         saved_images = []
 
+        # Files are written on a small thread pool so disk writes overlap
+        # with decoding the next image; leaving the block waits for them
+        writes = []
         try:
-            doc = fitz.open(str(pdf_path))
-
-            for page_num, page in enumerate(doc):
-                image_list = page.get_images()
-
-                for img_idx, img in enumerate(image_list):
-                    xref = img[0]
-                    base_image = doc.extract_image(xref)
-                    image_bytes = base_image["image"]
-                    image_ext = base_image["ext"]
-
-                    image_path = output_dir / f"{pdf_path.stem}_p{page_num + 1}_img{img_idx + 1}.{image_ext}"
-                    with open(image_path, "wb") as img_file:
-                        img_file.write(image_bytes)
-
-                    saved_images.append(image_path)
-
-            doc.close()
-            self.logger.info(f"Extracted {len(saved_images)} images from {pdf_path.name}")
+            with ThreadPoolExecutor(max_workers=_IMAGE_WRITERS) as writer, \
+                    _open_document(pdf_path, doc) as doc:
+                for page_num, page in enumerate(doc):
+                    image_list = page.get_images()
+
+                    for img_idx, img in enumerate(image_list):
+                        xref = img[0]
+                        base_image = doc.extract_image(xref)
+                        image_bytes = base_image["image"]
+                        image_ext = base_image["ext"]
+
+                        image_path = output_dir / f"{pdf_path.stem}_p{page_num + 1}_img{img_idx + 1}.{image_ext}"
+                        writes.append((image_path, writer.submit(image_path.write_bytes, image_bytes)))
         except Exception as e:
             self.logger.error(f"Failed to extract images: {e}")
 
+        for image_path, write in writes:
+            try:
+                write.result()
+                saved_images.append(image_path)
+            except Exception as e:
+                self.logger.error(f"Failed to save image {image_path.name}: {e}")
+
+        self.logger.info(f"Extracted {len(saved_images)} images from {pdf_path.name}")
         return saved_images
 
     def calculate_confidence_score(self, text: str) -> float:
@@ -367,36 +532,37 @@ class PDFProcessor:
             return 0.0
 
         score = 1.0
+        length = len(text)
 
         # Check for garbled text
-        garbled_chars = len(re.findall(r'[^\w\s\.,;:\-\(\)\[\]{}]', text))
-        garbled_ratio = garbled_chars / len(text)
+        garbled_chars = len(_GARBLED_RE.findall(text))
+        garbled_ratio = garbled_chars / length
         if garbled_ratio > 0.1:
             score -= 0.3
 
         # Check for proper spacing
-        no_space_ratio = len(re.findall(r'[a-z][A-Z]', text)) / max(len(text), 1)
+        no_space_ratio = len(_CAMEL_RE.findall(text)) / length
         if no_space_ratio > 0.05:
             score -= 0.2
 
-        # Check for numeric patterns (common in references)
-        has_years = bool(re.search(r'\b(19|20)\d{2}\b', text))
-        has_numbers = bool(re.search(r'\[\d+\]', text))
-        if has_years and has_numbers:
+        # Check for numeric patterns (common in references); the year scan
+        # is only needed when citation numbers are present
+        if _CITATION_RE.search(text) and _YEAR_RE.search(text):
             score += 0.1
 
         # Check text length
-        if len(text) < 50:
+        if length < 50:
             score -= 0.2
 
         return max(0.0, min(1.0, score))
 
-    def validate_pdf(self, pdf_path: Path) -> Tuple[bool, str]:
+    def validate_pdf(self, pdf_path: Path, doc: Optional['fitz.Document'] = None) -> Tuple[bool, str]:
         """
         Validate PDF file
 
         Args:
             pdf_path: Path to PDF file
+            doc: The PDF already opened by the caller (left open)
 
         Returns:
             Tuple of (is_valid, error_message)
@@ -411,39 +577,88 @@ class PDFProcessor:
             return (False, "File is empty")
 
         try:
-            doc = fitz.open(str(pdf_path))
-            if doc.page_count == 0:
-                doc.close()
-                return (False, "PDF has no pages")
-            doc.close()
+            with _open_document(pdf_path, doc) as doc:
+                if doc.page_count == 0:
+                    return (False, "PDF has no pages")
             return (True, "")
         except Exception as e:
             return (False, f"Corrupted PDF: {str(e)}")
 
-    def batch_process(self, pdf_paths: List[Path]) -> Dict[Path, str]:
+    def read_references(self, pdf_path: Path) -> Tuple[str, str]:
+        """
+        Validate a PDF and extract its references section, opening it once
+
+        Args:
+            pdf_path: Path to PDF file
+
+        Returns:
+            Tuple of (references_text, error_message); the error is "" on success
+        """
+        try:
+            doc = _fitz().open(str(pdf_path))
+        except Exception:
+            doc = None  # validate_pdf works out and reports why
+
+        try:
+            is_valid, error = self.validate_pdf(pdf_path, doc)
+            if not is_valid:
+                return ("", error)
+            return (self.extract_references_section(pdf_path, doc), "")
+        finally:
+            if doc is not None:
+                doc.close()
+
+    def _process_path(self, pdf_path: Path) -> str:
+        """Validate one PDF and extract its references section ("" on failure)"""
+        try:
+            refs_text, error = self.read_references(pdf_path)
+            if error:
+                self.logger.error(f"Invalid PDF {pdf_path.name}: {error}")
+            return refs_text
+        except Exception as e:
+            self.logger.error(f"Failed to process {pdf_path.name}: {e}")
+            return ""
+
+    def batch_process(self, pdf_paths: List[Path],
+                      max_workers: Optional[int] = None) -> Dict[Path, str]:
         """
         Process multiple PDFs and extract references
 
+        PDFs are independent, so they are spread over a process pool; each
+        worker process opens its own documents.
+
         Args:
             pdf_paths: List of PDF paths
+            max_workers: Worker processes (default: one per CPU, at most one
+                per PDF); 1 processes serially in this process
 
         Returns:
-            Dictionary mapping paths to extracted references
+            Dictionary mapping paths to extracted references (input order)
         """
-        results = {}
+        pdf_paths = list(pdf_paths)
+        if max_workers is None:
+            max_workers = min(os.cpu_count() or 1, len(pdf_paths))
 
-        for pdf_path in pdf_paths:
-            try:
-                is_valid, error = self.validate_pdf(pdf_path)
-                if not is_valid:
-                    self.logger.error(f"Invalid PDF {pdf_path.name}: {error}")
+        if max_workers <= 1 or len(pdf_paths) <= 1:
+            return {pdf_path: self._process_path(pdf_path) for pdf_path in pdf_paths}
+
+        results = {}
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=_POOL_CONTEXT) as pool:
+            futures = {
+                pool.submit(_process_one, pdf_path, self.enable_ml, self.enable_ocr): pdf_path
+                for pdf_path in pdf_paths
+            }
+            for future in as_completed(futures):
+                pdf_path = futures[future]
+                try:
+                    results[pdf_path] = future.result()
+                except Exception as e:
+                    self.logger.error(f"Failed to process {pdf_path.name}: {e}")
                     results[pdf_path] = ""
-                    continue
 
-                refs_text = self.extract_references_section(pdf_path)
-                results[pdf_path] = refs_text
-            except Exception as e:
-                self.logger.error(f"Failed to process {pdf_path.name}: {e}")
-                results[pdf_path] = ""
+        return {pdf_path: results[pdf_path] for pdf_path in pdf_paths}
+
 
-        return results
+def _process_one(pdf_path: Path, enable_ml: bool, enable_ocr: bool) -> str:
+    """batch_process worker: runs in a child process with its own PDFProcessor"""
+    return PDFProcessor(enable_ml=enable_ml, enable_ocr=enable_ocr)._process_path(pdf_path)
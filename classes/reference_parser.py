@@ -5,12 +5,83 @@ Supports multiple citation styles and confidence scoring
 
 import re
 import logging
+import sys
+from collections import Counter, OrderedDict
 from typing import List, Dict, Tuple, Optional, Any
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from operator import attrgetter
 from difflib import SequenceMatcher
 
-
-@dataclass
+# Text clean-up
+_CONTROL_CHARS_RE = re.compile(r'[\x00-\x1F\x7F\u00AD]')
+# Whitespace runs other than a lone space: substituting ' ' for these is the
+# same as for every \s+ run, without rewriting each ordinary word gap
+_WHITESPACE_RE = re.compile(r'(?: \s|[^\S ])\s*')
+_TRAILING_PUNCT_RE = re.compile(r'[.,;:]+$')
+
+# Splitting a references section into entries
+_REF_MARKER_RE = re.compile(r'\[\d+\]')
+_NUMBERED_DOTS_SPLIT_RE = re.compile(r'\n\s*\d+\.\s+')
+_AUTHOR_YEAR_SPLIT_RE = re.compile(r'\n\s*(?=[A-Z][a-z]+,\s+[A-Z])')
+_LINE_REF_NUMBER_RE = re.compile(r'^\[\d+\]')
+_LINE_NUMBER_DOT_RE = re.compile(r'^\d+\.')
+_LINE_AUTHOR_RE = re.compile(r'^[A-Z][a-z]+,')
+
+# Fields of a single reference. Patterns open with their literal text, not
+# an optional prefix or a leading \b, so the regex engine can skip ahead to
+# candidate positions instead of trying a match at every character; the
+# (?<!\w..) / (?<!\w.) look-behinds after it stand in for that \b.
+_REF_NUMBER_RE = re.compile(r'^\[(\d+)\]')
+_LEADING_REF_NUMBER_RE = re.compile(r'^\[\d+\]\s*')
+# An optional 'doi:' prefix never changes which DOI is found first
+_DOI_RE = re.compile(r'(10\.\d{4,}/[^\s]+)')
+_URL_RE = re.compile(r'(https?://[^\s]+)')
+_YEAR_RE = re.compile(r'(19|20)(?<!\w..)\d{2}\b')
+_VALID_YEAR_RE = re.compile(r'^(19|20)\d{2}$')
+_AUTHOR_AND_RE = re.compile(r'\s+and\s+', re.IGNORECASE)
+
+# Removed from the text after the title to leave the venue
+_VENUE_NOISE_RES = [
+    _YEAR_RE,
+    re.compile(r'vol\.\s*\d+', re.IGNORECASE),
+    re.compile(r'no\.\s*\d+', re.IGNORECASE),
+    re.compile(r'pp\.\s*[\d\-]+', re.IGNORECASE),
+]
+
+# Venue text containing one of these is a conference (booktitle)
+_CONFERENCE_VENUE_KEYWORDS = ('conference', 'proc', 'proceedings', 'symposium', 'workshop', 'congress')
+
+# Citation type for a reference containing any of the keywords, first match wins
+_CITATION_TYPE_KEYWORDS = (
+    ('inproceedings', ('conference', 'proc', 'symposium', 'workshop')),
+    ('book', ('book', 'edition', 'isbn')),
+    ('phdthesis', ('thesis', 'dissertation')),
+    ('techreport', ('technical report', 'tech. rep')),
+)
+
+# Volume, issue and page patterns, tried in order
+_VOLUME_RES = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'vol\.\s*(\d+)',
+    r'volume\s+(\d+)',
+    r'v(?<!\w.)\.\s*(\d+)',
+)]
+_ISSUE_RES = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'no\.\s*(\d+)',
+    r'number\s+(\d+)',
+    r'issue\s+(\d+)',
+    r'n(?<!\w.)\.\s*(\d+)',
+)]
+_PAGES_RES = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'pp\.\s*([\d\-]+)',
+    r'pages?\s+([\d\-]+)',
+    r',\s*([\d]+)\s*[-–—]\s*([\d]+)',
+)]
+
+# Slotted dataclasses need Python 3.10+
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class ParsedReference:
     """Structured reference data"""
     raw_text: str
@@ -43,11 +114,17 @@ class ParsedReference:
         return " and ".join(self.authors)
 
 
+# All ParsedReference field values, in constructor order
+_REFERENCE_FIELDS = attrgetter(*(f.name for f in fields(ParsedReference)))
+
+
 class ReferenceParser:
     """
     Advanced reference parser with pattern matching and ML features
     """
 
+    PARSE_CACHE_SIZE = 4096
+
     def __init__(self, style: str = "ieee"):
         self.logger = logging.getLogger(__name__)
         self.style = style.lower()
@@ -59,6 +136,17 @@ class ReferenceParser:
             ("'", "'"),                    # ASCII single
             (chr(8216), chr(8217))         # Unicode left/right single
         ]
+        self._open_quotes = tuple(open_q for open_q, _ in self.quote_pairs)
+        self._close_quotes = tuple(close_q for _, close_q in self.quote_pairs)
+        # Quoted-title pattern per pair, tried in quote_pairs order
+        self._quote_patterns = [
+            re.compile(f'{re.escape(open_q)}([^{re.escape(close_q)}]+){re.escape(close_q)}')
+            for open_q, close_q in self.quote_pairs
+        ]
+
+        # LRU of parsed entries by raw text: the same citation recurs across
+        # the PDFs a parser handles. Entries are never handed out directly.
+        self._parse_cache: "OrderedDict[str, ParsedReference]" = OrderedDict()
 
     def parse_references_section(self, text: str) -> List[ParsedReference]:
         """
@@ -96,10 +184,10 @@ class ReferenceParser:
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text"""
         # Remove control characters
-        text = re.sub(r'[\x00-\x1F\x7F\u00AD]', '', text)
+        text = _CONTROL_CHARS_RE.sub('', text)
 
         # Normalize whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = _WHITESPACE_RE.sub(' ', text)
 
         # Normalize dashes
         text = text.replace('–', '-').replace('—', '-')
@@ -116,18 +204,19 @@ class ReferenceParser:
         Returns:
             List of raw reference strings
         """
-        # Try numbered references [1], [2], etc.
-        numbered = re.findall(r'\[\d+\]\s*(.*?)(?=\[\d+\]|\Z)', text, re.DOTALL)
-        if numbered:
-            return [ref.strip() for ref in numbered if ref.strip()]
+        # Try numbered references [1], [2], etc.: the entries are what lies
+        # between markers (text before the first one isn't an entry)
+        numbered = _REF_MARKER_RE.split(text)
+        if len(numbered) > 1:
+            return [ref.strip() for ref in numbered[1:] if ref.strip()]
 
         # Try numbered without brackets: 1., 2., etc.
-        numbered_dots = re.split(r'\n\s*\d+\.\s+', text)
+        numbered_dots = _NUMBERED_DOTS_SPLIT_RE.split(text)
         if len(numbered_dots) > 5:
             return [ref.strip() for ref in numbered_dots if ref.strip()]
 
         # Try author-year style splits
-        author_year = re.split(r'\n\s*(?=[A-Z][a-z]+,\s+[A-Z])', text)
+        author_year = _AUTHOR_YEAR_SPLIT_RE.split(text)
         if len(author_year) > 5:
             return [ref.strip() for ref in author_year if ref.strip()]
 
@@ -142,9 +231,9 @@ class ReferenceParser:
                 continue
 
             # Start of new reference heuristic
-            if (re.match(r'^\[\d+\]', line) or
-                re.match(r'^\d+\.', line) or
-                (re.match(r'^[A-Z][a-z]+,', line) and current_ref)):
+            if (_LINE_REF_NUMBER_RE.match(line) or
+                _LINE_NUMBER_DOT_RE.match(line) or
+                (_LINE_AUTHOR_RE.match(line) and current_ref)):
 
                 if current_ref:
                     refs.append(' '.join(current_ref))
@@ -171,22 +260,49 @@ class ReferenceParser:
         if not text or len(text) < 10:
             return None
 
-        ref = ParsedReference(raw_text=text, ref_number=str(ref_num))
+        cached = self._parse_cache.get(text)
+        if cached is None:
+            cached = self._parse_reference_text(text)
+            self._parse_cache[text] = cached
+            if len(self._parse_cache) > self.PARSE_CACHE_SIZE:
+                self._parse_cache.popitem(last=False)
+        else:
+            self._parse_cache.move_to_end(text)
+
+        # A fresh copy each time, since callers fill in and enrich the result
+        ref = ParsedReference(*_REFERENCE_FIELDS(cached))
+        ref.ref_number = cached.ref_number or str(ref_num)
+        ref.authors = list(cached.authors)
+        ref.keywords = list(cached.keywords)
+        ref.parsing_notes = list(cached.parsing_notes)
+        return ref
+
+    def _parse_reference_text(self, text: str) -> ParsedReference:
+        """
+        Parse the fields of a reference entry
+
+        Args:
+            text: Reference text
+
+        Returns:
+            ParsedReference object; ref_number is "" unless the text starts with one
+        """
+        ref = ParsedReference(raw_text=text)
 
         # Extract reference number if present
-        num_match = re.match(r'^\[(\d+)\]', text)
+        num_match = _REF_NUMBER_RE.match(text)
         if num_match:
             ref.ref_number = num_match.group(1)
             text = text[num_match.end():].strip()
 
         # Extract DOI
-        doi_match = re.search(r'(?:doi:|DOI:)?\s*(10\.\d{4,}/[^\s]+)', text, re.IGNORECASE)
+        doi_match = _DOI_RE.search(text)
         if doi_match:
             ref.doi = doi_match.group(1).rstrip('.,;')
             ref.confidence += 0.15
 
         # Extract URL
-        url_match = re.search(r'(https?://[^\s]+)', text)
+        url_match = _URL_RE.search(text)
         if url_match:
             ref.url = url_match.group(1).rstrip('.,;')
             ref.confidence += 0.05
@@ -201,7 +317,7 @@ class ReferenceParser:
             ref.parsing_notes.append("No quoted title found")
 
         # Extract year
-        year_match = re.search(r'\b(19|20)\d{2}\b', text)
+        year_match = _YEAR_RE.search(text)
         if year_match:
             ref.year = year_match.group(0)
             ref.confidence += 0.15
@@ -242,9 +358,8 @@ class ReferenceParser:
 
     def _extract_quoted_text(self, text: str) -> str:
         """Extract text within quotes"""
-        for open_q, close_q in self.quote_pairs:
-            pattern = f'{re.escape(open_q)}([^{re.escape(close_q)}]+){re.escape(close_q)}'
-            match = re.search(pattern, text)
+        for pattern in self._quote_patterns:
+            match = pattern.search(text)
             if match:
                 return self._clean_field(match.group(1))
         return ""
@@ -260,18 +375,20 @@ class ReferenceParser:
         Returns:
             List of author names
         """
-        # Find text before title
+        # Find text before title (up to the first opening quote of the
+        # first quote style present)
         author_part = text
         if title:
-            for open_q, _ in self.quote_pairs:
-                if open_q in text:
-                    author_part = text.split(open_q)[0]
+            for open_q in self._open_quotes:
+                open_pos = text.find(open_q)
+                if open_pos != -1:
+                    author_part = text[:open_pos]
                     break
 
         author_part = author_part.strip(' ,:;')
 
         # Remove reference number
-        author_part = re.sub(r'^\[\d+\]\s*', '', author_part)
+        author_part = _LEADING_REF_NUMBER_RE.sub('', author_part)
 
         # Clean up
         author_part = self._clean_field(author_part)
@@ -282,9 +399,10 @@ class ReferenceParser:
         # Split by 'and' or commas
         authors = []
 
-        # Try "and" separator
-        if ' and ' in author_part.lower():
-            parts = re.split(r'\s+and\s+', author_part, flags=re.IGNORECASE)
+        # Try "and" separator (whitespace is already single spaces, so the
+        # split finds exactly the ' and 's a substring test would)
+        parts = _AUTHOR_AND_RE.split(author_part)
+        if len(parts) > 1:
             authors = [self._clean_field(p) for p in parts if p.strip()]
         else:
             # Try comma separation (careful not to split middle names)
@@ -301,26 +419,24 @@ class ReferenceParser:
         """Extract journal/venue information"""
         info = {'journal': '', 'booktitle': '', 'publisher': ''}
 
-        # Find text after title
+        # Find text after title (past the last closing quote of the
+        # first quote style present)
         post_title = text
         if title:
-            for _, close_q in self.quote_pairs:
-                if close_q in text:
-                    close_pos = text.rfind(close_q)
-                    if close_pos != -1:
-                        post_title = text[close_pos + 1:].strip(' ,:;')
-                        break
+            for close_q in self._close_quotes:
+                close_pos = text.rfind(close_q)
+                if close_pos != -1:
+                    post_title = text[close_pos + 1:].strip(' ,:;')
+                    break
 
         # Remove year, volume, issue, pages to isolate venue
-        post_title = re.sub(r'\b(19|20)\d{2}\b', '', post_title)
-        post_title = re.sub(r'vol\.\s*\d+', '', post_title, flags=re.IGNORECASE)
-        post_title = re.sub(r'no\.\s*\d+', '', post_title, flags=re.IGNORECASE)
-        post_title = re.sub(r'pp\.\s*[\d\-]+', '', post_title, flags=re.IGNORECASE)
+        for pattern in _VENUE_NOISE_RES:
+            post_title = pattern.sub('', post_title)
         post_title = self._clean_field(post_title)
 
         # Detect if conference or journal
-        conf_keywords = ['conference', 'proc', 'proceedings', 'symposium', 'workshop', 'congress']
-        is_conf = any(kw in post_title.lower() for kw in conf_keywords)
+        post_title_lower = post_title.lower()
+        is_conf = any(map(post_title_lower.__contains__, _CONFERENCE_VENUE_KEYWORDS))
 
         if is_conf:
             info['booktitle'] = post_title
@@ -331,61 +447,37 @@ class ReferenceParser:
 
     def _determine_citation_type(self, text: str, journal_info: Dict[str, str]) -> str:
         """Determine BibTeX citation type"""
-        text_lower = text.lower()
-
         if journal_info.get('booktitle'):
             return 'inproceedings'
 
-        if any(kw in text_lower for kw in ['conference', 'proc', 'symposium', 'workshop']):
-            return 'inproceedings'
-
-        if any(kw in text_lower for kw in ['book', 'edition', 'isbn']):
-            return 'book'
-
-        if any(kw in text_lower for kw in ['thesis', 'dissertation']):
-            return 'phdthesis'
-
-        if 'technical report' in text_lower or 'tech. rep' in text_lower:
-            return 'techreport'
+        # One lowercase copy; map() keeps each keyword test in C
+        contains = text.lower().__contains__
+        for citation_type, keywords in _CITATION_TYPE_KEYWORDS:
+            if any(map(contains, keywords)):
+                return citation_type
 
         return 'article'
 
     def _extract_volume(self, text: str) -> str:
         """Extract volume number"""
-        patterns = [
-            r'vol\.\s*(\d+)',
-            r'volume\s+(\d+)',
-            r'\bv\.\s*(\d+)',
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _VOLUME_RES:
+            match = pattern.search(text)
             if match:
                 return match.group(1)
         return ""
 
     def _extract_issue(self, text: str) -> str:
         """Extract issue/number"""
-        patterns = [
-            r'no\.\s*(\d+)',
-            r'number\s+(\d+)',
-            r'issue\s+(\d+)',
-            r'\bn\.\s*(\d+)',
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _ISSUE_RES:
+            match = pattern.search(text)
             if match:
                 return match.group(1)
         return ""
 
     def _extract_pages(self, text: str) -> str:
         """Extract page numbers"""
-        patterns = [
-            r'pp\.\s*([\d\-]+)',
-            r'pages?\s+([\d\-]+)',
-            r',\s*([\d]+)\s*[-–—]\s*([\d]+)',
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _PAGES_RES:
+            match = pattern.search(text)
             if match:
                 if len(match.groups()) > 1:
                     return f"{match.group(1)}-{match.group(2)}"
@@ -394,10 +486,14 @@ class ReferenceParser:
 
     def _clean_field(self, text: str) -> str:
         """Clean a field value"""
-        # Remove trailing punctuation
-        text = re.sub(r'[.,;:]+$', '', text)
+        # Remove trailing punctuation (rstrip, unless a final newline lets the
+        # pattern's $ match just before it)
+        if text.endswith('\n'):
+            text = _TRAILING_PUNCT_RE.sub('', text)
+        else:
+            text = text.rstrip('.,;:')
         # Normalize whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = _WHITESPACE_RE.sub(' ', text)
         return text.strip()
 
     def _remove_duplicates(self, refs: List[ParsedReference]) -> List[ParsedReference]:
@@ -410,29 +506,90 @@ class ReferenceParser:
         Returns:
             Deduplicated list
         """
-        unique = []
+        # A duplicate needs (char + word similarity) / 2 > 0.85, and so a word
+        # Jaccard above 0.7. Prefix filtering: with words ordered rarest
+        # first, two word sets with Jaccard >= 0.7 always share a word from
+        # each other's first len - ceil(0.7 * len) + 1 words. Indexing kept
+        # titles by those words finds every title the full pairwise scan
+        # could match; candidates are then tried in the same (kept) order.
+
+        # Normalized once per reference rather than once per comparison
+        titles = [ref.title.lower().strip() for ref in refs]
+        word_sets = [set(title.split()) for title in titles]
+        frequency = Counter(word for words in word_sets for word in words)
+        rank = {word: i for i, word in enumerate(sorted(frequency, key=lambda w: (frequency[w], w)))}
+        prefixes = [
+            sorted(words, key=rank.__getitem__)[:len(words) - (7 * len(words) + 9) // 10 + 1]
+            for words in word_sets
+        ]
 
-        for ref in refs:
+        # stamp -> (ref, words, prefix, matcher). Stamps only grow, so the
+        # dict's insertion order is the kept order, and replacing a ref is
+        # a delete plus an append, both O(1)
+        kept = {}
+        index = {}  # prefix word -> stamps of kept refs
+        stamps = iter(range(len(refs)))
+
+        def keep(ref, title, words, prefix):
+            stamp = next(stamps)
+            # The matcher indexes this title once for all later comparisons
+            kept[stamp] = (ref, words, prefix, SequenceMatcher(None, b=title))
+            for word in prefix:
+                index.setdefault(word, set()).add(stamp)
+
+        for ref, title, words, prefix in zip(refs, titles, word_sets, prefixes):
             is_duplicate = False
-            for existing in unique:
-                similarity = self._calculate_similarity(ref.title, existing.title)
-                if similarity > 0.85:
+            candidates = set().union(*(index.get(word, ()) for word in prefix))
+            for stamp in sorted(candidates):
+                existing, existing_words, existing_prefix, matcher = kept[stamp]
+                if self._titles_match(title, words, matcher, existing_words, 0.85):
                     is_duplicate = True
                     # Keep the one with higher confidence
                     if ref.confidence > existing.confidence:
-                        unique.remove(existing)
-                        unique.append(ref)
+                        del kept[stamp]
+                        for word in existing_prefix:
+                            index[word].discard(stamp)
+                        keep(ref, title, words, prefix)
                     break
 
             if not is_duplicate:
-                unique.append(ref)
+                keep(ref, title, words, prefix)
 
+        unique = [entry[0] for entry in kept.values()]
         removed = len(refs) - len(unique)
         if removed > 0:
             self.logger.info(f"Removed {removed} duplicate references")
 
         return unique
 
+    def _titles_match(self, title: str, words: set, matcher: SequenceMatcher,
+                      other_words: set, threshold: float) -> bool:
+        """
+        Whether two normalized titles score above threshold in _calculate_similarity
+
+        The word similarity is cheap, so it comes first; the character ratio
+        is then bounded by real_quick_ratio and quick_ratio, and the full
+        ratio is only computed for pairs those bounds can't rule out.
+
+        Args:
+            title: First title, lowercased and stripped
+            words: Non-empty word set of title
+            matcher: SequenceMatcher with the other normalized title as its second sequence
+            other_words: Non-empty word set of the other title
+            threshold: Score the pair has to exceed
+
+        Returns:
+            True if the combined score is above threshold
+        """
+        # |a | b| = |a| + |b| - |a & b|, without building the union set
+        shared = len(words & other_words)
+        word_sim = shared / (len(words) + len(other_words) - shared)
+        matcher.set_seq1(title)
+        for char_sim in (matcher.real_quick_ratio, matcher.quick_ratio, matcher.ratio):
+            if (char_sim() + word_sim) / 2 <= threshold:
+                return False
+        return True
+
     def _calculate_similarity(self, str1: str, str2: str) -> float:
         """
         Calculate similarity between two strings
@@ -485,7 +642,7 @@ class ReferenceParser:
 
         if not ref.year:
             errors.append("Missing year")
-        elif not re.match(r'^(19|20)\d{2}$', ref.year):
+        elif not _VALID_YEAR_RE.match(ref.year):
             errors.append("Invalid year format")
 
         if ref.confidence < 0.3:
@@ -510,15 +667,8 @@ class ReferenceParser:
 
     def _count_by_type(self, refs: List[ParsedReference]) -> Dict[str, int]:
         """Count references by type"""
-        counts = {}
-        for ref in refs:
-            counts[ref.citation_type] = counts.get(ref.citation_type, 0) + 1
-        return counts
+        return dict(Counter(ref.citation_type for ref in refs))
 
     def _count_by_year(self, refs: List[ParsedReference]) -> Dict[str, int]:
         """Count references by year"""
-        counts = {}
-        for ref in refs:
-            if ref.year:
-                counts[ref.year] = counts.get(ref.year, 0) + 1
-        return counts
+        return dict(Counter(ref.year for ref in refs if ref.year))
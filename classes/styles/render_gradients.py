@@ -0,0 +1,56 @@
+"""
+Render the gradient images used by professional.qss
+
+The stylesheet draws these with border-image instead of qlineargradient,
+so Qt blits a pixmap rather than rasterising a gradient on every paint.
+Re-run after changing the colours:
+
+    python classes/styles/render_gradients.py
+"""
+
+from pathlib import Path
+from PySide6 import QtCore, QtGui
+
+STYLES_DIR = Path(__file__).parent
+
+NAV_START, NAV_END = "#667eea", "#764ba2"
+
+
+def _gradient(width: int, start: str, end: str) -> QtGui.QLinearGradient:
+    gradient = QtGui.QLinearGradient(0, 0, width, 0)
+    gradient.setColorAt(0, QtGui.QColor(start))
+    gradient.setColorAt(1, QtGui.QColor(end))
+    return gradient
+
+
+def _image(width: int, height: int) -> QtGui.QImage:
+    image = QtGui.QImage(width, height, QtGui.QImage.Format_ARGB32_Premultiplied)
+    image.fill(QtCore.Qt.transparent)
+    return image
+
+
+def render_nav(path: Path):
+    """Navigation bar: 70px tall strip with its 3px bottom highlight baked in"""
+    image = _image(256, 70)
+    painter = QtGui.QPainter(image)
+    painter.fillRect(0, 0, 256, 70, _gradient(256, NAV_START, NAV_END))
+    painter.fillRect(0, 67, 256, 3, QtGui.QColor(255, 255, 255, 26))
+    painter.end()
+    image.save(str(path))
+
+
+def render_progress_chunk(path: Path):
+    """Progress chunk: rounded caps that the stylesheet slices 15px in from each side"""
+    image = _image(64, 31)
+    painter = QtGui.QPainter(image)
+    painter.setRenderHint(QtGui.QPainter.Antialiasing)
+    painter.setPen(QtCore.Qt.NoPen)
+    painter.setBrush(_gradient(64, NAV_START, NAV_END))
+    painter.drawRoundedRect(QtCore.QRectF(0, 0, 64, 31), 15, 15)
+    painter.end()
+    image.save(str(path))
+
+
+if __name__ == "__main__":
+    render_nav(STYLES_DIR / "gradient_nav.png")
+    render_progress_chunk(STYLES_DIR / "gradient_progress.png")
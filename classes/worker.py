@@ -3,13 +3,16 @@ Worker Thread Pool Manager
 Enterprise-level concurrent processing with progress tracking
 """
 
+import functools
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 import time
 from PySide6 import QtCore
-from .pdf_processor import PDFProcessor
+from .pdf_processor import PDFProcessor, _POOL_CONTEXT
 from .reference_parser import ReferenceParser, ParsedReference
 from .exporter import ExportManager
 from .api_client import MetadataEnricher
@@ -18,6 +21,8 @@ from .database import DatabaseManager, Reference
 
 class ProcessingResult:
     """Result of processing a single PDF"""
+    __slots__ = ('pdf_path', 'success', 'references', 'error', 'processing_time', 'enriched')
+
     def __init__(self, pdf_path: Path):
         self.pdf_path = pdf_path
         self.success = False
@@ -31,16 +36,23 @@ class ExtractionWorker(QtCore.QObject):
     """
     Worker thread for extraction tasks
     Emits signals for progress updates and results
+
+    Log lines are batched into one log_messages signal: flushed when
+    LOG_FLUSH_INTERVAL_MS has passed, before slow steps (so the GUI shows
+    what is running) and before pdf_completed, finished and error.
     """
 
+    LOG_FLUSH_INTERVAL_MS = 250
+
     # Signals
     progress = QtCore.Signal(int, int, str)  # current, total, status
-    log_message = QtCore.Signal(str, str)  # level, message
+    log_messages = QtCore.Signal(list)  # [(level, message), ...]
     pdf_completed = QtCore.Signal(str, int, float)  # pdf_name, ref_count, time
     finished = QtCore.Signal(dict)  # summary statistics
     error = QtCore.Signal(str)  # error message
 
-    def __init__(self, pdf_paths: List[Path], output_dir: Path, config: Dict[str, Any]):
+    def __init__(self, pdf_paths: List[Path], output_dir: Path, config: Dict[str, Any],
+                 parser: Optional[ReferenceParser] = None):
         super().__init__()
         self.pdf_paths = pdf_paths
         self.output_dir = output_dir
@@ -52,52 +64,72 @@ class ExtractionWorker(QtCore.QObject):
             enable_ml=config.get('enable_ml_parsing', True),
             enable_ocr=config.get('enable_ocr', False)
         )
-        self.parser = ReferenceParser(style=config.get('citation_style', 'ieee'))
+        # A parser handed in by WorkerManager keeps its parse cache across runs
+        self.parser = parser or ReferenceParser(style=config.get('citation_style', 'ieee'))
         self.exporter = ExportManager()
         self.enricher = MetadataEnricher(
             enable_crossref=config.get('enable_crossref', True),
-            enable_doi=config.get('enable_doi_lookup', True)
+            enable_doi=config.get('enable_doi_lookup', True),
+            max_workers=config.get('max_workers', 4),
+            cache_dir=config.get('cache_dir'),
+            crossref_mailto=config.get('crossref_mailto', '')
         )
         self.db = DatabaseManager(config.get('db_path', 'data/references.db'))
 
         self._is_cancelled = False
+        self._log_buffer = []  # worker thread only
+        self._log_clock = QtCore.QElapsedTimer()
 
     def cancel(self):
         """Cancel the extraction process"""
         self._is_cancelled = True
-        self.log_message.emit('WARNING', 'Cancellation requested...')
+        # Called from the GUI thread, so bypass the worker's buffer
+        self.log_messages.emit([('WARNING', 'Cancellation requested...')])
+
+    def _log(self, level: str, message: str, flush: bool = False):
+        """
+        Queue a log line for the GUI
+
+        Args:
+            level: Log level name
+            message: Message text
+            flush: Send the batch now (e.g. before a slow step)
+        """
+        self._log_buffer.append((level, message))
+        if flush or self._log_clock.hasExpired(self.LOG_FLUSH_INTERVAL_MS):
+            self._flush_log()
+
+    def _flush_log(self):
+        """Emit the queued log lines as one log_messages signal"""
+        if self._log_buffer:
+            self.log_messages.emit(self._log_buffer)
+            self._log_buffer = []
+        self._log_clock.start()
 
     def run(self):
         """Main extraction process"""
         try:
-            self.log_message.emit('INFO', f'Starting extraction of {len(self.pdf_paths)} PDFs')
+            self._log_clock.start()
+            self._log('INFO', f'Starting extraction of {len(self.pdf_paths)} PDFs')
             start_time = time.time()
 
             results = []
             total_refs = 0
 
-            for idx, pdf_path in enumerate(self.pdf_paths, 1):
-                if self._is_cancelled:
-                    self.log_message.emit('WARNING', 'Extraction cancelled by user')
-                    break
-
-                # Update progress
-                self.progress.emit(idx, len(self.pdf_paths), f"Processing {pdf_path.name}")
-                self.log_message.emit('INFO', f'Processing: {pdf_path.name}')
-
-                # Process single PDF
-                result = self._process_pdf(pdf_path)
+            for result in self._iter_results():
                 results.append(result)
+                pdf_path = result.pdf_path
 
                 if result.success:
                     total_refs += len(result.references)
+                    self._flush_log()
                     self.pdf_completed.emit(
                         pdf_path.name,
                         len(result.references),
                         result.processing_time
                     )
                 else:
-                    self.log_message.emit('ERROR', f'Failed: {pdf_path.name} - {result.error}')
+                    self._log('ERROR', f'Failed: {pdf_path.name} - {result.error}')
 
             # Calculate statistics
             elapsed = time.time() - start_time
@@ -110,19 +142,79 @@ class ExtractionWorker(QtCore.QObject):
                 'avg_time_per_pdf': elapsed / len(self.pdf_paths) if self.pdf_paths else 0
             }
 
-            self.log_message.emit('INFO', f'Extraction complete: {total_refs} references from {stats["successful"]} PDFs')
+            self._log('INFO', f'Extraction complete: {total_refs} references from {stats["successful"]} PDFs')
+            self._flush_log()
             self.finished.emit(stats)
 
         except Exception as e:
             self.logger.exception(f'Worker error: {e}')
+            self._flush_log()
             self.error.emit(str(e))
+        finally:
+            self.db.close()
+
+    def _iter_results(self):
+        """
+        Process the PDFs, yielding a ProcessingResult as each one finishes
 
-    def _process_pdf(self, pdf_path: Path) -> ProcessingResult:
+        Reading and parsing are CPU-bound and independent per PDF, so with
+        more than one CPU they run in a process pool (results then arrive
+        in completion order); enrichment, database and export stay on this
+        thread. Stops early once cancelled.
+        """
+        total = len(self.pdf_paths)
+        max_workers = min(self.config.get('max_workers', 4), os.cpu_count() or 1, total)
+
+        if max_workers <= 1:
+            for idx, pdf_path in enumerate(self.pdf_paths, 1):
+                if self._is_cancelled:
+                    self._log('WARNING', 'Extraction cancelled by user')
+                    return
+
+                # Update progress
+                self.progress.emit(idx, total, f"Processing {pdf_path.name}")
+                self._log('INFO', f'Processing: {pdf_path.name}', flush=True)
+
+                # Process single PDF
+                yield self._process_pdf(pdf_path)
+            return
+
+        pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=_POOL_CONTEXT)
+        try:
+            futures = {
+                pool.submit(_extract_in_process, pdf_path,
+                            self.pdf_processor.enable_ml, self.pdf_processor.enable_ocr,
+                            self.parser.style): pdf_path
+                for pdf_path in self.pdf_paths
+            }
+            self._log('INFO', f'Processing {total} PDFs in {max_workers} processes')
+
+            for idx, future in enumerate(as_completed(futures), 1):
+                if self._is_cancelled:
+                    self._log('WARNING', 'Extraction cancelled by user')
+                    return
+
+                # as_completed hands over PDFs whose extraction already finished
+                pdf_path = futures[future]
+                self.progress.emit(idx, total, f"Processed {pdf_path.name}")
+                self._log('INFO', f'Processed: {pdf_path.name}', flush=True)
+                try:
+                    extracted = future.result()
+                except Exception as e:
+                    extracted = ([], str(e), 0.0)
+                yield self._process_pdf(pdf_path, extracted)
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _process_pdf(self, pdf_path: Path,
+                     extracted: Optional[Tuple[List[ParsedReference], str, float]] = None) -> ProcessingResult:
         """
         Process a single PDF file
 
         Args:
             pdf_path: Path to PDF file
+            extracted: (references, error, seconds) from _extract_in_process if
+                reading and parsing already ran in a pool process
 
         Returns:
             ProcessingResult object
@@ -131,41 +223,28 @@ class ExtractionWorker(QtCore.QObject):
         pdf_start = time.time()
 
         try:
-            # Validate PDF
-            is_valid, error = self.pdf_processor.validate_pdf(pdf_path)
-            if not is_valid:
+            if extracted is None:
+                # Validate PDF, extract references section (one open) and parse it
+                self._log('DEBUG', f'Extracting text from {pdf_path.name}')
+                parsed_refs, error = _extract_references(self.pdf_processor, self.parser, pdf_path)
+            else:
+                parsed_refs, error, seconds = extracted
+                pdf_start -= seconds  # count the time spent in the pool process
+            if error:
                 result.error = error
                 return result
 
-            # Extract references section
-            self.log_message.emit('DEBUG', f'Extracting text from {pdf_path.name}')
-            refs_text = self.pdf_processor.extract_references_section(pdf_path)
-
-            if not refs_text:
-                result.error = "No references section found"
-                return result
-
-            self.log_message.emit('DEBUG', f'Extracted {len(refs_text)} characters')
-
-            # Parse references
-            self.log_message.emit('DEBUG', 'Parsing references')
-            parsed_refs = self.parser.parse_references_section(refs_text)
-
-            if not parsed_refs:
-                result.error = "No references could be parsed"
-                return result
-
-            self.log_message.emit('INFO', f'Parsed {len(parsed_refs)} references')
+            self._log('INFO', f'Parsed {len(parsed_refs)} references')
 
             # Enrich metadata (if enabled)
             if self.config.get('enable_api_enrichment', False):
-                self.log_message.emit('DEBUG', 'Enriching metadata via APIs')
+                self._log('DEBUG', 'Enriching metadata via APIs', flush=True)
                 parsed_refs = self._enrich_references(parsed_refs)
                 result.enriched = True
 
             # Save to database
             if self.config.get('save_to_database', True):
-                self.log_message.emit('DEBUG', 'Saving to database')
+                self._log('DEBUG', 'Saving to database')
                 self._save_to_database(parsed_refs, pdf_path)
 
             # Export to file
@@ -183,40 +262,38 @@ class ExtractionWorker(QtCore.QObject):
 
     def _enrich_references(self, refs: List[ParsedReference]) -> List[ParsedReference]:
         """Enrich references with API metadata"""
-        enriched = []
-
-        for ref in refs:
-            try:
-                # Convert to dict for enrichment
-                ref_dict = {
-                    'title': ref.title,
-                    'doi': ref.doi,
-                    'authors': ref.authors,
-                    'year': ref.year
-                }
-
-                # Enrich
-                enriched_data = self.enricher.enrich_reference(ref_dict)
-
-                # Update reference with enriched data
-                if enriched_data.get('doi') and not ref.doi:
-                    ref.doi = enriched_data['doi']
-                if enriched_data.get('url') and not ref.url:
-                    ref.url = enriched_data['url']
-                if enriched_data.get('publisher') and not ref.publisher:
-                    ref.publisher = enriched_data['publisher']
-
-                enriched.append(ref)
-            except Exception as e:
-                self.logger.warning(f'Failed to enrich reference: {e}')
-                enriched.append(ref)
-
-        return enriched
+        # Convert to dicts and enrich them together: batch_enrich prefetches
+        # known DOIs in batched queries and runs the other lookups concurrently
+        ref_dicts = [
+            {
+                'title': ref.title,
+                'doi': ref.doi,
+                'authors': ref.authors,
+                'year': ref.year
+            }
+            for ref in refs
+        ]
+        try:
+            enriched_dicts = self.enricher.batch_enrich(ref_dicts)
+        except Exception as e:
+            self.logger.warning(f'Failed to enrich references: {e}')
+            return refs
+
+        # Update references with enriched data
+        for ref, enriched_data in zip(refs, enriched_dicts):
+            if enriched_data.get('doi') and not ref.doi:
+                ref.doi = enriched_data['doi']
+            if enriched_data.get('url') and not ref.url:
+                ref.url = enriched_data['url']
+            if enriched_data.get('publisher') and not ref.publisher:
+                ref.publisher = enriched_data['publisher']
+
+        return refs
 
     def _save_to_database(self, refs: List[ParsedReference], pdf_path: Path):
-        """Save references to database"""
-        for ref in refs:
-            db_ref = Reference(
+        """Save references to database (one transaction)"""
+        self.db.bulk_add_references([
+            Reference(
                 pdf_source=pdf_path.name,
                 ref_number=ref.ref_number,
                 authors=ref.get_author_string(),
@@ -233,7 +310,8 @@ class ExtractionWorker(QtCore.QObject):
                 citation_type=ref.citation_type,
                 confidence_score=ref.confidence
             )
-            self.db.add_reference(db_ref)
+            for ref in refs
+        ])
 
     def _export_references(self, refs: List[ParsedReference], pdf_path: Path):
         """Export references to configured formats"""
@@ -245,9 +323,9 @@ class ExtractionWorker(QtCore.QObject):
         success = self.exporter.export(refs, output_path, export_format)
 
         if success:
-            self.log_message.emit('INFO', f'Exported to: {output_path.name}')
+            self._log('INFO', f'Exported to: {output_path.name}')
         else:
-            self.log_message.emit('ERROR', f'Export failed: {output_path.name}')
+            self._log('ERROR', f'Export failed: {output_path.name}')
 
     def _get_extension(self, format: str) -> str:
         """Get file extension for format"""
@@ -260,6 +338,47 @@ class ExtractionWorker(QtCore.QObject):
         return extensions.get(format.lower(), 'bib')
 
 
+def _extract_references(pdf_processor: PDFProcessor, parser: ReferenceParser,
+                        pdf_path: Path) -> Tuple[List[ParsedReference], str]:
+    """
+    Read a PDF's references section and parse it
+
+    Args:
+        pdf_processor: Processor to read the PDF with
+        parser: Parser for the references section
+        pdf_path: Path to PDF file
+
+    Returns:
+        Tuple of (parsed references, error message); the error is "" on success
+    """
+    refs_text, error = pdf_processor.read_references(pdf_path)
+    if error:
+        return [], error
+
+    if not refs_text:
+        return [], "No references section found"
+
+    parsed_refs = parser.parse_references_section(refs_text)
+    if not parsed_refs:
+        return [], "No references could be parsed"
+
+    return parsed_refs, ""
+
+
+@functools.lru_cache(maxsize=None)
+def _process_tools(enable_ml: bool, enable_ocr: bool, style: str) -> Tuple[PDFProcessor, ReferenceParser]:
+    """Processor and parser of a pool process, kept so its parse cache spans the run's PDFs"""
+    return PDFProcessor(enable_ml=enable_ml, enable_ocr=enable_ocr), ReferenceParser(style=style)
+
+
+def _extract_in_process(pdf_path: Path, enable_ml: bool, enable_ocr: bool,
+                        style: str) -> Tuple[List[ParsedReference], str, float]:
+    """Pool worker: _extract_references with this process's processor and parser, timed"""
+    start = time.time()
+    parsed_refs, error = _extract_references(*_process_tools(enable_ml, enable_ocr, style), pdf_path)
+    return parsed_refs, error, time.time() - start
+
+
 class WorkerManager(QtCore.QObject):
     """
     Manages worker threads and task queue
@@ -270,6 +389,9 @@ class WorkerManager(QtCore.QObject):
         self.logger = logging.getLogger(__name__)
         self.current_worker: Optional[ExtractionWorker] = None
         self.current_thread: Optional[QtCore.QThread] = None
+        # Parsers by citation style, reused by every run so their parse
+        # caches last the session (pool processes keep their own per run)
+        self._parsers: Dict[str, ReferenceParser] = {}
 
     def start_extraction(self, pdf_paths: List[Path], output_dir: Path,
                          config: Dict[str, Any]) -> ExtractionWorker:
@@ -289,7 +411,11 @@ class WorkerManager(QtCore.QObject):
             return self.current_worker
 
         # Create worker and thread
-        self.current_worker = ExtractionWorker(pdf_paths, output_dir, config)
+        style = config.get('citation_style', 'ieee')
+        parser = self._parsers.get(style)
+        if parser is None:
+            parser = self._parsers[style] = ReferenceParser(style=style)
+        self.current_worker = ExtractionWorker(pdf_paths, output_dir, config, parser)
         self.current_thread = QtCore.QThread()
 
         # Move worker to thread
@@ -13,18 +13,35 @@ Features:
 - Comprehensive logging system
 """
 
+import os
 import sys
 import logging
 from pathlib import Path
-from PySide6 import QtWidgets
-from qt_material import apply_stylesheet
 
-# Add classes directory to path
-sys.path.insert(0, str(Path(__file__).parent))
+# Qt, qt_material and the application modules are imported inside main():
+# together they take a few hundred ms, which the splash screen now covers
 
-from classes.config import ConfigManager
-from classes.logger import LoggerManager
-from classes.gui import MainWindow
+SPLASH_SIZE = (420, 120)
+SPLASH_COLOR = "#667eea"
+
+
+def show_splash():
+    """
+    Show a plain splash screen while the rest of the application loads
+
+    Returns:
+        The visible QSplashScreen
+    """
+    from PySide6 import QtCore, QtGui, QtWidgets
+
+    pixmap = QtGui.QPixmap(*SPLASH_SIZE)
+    pixmap.fill(QtGui.QColor(SPLASH_COLOR))
+    splash = QtWidgets.QSplashScreen(pixmap)
+    splash.showMessage("IEEE Reference Extractor\nLoading...",
+                       QtCore.Qt.AlignCenter, QtCore.Qt.white)
+    splash.show()
+    QtWidgets.QApplication.processEvents()
+    return splash
 
 
 def setup_application():
@@ -34,10 +51,17 @@ def setup_application():
     Returns:
         tuple: (config_manager, logger_manager)
     """
-    # Create necessary directories
+    from classes.config import ConfigManager
+    from classes.logger import LoggerManager
+
+    # Create necessary directories; one listing of the working directory
+    # stands in for a mkdir attempt per directory once they all exist
     dirs = ['config', 'data', 'logs', 'cache', 'Output']
+    with os.scandir('.') as entries:
+        existing = {entry.name for entry in entries if entry.is_dir()}
     for dir_name in dirs:
-        Path(dir_name).mkdir(exist_ok=True)
+        if dir_name not in existing:
+            Path(dir_name).mkdir(exist_ok=True)
 
     # Initialize configuration
     config_manager = ConfigManager()
@@ -58,6 +82,19 @@ def setup_application():
     logger.info(f"Database path: {config.db_path}")
     logger.info(f"Log directory: {config.log_dir}")
 
+    return config_manager, logger_manager
+
+
+def setup_application_deferred(config_manager, logger_manager):
+    """
+    Setup steps the main window doesn't need, run once it is on screen
+
+    Args:
+        config_manager: ConfigManager from setup_application
+        logger_manager: LoggerManager from setup_application
+    """
+    logger = logger_manager.get_logger()
+
     # Validate configuration
     is_valid, errors = config_manager.validate()
     if not is_valid:
@@ -66,58 +103,116 @@ def setup_application():
             logger.warning(f"  - {error}")
 
     # Cleanup old logs
-    logger_manager.cleanup_old_logs(config.log_retention_days)
+    logger_manager.cleanup_old_logs(config_manager.config.log_retention_days)
 
-    return config_manager, logger_manager
+
+def apply_theme(app, theme: str, cache_dir: str) -> bool:
+    """
+    Apply a qt_material theme, reusing the stylesheet rendered on an earlier launch
+
+    The rendered QSS, the icons it points to and the palette's text colour
+    are kept in the cache directory per theme and qt_material version; only
+    a cold cache pays for the qt_material import and the template render.
+
+    Args:
+        app: QApplication to style
+        theme: Theme name without the .xml suffix
+        cache_dir: Directory for the rendered stylesheet and icons
+
+    Returns:
+        True if the cached stylesheet was used
+    """
+    from importlib import metadata, util
+    from PySide6 import QtCore, QtGui
+
+    cache_key = f"theme-{theme}-{metadata.version('qt-material')}"
+    qss_path = Path(cache_dir) / f"{cache_key}.qss"
+    text_color_path = Path(cache_dir) / f"{cache_key}.text"
+    icon_dir = Path(cache_dir).resolve() / cache_key
+
+    if qss_path.exists() and text_color_path.exists() and icon_dir.is_dir():
+        # Everything apply_stylesheet sets up besides the stylesheet itself
+        app.setStyle('Fusion')
+        palette = QtGui.QGuiApplication.palette()
+        palette.setColor(QtGui.QPalette.Text, QtGui.QColor(text_color_path.read_text(encoding='utf-8')))
+        QtGui.QGuiApplication.setPalette(palette)
+        fonts_dir = Path(util.find_spec('qt_material').origin).parent / 'fonts' / 'roboto'
+        for font in fonts_dir.glob('*.ttf'):
+            QtGui.QFontDatabase.addApplicationFont(str(font))
+        QtCore.QDir.addSearchPath('icon', str(icon_dir))
+        app.setStyleSheet(qss_path.read_text(encoding='utf-8'))
+        return True
+
+    from qt_material import apply_stylesheet
+    apply_stylesheet(app, theme=f'{theme}.xml', parent=str(icon_dir))
+    stylesheet = app.styleSheet()
+    if stylesheet:  # empty when the theme wasn't found
+        qss_path.write_text(stylesheet, encoding='utf-8')
+        text_color = QtGui.QGuiApplication.palette().color(QtGui.QPalette.Text)
+        text_color_path.write_text(text_color.name(QtGui.QColor.HexArgb), encoding='utf-8')
+    return False
+
+
+def _excepthook(exc_type, exc, tb):
+    """
+    Log an uncaught exception and report it in the running GUI, if there is one
+
+    Installed as sys.excepthook by main(), so it also sees exceptions raised
+    in Qt slots once the event loop is running.
+    """
+    if issubclass(exc_type, KeyboardInterrupt):
+        sys.__excepthook__(exc_type, exc, tb)
+        return
+
+    logging.getLogger("IEEE_Extractor").critical(f"Unexpected error: {exc}", exc_info=(exc_type, exc, tb))
+
+    from PySide6 import QtWidgets
+    if QtWidgets.QApplication.instance() is not None:
+        QtWidgets.QMessageBox.critical(None, "Unexpected Error",
+                                       f"An unexpected error occurred:\n{exc_type.__name__}: {exc}")
 
 
 def main():
     """
     Main application entry point
     """
-    try:
-        # Create Qt Application
-        app = QtWidgets.QApplication(sys.argv)
-        app.setApplicationName("IEEE Reference Extractor")
-        app.setApplicationVersion("3.0.0")
-        app.setOrganizationName("IEEE")
+    sys.excepthook = _excepthook
 
-        # Setup application
-        config_manager, logger_manager = setup_application()
+    from PySide6 import QtCore, QtWidgets
 
-        # Apply theme
-        theme = config_manager.config.theme
-        try:
-            apply_stylesheet(app, theme=f'{theme}.xml')
-            logger_manager.get_logger().info(f"Applied theme: {theme}")
-        except Exception as e:
-            logger_manager.get_logger().warning(f"Failed to apply theme: {e}")
+    # Create Qt Application
+    app = QtWidgets.QApplication(sys.argv)
+    app.setApplicationName("IEEE Reference Extractor")
+    app.setApplicationVersion("3.0.0")
+    app.setOrganizationName("IEEE")
 
-        # Create and show main window
-        window = MainWindow(config_manager, logger_manager)
-        window.show()
+    # Give feedback before the slow imports
+    splash = show_splash()
 
-        logger_manager.get_logger().info("Application started successfully")
-
-        # Run application
-        sys.exit(app.exec())
+    # Setup application
+    config_manager, logger_manager = setup_application()
 
+    # Apply theme
+    theme = config_manager.config.theme
+    try:
+        cached = apply_theme(app, theme, config_manager.config.cache_dir)
+        logger_manager.get_logger().info(f"Applied theme: {theme}" + (" (cached)" if cached else ""))
     except Exception as e:
-        logging.exception(f"Fatal error: {e}")
-
-        # Show error dialog if GUI is available
-        try:
-            error_dialog = QtWidgets.QMessageBox()
-            error_dialog.setIcon(QtWidgets.QMessageBox.Critical)
-            error_dialog.setWindowTitle("Fatal Error")
-            error_dialog.setText("A fatal error occurred:")
-            error_dialog.setInformativeText(str(e))
-            error_dialog.setDetailedText(f"Error type: {type(e).__name__}")
-            error_dialog.exec()
-        except:
-            pass
-
-        sys.exit(1)
+        logger_manager.get_logger().warning(f"Failed to apply theme: {e}")
+
+    # Create and show main window
+    from classes.gui import MainWindow
+    window = MainWindow(config_manager, logger_manager)
+    window.show()
+    splash.finish(window)
+
+    # Validation and log cleanup wait until the window has painted
+    QtCore.QTimer.singleShot(0, lambda: setup_application_deferred(config_manager, logger_manager))
+
+    logger_manager.get_logger().info("Application started successfully")
+
+    # Run application
+    sys.exit(app.exec())
 
 
 if __name__ == '__main__':
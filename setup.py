@@ -3,13 +3,45 @@
 Setup script for IEEE Reference Extractor - Enterprise Edition
 """
 
-from setuptools import setup, find_packages
+import subprocess
+import sys
+
+from setuptools import Command, setup, find_packages
 from pathlib import Path
 
 # Read README
 readme_path = Path(__file__).parent / "README.md"
 long_description = readme_path.read_text(encoding='utf-8') if readme_path.exists() else ""
 
+
+class FreezeCommand(Command):
+    """Build a standalone one-file launcher with Nuitka (pip install .[package])"""
+
+    description = "compile main.py into a standalone executable with Nuitka"
+    user_options = [
+        ("output-dir=", "o", "directory for the executable [default: dist]"),
+    ]
+
+    def initialize_options(self):
+        self.output_dir = None
+
+    def finalize_options(self):
+        if self.output_dir is None:
+            self.output_dir = "dist"
+
+    def run(self):
+        subprocess.check_call([
+            sys.executable, "-m", "nuitka",
+            "--standalone", "--onefile", "--lto=yes",
+            "--enable-plugin=pyside6",
+            "--include-package=classes",
+            "--include-package=fitz",
+            "--include-package-data=qt_material",
+            f"--output-dir={self.output_dir}",
+            "main.py",
+        ], cwd=Path(__file__).parent)
+
+
 setup(
     name="ieee-reference-extractor",
     version="3.0.0",
@@ -17,7 +49,9 @@ setup(
     description="Enterprise-level reference extraction from IEEE academic papers",
     long_description=long_description,
     long_description_content_type="text/markdown",
-    packages=find_packages(),
+    packages=find_packages(include=["classes", "classes.*"]),
+    py_modules=["main"],
+    package_data={"classes": ["styles/*.qss", "styles/*.svg", "styles/*.png"]},
     python_requires=">=3.9",
     install_requires=[
         "PySide6>=6.6.0",
@@ -37,6 +71,23 @@ setup(
             "numpy>=1.24.0",
             "pandas>=2.0.0",
         ],
+        "async": [
+            "aiohttp>=3.9.0",
+        ],
+        "cache": [
+            "requests-cache>=1.1.0",
+        ],
+        "speedups": [
+            "orjson>=3.9.0",
+            "ijson>=3.2.0",
+        ],
+        "package": [
+            "nuitka>=2.0",
+            "zstandard",
+        ],
+    },
+    cmdclass={
+        "freeze": FreezeCommand,
     },
     entry_points={
         "console_scripts": [